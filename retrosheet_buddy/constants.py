@@ -1,7 +1,75 @@
 """Constants and static dictionaries for the Retrosheet editor."""
 
+import sys
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+# Nothing in this module reads __doc__ or relies on assert, so it imports
+# unchanged under python -O/-OO. Keep validation as explicit checks.
+__all__ = (
+    "NAVIGATION_SHORTCUTS",
+    "HotkeyEntry",
+    "PITCH_ENTRIES",
+    "PITCH_SHORTCUTS",
+    "PITCH_HOTKEYS",
+    "PITCH_DESCRIPTIONS",
+    "PLAY_SHORTCUTS",
+    "HIT_TYPE_ENTRIES",
+    "HIT_TYPE_SHORTCUTS",
+    "HIT_TYPE_HOTKEYS",
+    "HIT_TYPE_DESCRIPTIONS",
+    "FIELDING_POSITION_SHORTCUTS",
+    "OUT_TYPE_ENTRIES",
+    "OUT_TYPE_SHORTCUTS",
+    "OUT_TYPE_HOTKEYS",
+    "OUT_TYPE_DESCRIPTIONS",
+    "PLAY_HOTKEYS",
+    "FIELDING_POSITION_HOTKEYS",
+    "MODIFIER_GROUP_TITLES",
+    "MODIFIER_GROUP_CODES",
+    "ModifierParam",
+    "MODIFIER_PARAM_TEMPLATES",
+    "PLAY_DESCRIPTIONS",
+    "FIELDING_POSITION_DESCRIPTIONS",
+    "DETAIL_MODE_SHORTCUTS",
+    "DETAIL_TRIGGER_RESULTS",
+    "OUT_RESULTS",
+    "HIT_RESULTS",
+    "PICKOFF_RESULTS",
+    "RUNNER_ADVANCE_RESULTS",
+    "NAV_KEYS",
+    "PITCH_KEYS",
+    "PLAY_KEYS",
+    "DETAIL_KEYS",
+    "MODIFIER_GROUP_TITLES_ORDERED",
+    "ascii_lookup",
+    "HotkeyTables",
+    "PITCH_HOTKEYS_ORDERED",
+    "PLAY_HOTKEYS_ORDERED",
+    "HIT_TYPE_HOTKEYS_ORDERED",
+    "FIELDING_POSITION_HOTKEYS_ORDERED",
+    "OUT_TYPE_HOTKEYS_ORDERED",
+    "PITCH_HOTKEY_TABLE",
+    "PLAY_HOTKEY_TABLE",
+    "HIT_TYPE_HOTKEY_TABLE",
+    "OUT_TYPE_HOTKEY_TABLE",
+    "MODIFIER_DESCRIPTIONS",
+    "MODIFIER_GROUP_OPTIONS",
+    "MODIFIER_KEYMAPS",
+)
+
 # Navigation shortcuts (work in all modes)
-NAVIGATION_SHORTCUTS = {
+NAVIGATION_SHORTCUTS: Mapping[str, str] = {
     "q": "Quit",
     "left": "Previous play",
     "right": "Next play",
@@ -14,30 +82,53 @@ NAVIGATION_SHORTCUTS = {
     "\n": "Enter key",
 }
 
-# Mode shortcuts for validation
-PITCH_SHORTCUTS = {
-    "b": "Ball",
-    "s": "Swinging strike",
-    "f": "Foul",
-    "c": "Called strike",
-    "t": "Foul tip",
-    "m": "Missed bunt",
-    "p": "Pitchout",
-    "i": "Intentional ball",
-    "h": "Hit batter",
-    "v": "Wild pitch",
-    "a": "Passed ball",
-    "*": "Swinging on pitchout",
-    "r": "Foul on pitchout",
-    "e": "Foul bunt",
-    "n": "No pitch",
-    "o": "Foul on bunt",
-    "k": "Pick off attempt",
-    ".": "Ball in play (append X & switch)",
-    "u": "Unknown",
-}
 
-PLAY_SHORTCUTS = {
+class HotkeyEntry(NamedTuple):
+    """A single-key hotkey with its Retrosheet code and descriptions."""
+
+    key: str  # key pressed by the user
+    code: str  # Retrosheet code the key produces
+    short: str  # shortcut description (used for validation messages)
+    long: str  # description shown in the controls panel
+
+
+def _intern_entries(entries: Tuple[HotkeyEntry, ...]) -> Tuple[HotkeyEntry, ...]:
+    """Return ``entries`` with every string field interned."""
+    return tuple(HotkeyEntry(*map(sys.intern, entry)) for entry in entries)
+
+
+# Pitch events (no conflicts).
+# This tuple determines the order that the pitch events are displayed in the controls panel.
+PITCH_ENTRIES = _intern_entries(
+    (
+        HotkeyEntry("b", "B", "Ball", "Ball"),
+        HotkeyEntry("s", "S", "Swinging strike", "Swinging Strike"),
+        HotkeyEntry("f", "F", "Foul", "Foul"),
+        HotkeyEntry("c", "C", "Called strike", "Called Strike"),
+        HotkeyEntry("t", "T", "Foul tip", "Foul tip"),
+        HotkeyEntry("m", "M", "Missed bunt", "Missed bunt"),
+        HotkeyEntry("p", "P", "Pitchout", "Pitchout"),
+        HotkeyEntry("i", "I", "Intentional ball", "Intentional ball"),
+        HotkeyEntry("h", "H", "Hit batter", "Hit batter"),
+        HotkeyEntry("v", "V", "Wild pitch", "Wild pitch"),
+        HotkeyEntry("a", "A", "Passed ball", "Passed ball"),
+        HotkeyEntry("*", "Q", "Swinging on pitchout", "Swinging on pitchout"),
+        HotkeyEntry("r", "R", "Foul on pitchout", "Foul on pitchout"),
+        HotkeyEntry("e", "E", "Foul bunt", "Foul bunt"),
+        HotkeyEntry("n", "N", "No pitch", "No pitch"),
+        HotkeyEntry("o", "O", "Foul on bunt", "Foul on bunt"),
+        HotkeyEntry("k", "PK", "Pick off attempt", "Pick off attempt"),
+        HotkeyEntry(".", "X", "Ball in play (append X & switch)", "Ball in play"),
+        HotkeyEntry("u", "U", "Unknown", "Unknown"),
+    )
+)
+PITCH_SHORTCUTS: Mapping[str, str] = {e.key: e.short for e in PITCH_ENTRIES}
+PITCH_HOTKEYS: Mapping[str, str] = {e.key: e.code for e in PITCH_ENTRIES}
+PITCH_DESCRIPTIONS: Mapping[str, str] = {e.code: e.long for e in PITCH_ENTRIES}
+
+
+# Mode shortcuts for validation
+PLAY_SHORTCUTS: Mapping[str, str] = {
     "w": "Out",
     "1": "Single",
     "2": "Double",
@@ -55,15 +146,23 @@ PLAY_SHORTCUTS = {
 }
 
 # Detail mode shortcuts (only active in detail mode)
-HIT_TYPE_SHORTCUTS = {
-    "g": "Grounder",
-    "l": "Line drive",
-    "f": "Fly ball",
-    "p": "Pop up",
-    "b": "Bunt",
-}
+# Hit types
+HIT_TYPE_ENTRIES = _intern_entries(
+    (
+        HotkeyEntry("g", "G", "Grounder", "Grounder"),
+        HotkeyEntry("l", "L", "Line drive", "Line drive"),
+        HotkeyEntry("f", "F", "Fly ball", "Fly ball"),
+        HotkeyEntry("p", "P", "Pop up", "Pop up"),
+        HotkeyEntry("b", "B", "Bunt", "Bunt"),
+    )
+)
+HIT_TYPE_SHORTCUTS: Mapping[str, str] = {e.key: e.short for e in HIT_TYPE_ENTRIES}
+HIT_TYPE_HOTKEYS: Mapping[str, str] = {e.key: e.code for e in HIT_TYPE_ENTRIES}
+HIT_TYPE_DESCRIPTIONS: Mapping[str, str] = {e.code: e.long for e in HIT_TYPE_ENTRIES}
+
 
-FIELDING_POSITION_SHORTCUTS = {
+# Fielding positions in detail mode
+FIELDING_POSITION_SHORTCUTS: Mapping[str, str] = {
     "1": "Pitcher",
     "2": "Catcher",
     "3": "First base",
@@ -75,52 +174,37 @@ FIELDING_POSITION_SHORTCUTS = {
     "9": "Right field",
 }
 
-OUT_TYPE_SHORTCUTS = {
-    "g": "Ground out",
-    "l": "Line out",
-    "f": "Fly out",
-    "p": "Pop out",
-    "b": "Bunt out",
-    "s": "Sacrifice fly",
-    "h": "Sacrifice hit/bunt",
-    "k": "Strikeout",
-    "c": "Fielder's choice",
-    "d": "Double play",
-    "w": "Grounded into double play",
-    "!": "Lined into double play",
-    "y": "Triple play",
-    "z": "Force out",
-    "[": "Unassisted out",
-}
+# Out types in detail mode
+OUT_TYPE_ENTRIES = _intern_entries(
+    (
+        HotkeyEntry("g", "G", "Ground out", "Ground out"),
+        HotkeyEntry("l", "L", "Line out", "Line out"),
+        HotkeyEntry("f", "F", "Fly out", "Fly out"),
+        HotkeyEntry("p", "P", "Pop out", "Pop out"),
+        HotkeyEntry("b", "B", "Bunt out", "Bunt out"),
+        HotkeyEntry("s", "SF", "Sacrifice fly", "Sacrifice fly"),
+        HotkeyEntry("h", "SH", "Sacrifice hit/bunt", "Sacrifice hit/bunt"),
+        HotkeyEntry("k", "K", "Strikeout", "Strikeout"),
+        HotkeyEntry("c", "FC", "Fielder's choice", "Fielder's choice"),
+        HotkeyEntry("d", "DP", "Double play", "Double play"),
+        HotkeyEntry(
+            "w", "GDP", "Grounded into double play", "Grounded into double play"
+        ),
+        HotkeyEntry("!", "LDP", "Lined into double play", "Lined into double play"),
+        HotkeyEntry("y", "TP", "Triple play", "Triple play"),
+        HotkeyEntry("z", "FO", "Force out", "Force out"),
+        HotkeyEntry("[", "UO", "Unassisted out", "Unassisted out"),
+    )
+)
+OUT_TYPE_SHORTCUTS: Mapping[str, str] = {e.key: e.short for e in OUT_TYPE_ENTRIES}
+OUT_TYPE_HOTKEYS: Mapping[str, str] = {e.key: e.code for e in OUT_TYPE_ENTRIES}
+OUT_TYPE_DESCRIPTIONS: Mapping[str, str] = {e.code: e.long for e in OUT_TYPE_ENTRIES}
 
-# Hotkey mappings for pitch events (no conflicts).
-# This dictionary determines the order that the pitch events are displayed in the controls panel.
-PITCH_HOTKEYS = {
-    "b": "B",  # Ball
-    "s": "S",  # Swinging strike
-    "f": "F",  # Foul
-    "c": "C",  # Called strike
-    "t": "T",  # Foul tip
-    "m": "M",  # Missed bunt
-    "p": "P",  # Pitchout
-    "i": "I",  # Intentional ball
-    "h": "H",  # Hit batter
-    "v": "V",  # Wild pitch
-    "a": "A",  # Passed ball
-    "*": "Q",  # Swinging on pitchout
-    "r": "R",  # Foul on pitchout
-    "e": "E",  # Foul bunt
-    "n": "N",  # No pitch
-    "o": "O",  # Foul on bunt
-    "k": "PK",  # Pick off attempt
-    ".": "X",  # Ball in play: append X and switch to play mode
-    "u": "U",  # Unknown
-}
 
 # Hotkey mappings for play results (consolidated to avoid duplication)
 # Out-related results are selected via the Out Type wizard after choosing OUT
 # This dictionary determines the order that the play results are displayed in the controls panel.
-PLAY_HOTKEYS = {
+PLAY_HOTKEYS: Mapping[str, str] = {
     "o": "OUT",  # Out
     "1": "S",  # Single
     "2": "D",  # Double
@@ -145,17 +229,8 @@ PLAY_HOTKEYS = {
     "k": "SH",  # Sacrifice hit/bunt
 }
 
-# Hotkey mappings for hit types in detail mode
-HIT_TYPE_HOTKEYS = {
-    "g": "G",  # Grounder
-    "l": "L",  # Line drive
-    "f": "F",  # Fly ball
-    "p": "P",  # Pop up
-    "b": "B",  # Bunt
-}
-
 # Hotkey mappings for fielding positions in detail mode
-FIELDING_POSITION_HOTKEYS = {
+FIELDING_POSITION_HOTKEYS: Mapping[str, int] = {
     "1": 1,  # Pitcher
     "2": 2,  # Catcher
     "3": 3,  # First base
@@ -167,128 +242,58 @@ FIELDING_POSITION_HOTKEYS = {
     "9": 9,  # Right field
 }
 
-# Hotkey mappings for out types in detail mode
-OUT_TYPE_HOTKEYS = {
-    "g": "G",  # Ground out
-    "l": "L",  # Line out
-    "f": "F",  # Fly out
-    "p": "P",  # Pop out
-    "b": "B",  # Bunt out
-    "s": "SF",  # Sacrifice fly
-    "h": "SH",  # Sacrifice hit/bunt
-    "k": "K",  # Strikeout
-    "c": "FC",  # Fielder's choice
-    "d": "DP",  # Double play (generic)
-    "w": "GDP",  # Grounded into double play
-    "!": "LDP",  # Lined into double play
-    "y": "TP",  # Triple play
-    "z": "FO",  # Force out
-    "[": "UO",  # Unassisted out
-}
 
-# Modifier descriptions for play details
-MODIFIER_DESCRIPTIONS = {
-    # Bunt-related
-    "BP": "Bunt pop up",
-    "BG": "Ground ball bunt",
-    "BGDP": "Bunt grounded into double play",
-    "BL": "Line drive bunt",
-    "BPDP": "Bunt popped into double play",
-    "SH": "Sacrifice hit (bunt)",
-    # Ball type / plays
-    "G": "Ground ball",
-    "L": "Line drive",
-    "F": "Fly ball",
-    "P": "Pop fly",
-    "FL": "Foul",
-    "IF": "Infield fly rule",
-    "DP": "Unspecified double play",
-    "TP": "Unspecified triple play",
-    "GDP": "Ground ball double play",
-    "GTP": "Ground ball triple play",
-    "LDP": "Lined into double play",
-    "LTP": "Lined into triple play",
-    "NDP": "No double play credited for this play",
-    "SF": "Sacrifice fly",
-    "FO": "Force out",
-    # Interference/obstruction
-    "BINT": "Batter interference",
-    "INT": "Interference",
-    "RINT": "Runner interference",
-    "UINT": "Umpire interference",
-    "OBS": "Obstruction (fielder obstructing a runner)",
-    "FINT": "Fan interference",
-    # Administrative / courtesy / reviews / misc
-    "AP": "Appeal play",
-    "C": "Called third strike",
-    "COUB": "Courtesy batter",
-    "COUF": "Courtesy fielder",
-    "COUR": "Courtesy runner",
-    "MREV": "Manager challenge of call on the field",
-    "UREV": "Umpire review of call on the field",
-    "BOOT": "Batting out of turn",
-    "IPHR": "Inside the park home run",
-    "PASS": "Runner passed another runner and was called out",
-    "BR": "Runner hit by batted ball",
-    "TH": "Throw",
-    "TH%": "Throw to base %",
-    "R$": "Relay throw from initial fielder to $",
-    "E$": "Error on $",
+# Modifier groups for organizing play details, stored as parallel tables with
+# identical key order: group key -> title, and group key -> modifier codes.
+# Note: '0' is reserved for "back" in modifier UI; use mnemonic letters for groups
+MODIFIER_GROUP_TITLES: Mapping[str, str] = {
+    "b": "Ball Types",
+    "s": "Sacrifices",
+    "u": "Bunt Types",  # 'u' for bUnt to avoid collision with Ball Types
+    "d": "DP/TP (Generic)",
+    "v": "DP/TP Variants",
+    "i": "Interference/Obstruction",
+    "a": "Administrative",
+    "c": "Courtesy",
+    "t": "Throws/Relays",
+    "e": "Errors",
+    "h": "Hit Location",
+    "r": "Advance Runner",
 }
 
-# Modifier groups for organizing play details
-MODIFIER_GROUPS = {
-    # Note: '0' is reserved for "back" in modifier UI; use mnemonic letters for groups
-    "b": ("Ball Types", ["G", "L", "F", "P", "FL", "IF"]),
-    "s": ("Sacrifices", ["SF", "SH"]),
-    "u": (
-        "Bunt Types",
-        ["BP", "BG", "BL"],
-    ),  # 'u' for bUnt to avoid collision with Ball Types
-    "d": ("DP/TP (Generic)", ["DP", "TP"]),
-    "v": (
-        "DP/TP Variants",
-        ["GDP", "GTP", "LDP", "LTP", "NDP", "BGDP", "BPDP"],
-    ),
-    "i": (
-        "Interference/Obstruction",
-        ["BINT", "INT", "RINT", "FINT", "UINT", "OBS"],
-    ),
-    "a": (
-        "Administrative",
-        ["AP", "BOOT", "C", "IPHR", "PASS", "BR", "MREV", "UREV"],
-    ),
-    "c": ("Courtesy", ["COUB", "COUF", "COUR"]),
-    "t": ("Throws/Relays", ["TH", "TH%", "R$"]),
-    "e": ("Errors", ["E$"]),
-    "h": ("Hit Location", []),
-    "r": ("Advance Runner", []),
+MODIFIER_GROUP_CODES: Mapping[str, Tuple[str, ...]] = {
+    "b": ("G", "L", "F", "P", "FL", "IF"),
+    "s": ("SF", "SH"),
+    "u": ("BP", "BG", "BL"),
+    "d": ("DP", "TP"),
+    "v": ("GDP", "GTP", "LDP", "LTP", "NDP", "BGDP", "BPDP"),
+    "i": ("BINT", "INT", "RINT", "FINT", "UINT", "OBS"),
+    "a": ("AP", "BOOT", "C", "IPHR", "PASS", "BR", "MREV", "UREV"),
+    "c": ("COUB", "COUF", "COUR"),
+    "t": ("TH", "TH%", "R$"),
+    "e": ("E$",),
+    "h": (),
+    "r": (),
 }
 
-# Description dictionaries for UI display
-PITCH_DESCRIPTIONS = {
-    "B": "Ball",
-    "S": "Swinging Strike",
-    "F": "Foul",
-    "C": "Called Strike",
-    "T": "Foul tip",
-    "M": "Missed bunt",
-    "P": "Pitchout",
-    "I": "Intentional ball",
-    "H": "Hit batter",
-    "V": "Wild pitch",
-    "A": "Passed ball",
-    "Q": "Swinging on pitchout",
-    "R": "Foul on pitchout",
-    "E": "Foul bunt",
-    "N": "No pitch",
-    "O": "Foul on bunt",
-    "PK": "Pick off attempt",
-    "X": "Ball in play",
-    "U": "Unknown",
+
+class ModifierParam(NamedTuple):
+    """How to resolve a parameterized modifier code such as E$ or TH%."""
+
+    template: str  # str.format template producing the resolved code
+    kind: str  # parameter requested from the user: 'fielder' or 'base'
+
+
+# Parameterized modifier codes; the placeholder is filled in by formatting the
+# template with the selected fielder (1-9) or base (1-4)
+MODIFIER_PARAM_TEMPLATES: Mapping[str, ModifierParam] = {
+    "TH%": ModifierParam("TH{}", "base"),
+    "R$": ModifierParam("R{}", "fielder"),
+    "E$": ModifierParam("E{}", "fielder"),
 }
 
-PLAY_DESCRIPTIONS = {
+# Description dictionaries for UI display
+PLAY_DESCRIPTIONS: Mapping[str, str] = {
     "S": "Single",
     "D": "Double",
     "T": "Triple",
@@ -323,47 +328,261 @@ PLAY_DESCRIPTIONS = {
     "SB": "Stolen base",
 }
 
-HIT_TYPE_DESCRIPTIONS = {
-    "G": "Grounder",
-    "L": "Line drive",
-    "F": "Fly ball",
-    "P": "Pop up",
-    "B": "Bunt",
-}
+# Indexed by fielding position (1-9); index 0 is unused
+FIELDING_POSITION_DESCRIPTIONS: Tuple[Optional[str], ...] = (
+    None,
+    "Pitcher",
+    "Catcher",
+    "First base",
+    "Second base",
+    "Third base",
+    "Shortstop",
+    "Left field",
+    "Center field",
+    "Right field",
+)
 
-FIELDING_POSITION_DESCRIPTIONS = {
-    1: "Pitcher",
-    2: "Catcher",
-    3: "First base",
-    4: "Second base",
-    5: "Third base",
-    6: "Shortstop",
-    7: "Left field",
-    8: "Center field",
-    9: "Right field",
-}
+# Combined detail mode shortcuts for validation. Hit type and out type keys
+# overlap (g/l/f/p/b) by design, so later tables win for those keys.
+_detail_mode_shortcuts: Dict[str, str] = dict(HIT_TYPE_SHORTCUTS)
+_detail_mode_shortcuts.update(FIELDING_POSITION_SHORTCUTS)
+_detail_mode_shortcuts.update(OUT_TYPE_SHORTCUTS)
+DETAIL_MODE_SHORTCUTS: Mapping[str, str] = _detail_mode_shortcuts
 
-OUT_TYPE_DESCRIPTIONS = {
-    "G": "Ground out",
-    "L": "Line out",
-    "F": "Fly out",
-    "P": "Pop out",
-    "B": "Bunt out",
-    "SF": "Sacrifice fly",
-    "SH": "Sacrifice hit/bunt",
-    "K": "Strikeout",
-    "FC": "Fielder's choice",
-    "DP": "Double play",
-    "GDP": "Grounded into double play",
-    "LDP": "Lined into double play",
-    "TP": "Triple play",
-    "FO": "Force out",
-    "UO": "Unassisted out",
-}
+# Play results that need a follow-up detail step before they are saved:
+# outs, hits and errors, pickoffs and caught stealing, base-running events,
+# and sacrifices (which need runner advances)
+DETAIL_TRIGGER_RESULTS = frozenset(
+    {"OUT", "S", "D", "T", "HR", "E", "PO", "POCS", "CS"}
+    | {"OA", "BK", "DI", "PB", "WP", "SB", "SF", "SH"}
+)
+# Result groups checked when saving from detail mode
+OUT_RESULTS = frozenset({"OUT", "GDP", "LDP", "TP", "FO", "UO"})
+HIT_RESULTS = frozenset({"S", "D", "T", "HR", "E"})
+PICKOFF_RESULTS = frozenset({"PO", "POCS", "CS"})
+RUNNER_ADVANCE_RESULTS = frozenset({"BK", "DI", "PB", "WP", "SB", "OA"})
+
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+def _intern_value(value: Any) -> Any:
+    """Intern a string, or each string in a tuple; other values pass through."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, tuple):
+        return tuple(_intern_value(v) for v in value)
+    return value
+
+
+def _intern_strings(table: Mapping[_K, _V]) -> Dict[_K, _V]:
+    """Return a copy of ``table`` with all string keys and values interned."""
+    return {_intern_value(k): _intern_value(v) for k, v in table.items()}
+
+
+# Intern hotkeys, codes, and descriptions so hot-path comparisons hit the
+# identity fast path in CPython's string compare, and so strings repeated
+# across tables (e.g. "Wild pitch") share a single object
+NAVIGATION_SHORTCUTS = _intern_strings(NAVIGATION_SHORTCUTS)
+PLAY_SHORTCUTS = _intern_strings(PLAY_SHORTCUTS)
+FIELDING_POSITION_SHORTCUTS = _intern_strings(FIELDING_POSITION_SHORTCUTS)
+DETAIL_MODE_SHORTCUTS = _intern_strings(DETAIL_MODE_SHORTCUTS)
+PITCH_HOTKEYS = _intern_strings(PITCH_HOTKEYS)
+PLAY_HOTKEYS = _intern_strings(PLAY_HOTKEYS)
+HIT_TYPE_HOTKEYS = _intern_strings(HIT_TYPE_HOTKEYS)
+FIELDING_POSITION_HOTKEYS = _intern_strings(FIELDING_POSITION_HOTKEYS)
+OUT_TYPE_HOTKEYS = _intern_strings(OUT_TYPE_HOTKEYS)
+PITCH_DESCRIPTIONS = _intern_strings(PITCH_DESCRIPTIONS)
+PLAY_DESCRIPTIONS = _intern_strings(PLAY_DESCRIPTIONS)
+HIT_TYPE_DESCRIPTIONS = _intern_strings(HIT_TYPE_DESCRIPTIONS)
+FIELDING_POSITION_DESCRIPTIONS = tuple(
+    sys.intern(d) if d is not None else None for d in FIELDING_POSITION_DESCRIPTIONS
+)
+OUT_TYPE_DESCRIPTIONS = _intern_strings(OUT_TYPE_DESCRIPTIONS)
+MODIFIER_GROUP_TITLES = _intern_strings(MODIFIER_GROUP_TITLES)
+MODIFIER_GROUP_CODES = _intern_strings(MODIFIER_GROUP_CODES)
+
+
+# Key sets for validation (membership tests only; use the dicts above for descriptions)
+NAV_KEYS = frozenset(NAVIGATION_SHORTCUTS)
+PITCH_KEYS = frozenset(PITCH_SHORTCUTS)
+PLAY_KEYS = frozenset(PLAY_SHORTCUTS)
+DETAIL_KEYS = frozenset(DETAIL_MODE_SHORTCUTS)
+
+# Display-ordered group titles for the modifier group list
+MODIFIER_GROUP_TITLES_ORDERED = tuple(MODIFIER_GROUP_TITLES.items())
+
+
+def ascii_lookup(table: Sequence[Optional[str]], key: str) -> Optional[str]:
+    """Look up a key press in an ASCII table; returns None for non-ASCII or named keys."""
+    if len(key) == 1:
+        index = ord(key)
+        if index < 128:
+            return table[index]
+    return None
+
+
+class HotkeyTables(NamedTuple):
+    """Lookup tables derived from a single hotkey -> code table."""
+
+    ordered: tuple  # (hotkey, code) pairs in display order
+    ascii_table: Tuple[Optional[str], ...]  # 128 entries indexed by ord(hotkey)
 
-# Combined detail mode shortcuts for validation
-DETAIL_MODE_SHORTCUTS = {
-    **HIT_TYPE_SHORTCUTS,
-    **FIELDING_POSITION_SHORTCUTS,
-    **OUT_TYPE_SHORTCUTS,
+
+def _derive_hotkey_tables(table: Mapping[str, Any]) -> HotkeyTables:
+    """Build every derived view of ``table`` in a single pass over its items."""
+    ordered = tuple(table.items())
+    ascii_entries: List[Optional[str]] = [None] * 128
+    for key, code in ordered:
+        if len(key) == 1 and ord(key) < 128:
+            ascii_entries[ord(key)] = code
+    return HotkeyTables(
+        ordered=ordered,
+        ascii_table=tuple(ascii_entries),
+    )
+
+
+_PITCH_TABLES = _derive_hotkey_tables(PITCH_HOTKEYS)
+_PLAY_TABLES = _derive_hotkey_tables(PLAY_HOTKEYS)
+_HIT_TYPE_TABLES = _derive_hotkey_tables(HIT_TYPE_HOTKEYS)
+_FIELDING_POSITION_TABLES = _derive_hotkey_tables(FIELDING_POSITION_HOTKEYS)
+_OUT_TYPE_TABLES = _derive_hotkey_tables(OUT_TYPE_HOTKEYS)
+
+# Display-ordered (hotkey, code) pairs; the controls panel iterates these
+# directly instead of building dict views on every redraw
+PITCH_HOTKEYS_ORDERED = _PITCH_TABLES.ordered
+PLAY_HOTKEYS_ORDERED = _PLAY_TABLES.ordered
+HIT_TYPE_HOTKEYS_ORDERED = _HIT_TYPE_TABLES.ordered
+FIELDING_POSITION_HOTKEYS_ORDERED = _FIELDING_POSITION_TABLES.ordered
+OUT_TYPE_HOTKEYS_ORDERED = _OUT_TYPE_TABLES.ordered
+
+# ASCII-indexed hotkey tables for per-keystroke dispatch
+PITCH_HOTKEY_TABLE = _PITCH_TABLES.ascii_table
+PLAY_HOTKEY_TABLE = _PLAY_TABLES.ascii_table
+HIT_TYPE_HOTKEY_TABLE = _HIT_TYPE_TABLES.ascii_table
+OUT_TYPE_HOTKEY_TABLE = _OUT_TYPE_TABLES.ascii_table
+
+# Freeze the static tables so they cannot be mutated after import
+NAVIGATION_SHORTCUTS = MappingProxyType(NAVIGATION_SHORTCUTS)
+PITCH_SHORTCUTS = MappingProxyType(PITCH_SHORTCUTS)
+PLAY_SHORTCUTS = MappingProxyType(PLAY_SHORTCUTS)
+HIT_TYPE_SHORTCUTS = MappingProxyType(HIT_TYPE_SHORTCUTS)
+FIELDING_POSITION_SHORTCUTS = MappingProxyType(FIELDING_POSITION_SHORTCUTS)
+OUT_TYPE_SHORTCUTS = MappingProxyType(OUT_TYPE_SHORTCUTS)
+PITCH_HOTKEYS = MappingProxyType(PITCH_HOTKEYS)
+PLAY_HOTKEYS = MappingProxyType(PLAY_HOTKEYS)
+HIT_TYPE_HOTKEYS = MappingProxyType(HIT_TYPE_HOTKEYS)
+FIELDING_POSITION_HOTKEYS = MappingProxyType(FIELDING_POSITION_HOTKEYS)
+OUT_TYPE_HOTKEYS = MappingProxyType(OUT_TYPE_HOTKEYS)
+MODIFIER_GROUP_TITLES = MappingProxyType(MODIFIER_GROUP_TITLES)
+MODIFIER_GROUP_CODES = MappingProxyType(MODIFIER_GROUP_CODES)
+MODIFIER_PARAM_TEMPLATES = MappingProxyType(MODIFIER_PARAM_TEMPLATES)
+PITCH_DESCRIPTIONS = MappingProxyType(PITCH_DESCRIPTIONS)
+PLAY_DESCRIPTIONS = MappingProxyType(PLAY_DESCRIPTIONS)
+HIT_TYPE_DESCRIPTIONS = MappingProxyType(HIT_TYPE_DESCRIPTIONS)
+OUT_TYPE_DESCRIPTIONS = MappingProxyType(OUT_TYPE_DESCRIPTIONS)
+DETAIL_MODE_SHORTCUTS = MappingProxyType(DETAIL_MODE_SHORTCUTS)
+
+
+# Lazily built modifier tables. These are only needed once the user opens the
+# additional-details UI, so they are constructed on first attribute access via
+# the module __getattr__ (PEP 562) and cached.
+def _build_modifier_descriptions() -> MappingProxyType:
+    """Build the modifier code -> description table."""
+    descriptions = {
+        # Bunt-related
+        "BP": "Bunt pop up",
+        "BG": "Ground ball bunt",
+        "BGDP": "Bunt grounded into double play",
+        "BL": "Line drive bunt",
+        "BPDP": "Bunt popped into double play",
+        "SH": "Sacrifice hit (bunt)",
+        # Ball type / plays
+        "G": "Ground ball",
+        "L": "Line drive",
+        "F": "Fly ball",
+        "P": "Pop fly",
+        "FL": "Foul",
+        "IF": "Infield fly rule",
+        "DP": "Unspecified double play",
+        "TP": "Unspecified triple play",
+        "GDP": "Ground ball double play",
+        "GTP": "Ground ball triple play",
+        "LDP": "Lined into double play",
+        "LTP": "Lined into triple play",
+        "NDP": "No double play credited for this play",
+        "SF": "Sacrifice fly",
+        "FO": "Force out",
+        # Interference/obstruction
+        "BINT": "Batter interference",
+        "INT": "Interference",
+        "RINT": "Runner interference",
+        "UINT": "Umpire interference",
+        "OBS": "Obstruction (fielder obstructing a runner)",
+        "FINT": "Fan interference",
+        # Administrative / courtesy / reviews / misc
+        "AP": "Appeal play",
+        "C": "Called third strike",
+        "COUB": "Courtesy batter",
+        "COUF": "Courtesy fielder",
+        "COUR": "Courtesy runner",
+        "MREV": "Manager challenge of call on the field",
+        "UREV": "Umpire review of call on the field",
+        "BOOT": "Batting out of turn",
+        "IPHR": "Inside the park home run",
+        "PASS": "Runner passed another runner and was called out",
+        "BR": "Runner hit by batted ball",
+        "TH": "Throw",
+        "TH%": "Throw to base %",
+        "R$": "Relay throw from initial fielder to $",
+        "E$": "Error on $",
+    }
+    return MappingProxyType(_intern_strings(descriptions))
+
+
+def _build_modifier_group_options() -> MappingProxyType:
+    """Build per-group (code, description) option pairs for the options panel."""
+    descriptions = _lazy("MODIFIER_DESCRIPTIONS")
+    return MappingProxyType(
+        {
+            group: tuple((code, descriptions.get(code, code)) for code in codes)
+            for group, codes in MODIFIER_GROUP_CODES.items()
+        }
+    )
+
+
+def _build_modifier_keymaps() -> MappingProxyType:
+    """Build per-group option keymaps (letter a, b, c, ... -> modifier code)."""
+    return MappingProxyType(
+        {
+            group: MappingProxyType(
+                {chr(ord("a") + index): code for index, code in enumerate(codes)}
+            )
+            for group, codes in MODIFIER_GROUP_CODES.items()
+        }
+    )
+
+
+_LAZY_BUILDERS = {
+    "MODIFIER_DESCRIPTIONS": _build_modifier_descriptions,
+    "MODIFIER_GROUP_OPTIONS": _build_modifier_group_options,
+    "MODIFIER_KEYMAPS": _build_modifier_keymaps,
 }
+
+
+def __getattr__(name: str) -> Any:
+    """Build and cache lazily constructed tables on first access."""
+    builder = _LAZY_BUILDERS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily built table from inside this module."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
@@ -1,39 +1,84 @@
 """Interactive editor for Retrosheet event files."""
 
+import os
 import platform
 import re
+import select
+import string
 import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import (
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import click
 from rich.console import Console
 from rich.layout import Layout
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from . import constants
 from .constants import (
+    DETAIL_KEYS,
     DETAIL_MODE_SHORTCUTS,
+    DETAIL_TRIGGER_RESULTS,
     FIELDING_POSITION_DESCRIPTIONS,
     FIELDING_POSITION_HOTKEYS,
+    FIELDING_POSITION_HOTKEYS_ORDERED,
+    HIT_RESULTS,
     HIT_TYPE_DESCRIPTIONS,
+    HIT_TYPE_HOTKEY_TABLE,
     HIT_TYPE_HOTKEYS,
-    MODIFIER_DESCRIPTIONS,
-    MODIFIER_GROUPS,
+    HIT_TYPE_HOTKEYS_ORDERED,
+    MODIFIER_GROUP_CODES,
+    MODIFIER_GROUP_TITLES,
+    MODIFIER_GROUP_TITLES_ORDERED,
+    MODIFIER_PARAM_TEMPLATES,
+    NAV_KEYS,
     NAVIGATION_SHORTCUTS,
+    OUT_RESULTS,
     OUT_TYPE_DESCRIPTIONS,
+    OUT_TYPE_HOTKEY_TABLE,
     OUT_TYPE_HOTKEYS,
+    OUT_TYPE_HOTKEYS_ORDERED,
+    PICKOFF_RESULTS,
     PITCH_DESCRIPTIONS,
+    PITCH_HOTKEY_TABLE,
     PITCH_HOTKEYS,
+    PITCH_HOTKEYS_ORDERED,
+    PITCH_KEYS,
     PITCH_SHORTCUTS,
     PLAY_DESCRIPTIONS,
+    PLAY_HOTKEY_TABLE,
     PLAY_HOTKEYS,
+    PLAY_HOTKEYS_ORDERED,
+    PLAY_KEYS,
     PLAY_SHORTCUTS,
+    RUNNER_ADVANCE_RESULTS,
+    ascii_lookup,
 )
 from .models import EventFile, Game, Play
 from .parser import parse_event_file
-from .writer import write_event_file
+from .writer import format_games
 
 
 def validate_shortcuts() -> None:
@@ -48,143 +93,590 @@ def validate_shortcuts() -> None:
     Raises:
         ValueError: If any conflicts are found between navigation and mode shortcuts.
     """
-    # Check for conflicts between navigation and mode shortcuts
-    conflicts: List[Tuple[str, str, str, str]] = []
-
-    # Check navigation vs pitch mode conflicts
-    for key in NAVIGATION_SHORTCUTS:
-        if key in PITCH_SHORTCUTS:
-            conflicts.append(
-                (
-                    key,
-                    NAVIGATION_SHORTCUTS[key],
-                    "navigation",
-                    f"pitch mode: {PITCH_SHORTCUTS[key]}",
-                )
-            )
+    # Common case: a single set intersection finds no overlap at all
+    conflict_keys = NAV_KEYS & (PITCH_KEYS | PLAY_KEYS | DETAIL_KEYS)
+    if not conflict_keys:
+        return
+
+    # Report each conflicting key once, against the first mode that uses it
+    mode_shortcuts = (
+        ("pitch mode", PITCH_KEYS, PITCH_SHORTCUTS),
+        ("play mode", PLAY_KEYS, PLAY_SHORTCUTS),
+        ("detail mode", DETAIL_KEYS, DETAIL_MODE_SHORTCUTS),
+    )
+    conflicts: Dict[str, str] = {}
+    for context, keys, shortcuts in mode_shortcuts:
+        for key in NAVIGATION_SHORTCUTS:
+            if key in conflict_keys and key in keys:
+                conflicts.setdefault(key, f"{context}: {shortcuts[key]}")
+
+    error_message = "CRITICAL: Navigation shortcut conflicts detected!\n\n"
+    for key, mode_action in conflicts.items():
+        error_message += f"  Key '{key}' conflicts:\n"
+        error_message += f"    - navigation: {NAVIGATION_SHORTCUTS[key]}\n"
+        error_message += f"    - {mode_action}\n\n"
+
+    error_message += "Navigation shortcuts must have exclusive access to their keys.\n"
+    error_message += "Please reassign conflicting mode shortcuts to different keys.\n"
+    error_message += "All conflicts must be resolved for proper editor functionality."
+
+    raise ValueError(error_message)
+
+
+# Arrow keys by the final byte of a Windows extended-key pair
+_WINDOWS_ARROW_KEYS = {b"H": "up", b"P": "down", b"K": "left", b"M": "right"}
+
+# Complete terminal escape sequences for the arrow keys, in both the normal
+# (CSI, "ESC [") and application cursor (SS3, "ESC O") forms
+_ESC_SEQUENCES = {
+    b"\x1b[A": "up",
+    b"\x1b[B": "down",
+    b"\x1b[C": "right",
+    b"\x1b[D": "left",
+    b"\x1bOA": "up",
+    b"\x1bOB": "down",
+    b"\x1bOC": "right",
+    b"\x1bOD": "left",
+}
+# Seconds to wait for the rest of an escape sequence split across reads
+_ESC_SEQUENCE_TIMEOUT = 0.05
+
+
+def _build_escape_trie(sequences: Mapping[bytes, str]) -> Dict[bytes, Optional[str]]:
+    """Map every prefix of ``sequences`` to its key, or None if it is partial."""
+    trie: Dict[bytes, Optional[str]] = {}
+    for sequence, key in sequences.items():
+        for end in range(1, len(sequence)):
+            trie.setdefault(sequence[:end], None)
+        trie[sequence] = key
+    return trie
+
+
+# Flattened prefix trie of _ESC_SEQUENCES, walked one byte at a time
+_ESC_TRIE = _build_escape_trie(_ESC_SEQUENCES)
+
+# Stolen base targets as bits of an int mask, in the order they are written
+_SB_TARGET_BITS = (("2", 1), ("3", 2), ("H", 4))
+# SB builder key -> target bit ('4' and 'h' both mean home)
+_SB_KEY_BITS = {"2": 1, "3": 2, "4": 4, "h": 4}
+
+
+def _stolen_base_tokens(mask: int) -> List[str]:
+    """Return the SB tokens selected in ``mask`` in base order (SB2, SB3, SBH)."""
+    return [f"SB{base}" for base, bit in _SB_TARGET_BITS if mask & bit]
+
+
+# Play result -> (format with the fielder as {p}, description without one).
+# A None format means the result never takes a fielder.
+_PLAY_DESCRIPTION_FORMATS = {
+    "S": ("S{p}/G", "S8/G6"),  # Single, default to center field
+    "D": ("D{p}/L", "D7/L7"),  # Double, default to left field
+    "T": ("T{p}/L", "T8/L8"),  # Triple, default to center field
+    "HR": (None, "HR/F7"),  # Home run over left field fence
+    "E": ("E{p}/G", "E6/G6"),  # Error, default to shortstop
+    "FC": ("FC{p}/G", "FC6/G6"),  # Fielder's choice
+    "DP": (None, "DP/G6"),  # Double play
+    "TP": (None, "TP/G6"),  # Triple play
+    "SF": ("SF{p}/F", "SF8/F8"),  # Sacrifice fly
+    "SH": ("SH{p}/G", "SH1/G1"),  # Sacrifice bunt
+    "OUT": ("G{p}", "G6"),  # Generic out
+    "GDP": ("G{p}/GDP/G{p}", "G6/GDP/G6"),  # Grounded into double play
+    "LDP": ("L{p}/LDP/L{p}", "L6/LDP/L6"),  # Lined into double play
+    "FO": ("G{p}/FO/G{p}", "G6/FO/G6"),  # Force out
+    "UO": ("G{p}/UO/G{p}", "G6/UO/G6"),  # Unassisted out
+}
+
+
+@lru_cache(maxsize=128)
+def _format_play_description(result: str, fielding_position: int = 0) -> str:
+    """Return the Retrosheet description for ``result`` and an optional fielder.
+
+    Results and fielders come from small fixed sets, so every combination is
+    formatted once and interned; later calls return the same string object.
+    """
+    entry = _PLAY_DESCRIPTION_FORMATS.get(result)
+    if entry is None:
+        # K, W, HP, IW, CI, OA, ND and unknown codes are written as-is
+        return sys.intern(result)
+    with_position, default = entry
+    if with_position is not None and fielding_position > 0:
+        return sys.intern(with_position.format(p=fielding_position))
+    return sys.intern(default)
+
+
+def _parse_count(count: str) -> Tuple[int, int]:
+    """Return (balls, strikes) from a count like "12"; 0-0 unless both are digits."""
+    if len(count) >= 2 and "0" <= count[0] <= "9" and "0" <= count[1] <= "9":
+        return ord(count[0]) - 48, ord(count[1]) - 48
+    return 0, 0
+
+
+# Display counts by (balls, strikes), capped at 3 balls and 2 strikes
+_COUNT_STRINGS = {
+    (balls, strikes): sys.intern(f"{balls}{strikes}")
+    for balls in range(4)
+    for strikes in range(3)
+}
+
+# Pitches that add a strike below two strikes (fouls included)
+_STRIKE_PITCHES = frozenset("SCTF")
+
+
+@lru_cache(maxsize=256)
+def _tally_pitches(pitches: str, balls: int = 0, strikes: int = 0) -> Tuple[int, int]:
+    """Return the uncapped (balls, strikes) after ``pitches`` from a starting count.
+
+    S, C and T (foul tip) always add a strike; F adds one only below two
+    strikes. Other pitch types (H, V, A, M, P, I, Q, R, E, N, O, U) don't
+    affect the count. Cached, since adding a pitch asks for the display
+    count, the raw count and the strikeout check of the same sequence.
+    """
+    balls += pitches.count("B")
+    if strikes >= 2 or "F" not in pitches:
+        # No foul can count, so the strikes are order-independent
+        return balls, strikes + (
+            pitches.count("S") + pitches.count("C") + pitches.count("T")
+        )
 
-    # Check navigation vs play mode conflicts
-    for key in NAVIGATION_SHORTCUTS:
-        if key in PLAY_SHORTCUTS:
-            conflicts.append(
-                (
-                    key,
-                    NAVIGATION_SHORTCUTS[key],
-                    "navigation",
-                    f"play mode: {PLAY_SHORTCUTS[key]}",
-                )
-            )
+    # Whether a foul counts depends on the strikes before it
+    for index, pitch in enumerate(pitches):
+        if strikes >= 2:
+            rest = pitches[index:]
+            strikes += rest.count("S") + rest.count("C") + rest.count("T")
+            break
+        if pitch in _STRIKE_PITCHES:
+            strikes += 1
+    return balls, strikes
+
+
+def _is_incomplete_play(play: Play) -> bool:
+    """Check if a play has incomplete information."""
+    # Unknown count, or no pitches or play description recorded yet
+    return (
+        play.count == "??"
+        or play.original_count == "??"
+        or not play.pitches
+        or not play.play_description
+    )
+
+
+# Static controls prompts, built once rather than per panel build
+_PRESS_ENTER_TO_SAVE = "Press [ENTER] to save\n"
+# Runner advance destination prompts by the base the runner starts from
+_DESTINATION_PROMPTS = {
+    "1": "Destination: [2] Second\n",
+    "2": "Destination: [3] Third\n",
+    "3": "Destination: [H or 4] Home\n",
+    "B": "Destination: [1] First  [2] Second  [3] Third  [H or 4] Home\n",
+}
+_OUT_AT_PROMPTS = {
+    "1": "Out at: [2] Second\n",
+    "2": "Out at: [3] Third\n",
+    "3": "Out at: [H or 4] Home\n",
+}
+# Advance-runner modifier prompts, which also offer holding the base
+_STAY_OR_ADVANCE_PROMPTS = {
+    "1": "Destination: [2] Second  [1] Stay (1-1)\n",
+    "2": "Destination: [3] Third  [2] Stay (2-2)\n",
+    "3": "Destination: [H or 4] Home  [3] Stay (3-3)\n",
+}
+
+# Leading result letters and the fielder digits before the first '/'
+_PRIMARY_FIELDER_RE = re.compile(r"^[A-Z]+(\d+)/")
+
+# Position digits by fielding position number (1-9)
+_DIGITS = "0123456789"
+
+
+def _fielder_sequence(fielders: Sequence[int]) -> str:
+    """Return fielding positions as a digit string, e.g. [6, 4, 3] -> "643"."""
+    return "".join([_DIGITS[fielder] for fielder in fielders])
+
+
+# Key and result groups tested on each key press
+_ENTER_KEYS = frozenset("\r\n")
+_OCCUPIED_BASE_KEYS = frozenset("123")
+_STEAL_BASE_KEYS = frozenset("234")
+_BASE_KEYS = frozenset("1234")
+_BATTER_KEYS = frozenset("bB")
+_OA_ACTION_KEYS = frozenset("-x")
+# Destination for each key, by the base the runner starts from
+_BATTER_DESTINATIONS = {"1": "1", "2": "2", "3": "3", "4": "H", "h": "H"}
+_RUNNER_DESTINATIONS = {
+    "1": {"1": "1", "2": "2"},
+    "2": {"2": "2", "3": "3"},
+    "3": {"3": "3", "4": "H", "h": "H"},
+}
+# One-base advances by (from base, key), and the runner tokens they record.
+# The from base is None until one is chosen, and such lookups simply miss.
+_NEXT_BASE_DESTINATIONS: Dict[Tuple[Optional[str], str], str] = {
+    ("1", "2"): "2",
+    ("2", "3"): "3",
+    ("3", "4"): "H",
+    ("3", "h"): "H",
+}
+_ADVANCE_TOKENS: Dict[Tuple[Optional[str], str], str] = {
+    (base, key): f"{base}-{dest}"
+    for (base, key), dest in _NEXT_BASE_DESTINATIONS.items()
+}
+_ADVANCE_TOKENS.update(
+    {("B", key): f"B-{dest}" for key, dest in _BATTER_DESTINATIONS.items()}
+)
+# Value filled into a modifier template, by parameter kind and key
+_MODIFIER_PARAM_VALUES = {
+    "fielder": FIELDING_POSITION_HOTKEYS,
+    "base": {key: key for key in _BASE_KEYS},
+}
+_SIMPLE_ADVANCE_RESULTS = frozenset({"BK", "DI", "PB", "WP"})
+_PB_WP_RESULTS = frozenset({"PB", "WP"})
+_PB_WP_PITCHES = frozenset("VA")
+_STEAL_RESULTS = frozenset({"POCS", "CS"})
+_SACRIFICE_RESULTS = frozenset({"SF", "SH"})
+# Results written as <result><fielder>/<hit type>
+_FIELDED_RESULTS = frozenset({"S", "D", "T", "E", "FC", "SF", "SH"})
+_OUT_TYPE_RESULTS = OUT_RESULTS - {"OUT"}
+_NON_DETAIL_MODES = frozenset({"pitch", "play"})
+# Position digits typed into the Hit Location builder
+_POSITION_DIGIT_KEYS = frozenset("123456789")
+# Hit locations that allow the M, L and F suffixes
+_MIDFIELD_POSITIONS = frozenset("46")
+_FOUL_LINE_POSITIONS = frozenset({"7", "9"})
+_FOUL_TERRITORY_POSITIONS = frozenset({"2", "3", "5", "7", "9", "23", "25"})
+
+
+def _get_key_windows() -> str:
+    """Get a single key press without requiring Enter (Windows console)."""
+    key = msvcrt.getch()
+    if key == b"\xe0":  # Extended key
+        key = msvcrt.getch()
+        arrow = _WINDOWS_ARROW_KEYS.get(key)
+        if arrow is not None:
+            return arrow
+    decoded_key = key.decode("utf-8", errors="ignore")
+    # Handle TAB key
+    if decoded_key == "\t":
+        return "tab"
+    return decoded_key.lower()
+
+
+def _wait_for_key_windows(timeout: Optional[float]) -> bool:
+    """Return True once a key press is waiting, or False after ``timeout`` seconds."""
+    if timeout is None:
+        return True
+    end = time.monotonic() + timeout
+    while not msvcrt.kbhit():
+        if time.monotonic() >= end:
+            return False
+        time.sleep(0.01)
+    return True
 
-    # Check navigation vs detail mode conflicts
-    for key in NAVIGATION_SHORTCUTS:
-        if key in DETAIL_MODE_SHORTCUTS:
-            conflicts.append(
-                (
-                    key,
-                    NAVIGATION_SHORTCUTS[key],
-                    "navigation",
-                    f"detail mode: {DETAIL_MODE_SHORTCUTS[key]}",
-                )
-            )
 
-    # Remove duplicate conflicts (same key appearing in multiple comparisons)
-    unique_conflicts = []
-    seen_keys = set()
-    for conflict in conflicts:
-        if conflict[0] not in seen_keys:
-            unique_conflicts.append(conflict)
-            seen_keys.add(conflict[0])
-
-    if unique_conflicts:
-        error_message = "CRITICAL: Navigation shortcut conflicts detected!\n\n"
-        for key, action1, context1, action2 in unique_conflicts:
-            error_message += f"  Key '{key}' conflicts:\n"
-            error_message += f"    - {context1}: {action1}\n"
-            error_message += f"    - {action2}\n\n"
-
-        error_message += (
-            "Navigation shortcuts must have exclusive access to their keys.\n"
-        )
-        error_message += (
-            "Please reassign conflicting mode shortcuts to different keys.\n"
-        )
-        error_message += (
-            "All conflicts must be resolved for proper editor functionality."
-        )
+def _fill_pending_input(
+    fd: int, pending: bytearray, size: int, wait: Optional[float] = None
+) -> bool:
+    """Append up to ``size`` bytes from ``fd`` to ``pending``.
 
-        raise ValueError(error_message)
+    With ``wait``, give up if nothing arrives within that many seconds.
+    """
+    if wait is not None and not select.select([fd], [], [], wait)[0]:
+        return False
+    data = os.read(fd, size)
+    pending.extend(data)
+    return bool(data)
 
 
-def get_key() -> str:
-    """Get a single key press without requiring Enter."""
-    if platform.system() == "Windows":
-        import msvcrt
+def _match_escape_sequence(buf: bytearray) -> Optional[Tuple[int, str]]:
+    """Match the escape sequence at the start of ``buf`` against _ESC_TRIE.
 
-        key = msvcrt.getch()
-        if key == b"\xe0":  # Extended key
-            key = msvcrt.getch()
-            if key == b"H":
-                return "up"
-            elif key == b"P":
-                return "down"
-            elif key == b"K":
-                return "left"
-            elif key == b"M":
-                return "right"
-        decoded_key = key.decode("utf-8", errors="ignore")
-        # Handle TAB key
-        if decoded_key == "\t":
-            return "tab"
-        return decoded_key.lower()
+    Returns ``(length, key)``, with key ``"\\x1b"`` for sequences that are not
+    arrow keys, or None if the sequence is still incomplete.
+    """
+    for end in range(1, len(buf) + 1):
+        prefix = bytes(buf[:end])
+        if prefix not in _ESC_TRIE:
+            break
+        key = _ESC_TRIE[prefix]
+        if key is not None:
+            return end, key
     else:
-        # Unix-like systems
-        import termios
-        import tty
+        return None
+
+    # Off the trie: consume the rest of the unrecognised sequence
+    if buf[1:2] == b"[":  # CSI: parameters, then a final byte
+        for index in range(2, len(buf)):
+            if 0x40 <= buf[index] <= 0x7E:
+                return index + 1, "\x1b"
+        return None
+    # SS3 has one final byte; otherwise ESC followed by an ordinary key (Alt+key)
+    return (3 if buf[1:2] == b"O" else 2), "\x1b"
+
+
+def _read_key_unix(pending: bytearray, size: int = 8) -> str:
+    """Read and decode one key press from a terminal already in raw mode.
+
+    Bytes read past the key stay in ``pending`` for the next call. Callers
+    that keep no buffer between calls pass ``size=1`` so that nothing past
+    the key is consumed.
+    """
+    fd = sys.stdin.fileno()
+    if not pending and not _fill_pending_input(fd, pending, size):
+        return ""
+
+    lead = pending[0]
+    if lead == 0x1B:  # Escape sequence
+        match = _match_escape_sequence(pending)
+        while match is None and _fill_pending_input(
+            fd, pending, size, _ESC_SEQUENCE_TIMEOUT
+        ):
+            match = _match_escape_sequence(pending)
+        # A lone ESC, or a sequence cut short, is returned as ESC
+        length, key = match or (len(pending), "\x1b")
+        del pending[:length]
+        return key
+
+    # Decode one UTF-8 character, reading its continuation bytes if needed
+    length = 1 if lead < 0xC0 else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+    while len(pending) < length and _fill_pending_input(fd, pending, size):
+        pass
+    ch = pending[:length].decode("utf-8", errors="ignore")
+    del pending[:length]
+
+    # Handle TAB key
+    if ch == "\t":
+        return "tab"
+
+    return ch.lower()
+
+
+def _get_key_unix() -> str:
+    """Get a single key press without requiring Enter (POSIX terminal)."""
+    session = _RawTerminal.active
+    if session is not None:
+        # The editor session already holds raw mode and buffers its input
+        return _read_key_unix(session.pending)
+
+    try:
+        # Save terminal settings
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
 
         try:
-            # Save terminal settings
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
+            # Set terminal to raw mode
+            tty.setraw(fd)
+            return _read_key_unix(bytearray(), 1)
+        finally:
+            # Restore terminal settings
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    except (termios.error, OSError):
+        # Fallback for non-TTY environments
+        return input().lower()
+
+
+def _wait_for_key_unix(timeout: Optional[float]) -> bool:
+    """Return True once a key press is waiting, or False after ``timeout`` seconds.
+
+    Without a raw terminal session get_key falls back to blocking reads, so
+    there is nothing to wait on and this returns True straight away.
+    """
+    session = _RawTerminal.active
+    if timeout is None or session is None or session.pending:
+        return True
+    return bool(select.select([sys.stdin.fileno()], [], [], timeout)[0])
 
-            try:
-                # Set terminal to raw mode
-                tty.setraw(sys.stdin.fileno())
-                ch = sys.stdin.read(1)
-
-                # Handle special keys
-                if ch == "\x1b":  # Escape sequence
-                    next_ch = sys.stdin.read(1)
-                    if next_ch == "[":
-                        third_ch = sys.stdin.read(1)
-                        if third_ch == "A":
-                            return "up"
-                        elif third_ch == "B":
-                            return "down"
-                        elif third_ch == "C":
-                            return "right"
-                        elif third_ch == "D":
-                            return "left"
-
-                # Handle TAB key
-                if ch == "\t":
-                    return "tab"
-
-                return ch.lower()
 
-            finally:
-                # Restore terminal settings
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+class _RawTerminal:
+    """Hold a POSIX terminal in raw input mode for a whole editor session.
+
+    Switching modes around every key press costs two syscalls per key and lets
+    keys typed between reads echo to the screen. Output post-processing stays
+    on so newlines printed by Rich still return the carriage. If stdin is not
+    a terminal this does nothing and get_key keeps its per-call fallback.
+    """
+
+    # Session currently holding raw mode, if any
+    active: Optional["_RawTerminal"] = None
+
+    def __init__(self) -> None:
+        self.fd: Optional[int] = None
+        self.old_settings: Optional[list] = None
+        # Bytes read from the terminal but not yet decoded into a key press
+        self.pending = bytearray()
+
+    def __enter__(self) -> "_RawTerminal":
+        try:
+            fd = sys.stdin.fileno()
+            self.old_settings = termios.tcgetattr(fd)
         except (termios.error, OSError):
-            # Fallback for non-TTY environments
-            return input().lower()
+            return self
+        self.fd = fd
+        self._set_raw()
+        _RawTerminal.active = self
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        fd, old_settings = self.fd, self.old_settings
+        if fd is None or old_settings is None:
+            return
+        _RawTerminal.active = None
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        self.fd = None
+
+    def _set_raw(self) -> None:
+        fd = self.fd
+        if fd is None:
+            return
+        tty.setraw(fd)
+        attrs = termios.tcgetattr(fd)
+        attrs[1] |= termios.OPOST
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """Temporarily restore the original (cooked) terminal settings."""
+        fd, old_settings = self.fd, self.old_settings
+        if fd is None or old_settings is None:
+            # Not holding raw mode, so there is nothing to suspend
+            yield
+            return
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        try:
+            yield
+        finally:
+            self._set_raw()
+
+
+def read_line() -> str:
+    """Read a line of input, leaving a held raw mode for its duration."""
+    session = _RawTerminal.active
+    if session is None:
+        return input()
+    with session.suspended():
+        return input()
+
+
+# Pick the key reader and session wrapper for this platform once, at import
+_terminal_session: Callable[[], ContextManager[object]]
+if platform.system() == "Windows":
+    import msvcrt
+
+    get_key = _get_key_windows
+    wait_for_key = _wait_for_key_windows
+    _terminal_session = nullcontext
+else:
+    import termios
+    import tty
+
+    get_key = _get_key_unix
+    wait_for_key = _wait_for_key_unix
+    _terminal_session = _RawTerminal
+
+
+def _pack_rows(entries: Sequence[str], available_width: int) -> str:
+    """Pack entries into indented rows no wider than ``available_width``.
+
+    Entries are separated by two spaces and each row ends with a newline.
+    """
+    rows = []
+    current_row: List[str] = []
+    current_row_width = 0
+
+    for entry in entries:
+        # Calculate width of this entry plus spacing
+        entry_width = len(entry)
+        spacing_width = 2 if current_row else 0  # 2 spaces between entries
+        total_entry_width = entry_width + spacing_width
+
+        # Check if this entry fits on the current row
+        if current_row_width + total_entry_width <= available_width:
+            current_row.append(entry)
+            current_row_width += total_entry_width
+        else:
+            # Current row is full, emit it and start a new row
+            if current_row:
+                rows.append("  " + "  ".join(current_row) + "\n")
+            current_row = [entry]
+            current_row_width = entry_width
+
+    # Emit the last row if it has content
+    if current_row:
+        rows.append("  " + "  ".join(current_row) + "\n")
+    return "".join(rows)
+
+
+class _TextParts:
+    """Collect styled text runs and build a rich Text in a single pass.
+
+    Supports the ``append(text, style)`` calls the controls helpers make on a
+    Text, so either can be passed to them. Adjacent runs with the same style
+    are merged, leaving one span per run instead of one per call. Newlines are
+    counted as text is added, so the line count needs no pass over the result.
+    """
+
+    __slots__ = ("_runs", "_newlines")
+
+    def __init__(self) -> None:
+        self._runs: List[Tuple[List[str], Optional[str]]] = []
+        self._newlines = 0
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the collected text, counting a trailing empty one."""
+        return self._newlines + 1
+
+    def append(self, text: str, style: Optional[str] = None) -> "_TextParts":
+        """Add a run of text, merging it into the previous run if styles match."""
+        self._newlines += text.count("\n")
+        runs = self._runs
+        if runs and runs[-1][1] == style:
+            runs[-1][0].append(text)
+        else:
+            runs.append(([text], style))
+        return self
+
+    def assemble(self) -> Text:
+        """Return the collected runs as a single Text."""
+        parts: List[Union[str, Tuple[str, str]]] = [
+            "".join(texts) if style is None else ("".join(texts), style)
+            for texts, style in self._runs
+        ]
+        return Text.assemble(*parts)
+
+
+# Helpers that render controls accept either a Text or a _TextParts buffer
+ControlsText = Union[Text, _TextParts]
+
+# Message and rich style shown on the header status line
+StatusLine = Tuple[str, str]
 
 
 class RetrosheetEditor:
     """Interactive editor for Retrosheet event files."""
 
-    def __init__(self, event_file: EventFile, output_dir: Path):
+    # Number of controls panels kept, least recently used dropped first
+    _CONTROLS_CACHE_SIZE = 64
+    # Number of undo states kept
+    _UNDO_LIMIT = 10
+    # Console lines the jump-to-play screen needs besides its table rows
+    # (title, header, borders, caption and prompt)
+    _JUMP_TABLE_CHROME = 9
+    # Seconds of quiet after an edit before dirty games are written out
+    _SAVE_DELAY = 0.2
+    # Seconds between repaints while a write runs, so its status shows promptly
+    _WRITE_POLL = 0.05
+    # Mode reached from each mode when TAB is pressed
+    _MODE_TRANSITIONS = {"pitch": "play", "play": "detail", "detail": "pitch"}
+
+    def __init__(
+        self,
+        event_file: EventFile,
+        output_dir: Path,
+        session_file: Optional[str] = None,
+    ):
         self.event_file = event_file
         self.output_dir = output_dir
+        # When set, every edited game is saved into this one file in
+        # output_dir instead of a file per game
+        self.session_file = session_file
         self.console = Console()
         self.current_game_index = 0
         self.current_play_index = 0
@@ -210,15 +702,15 @@ class RetrosheetEditor:
             []
         )  # Collected modifier codes to append (e.g., ["AP", "MREV"])
         self.modifier_param_request = None  # e.g., { 'code': 'E$', 'type': 'fielder' } or { 'code': 'TH%', 'type': 'base' }
-        self.current_modifier_options_keymap = (
-            {}
-        )  # map single-letter key -> modifier code for current group view
         self.modifiers_live_applied = (
             False  # If True, modifiers are applied immediately upon selection
         )
-        # Reference modifier groups and descriptions from constants
-        self.modifier_descriptions = MODIFIER_DESCRIPTIONS
-        self.modifier_groups = MODIFIER_GROUPS
+        # Reference modifier groups from constants; descriptions, options and
+        # keymaps are properties so they are only built once modifiers are used
+        self.modifier_group_titles = MODIFIER_GROUP_TITLES
+        self.modifier_group_titles_ordered = MODIFIER_GROUP_TITLES_ORDERED
+        self.modifier_group_codes = MODIFIER_GROUP_CODES
+        self.modifier_param_templates = MODIFIER_PARAM_TEMPLATES
 
         # Hit Location builder state (used within modifier selection UI)
         self.hit_location_active = False
@@ -232,22 +724,155 @@ class RetrosheetEditor:
         self.advance_runner_from_base = None  # '1','2','3' when selecting
         self.advance_runner_tokens = []  # tokens like '1-2', '2-H', '3-3'
 
+        # Stolen base builder: bits of _SB_TARGET_BITS toggled with 2/3/4/H
+        self.sb_mask = 0
+
         # Pickoff attempt wizard state
         self.pickoff_attempt_active = False
         self.pickoff_attempt_player = None  # 'pitcher' or 'catcher'
         self.pickoff_attempt_base = None  # '1', '2', or '3'
 
-        # Undo functionality
-        self.undo_history = (
-            []
-        )  # List of (game_index, play_index, pitches, play_description) tuples
+        # Pickoff result builder state (PO/POCS/CS in detail mode)
+        self.detail_pickoff_base = None  # '1','2','3' or 'H' for home
+        self.detail_pickoff_fielders = []  # list of ints 1-9
+        self.detail_pickoff_error_fielder = None  # int 1-9 if error (PO only)
+        self.detail_pickoff_awaiting_error_fielder = False
+
+        # Runner advancement builder state (BK/DI/PB/WP/OA in detail mode)
+        self.runner_tokens = []  # collected tokens like '1-2', '2X3(25)', 'SB2'
+        self.advance_from_base = None  # for BK/DI/PB/WP path
+        self.oa_stage = "choose_runner"
+        self.oa_from_base = None
+        self.oa_out = False
+        self.oa_dest = None
+        self.oa_fielders = []
+        # PB/WP entered from a V/A pitch, appended as a suffix to the result
+        self.detail_mode_from_pitch_pb_wp = False
+        self.detail_mode_pb_wp_code = None
+
+        # Undo functionality: (game_index, play_index, pitches, play_description)
+        # tuples; the deque drops the oldest entry once the limit is reached
+        self.undo_history: Deque[Tuple[int, int, str, str]] = deque(
+            maxlen=self._UNDO_LIMIT
+        )
 
         # Reference hotkey mappings from constants
         self.pitch_hotkeys = PITCH_HOTKEYS
         self.play_hotkeys = PLAY_HOTKEYS
+        self.pitch_hotkey_table = PITCH_HOTKEY_TABLE
+        self.play_hotkey_table = PLAY_HOTKEY_TABLE
+        self.hit_type_hotkey_table = HIT_TYPE_HOTKEY_TABLE
+        self.out_type_hotkey_table = OUT_TYPE_HOTKEY_TABLE
         self.hit_type_hotkeys = HIT_TYPE_HOTKEYS
         self.fielding_position_hotkeys = FIELDING_POSITION_HOTKEYS
         self.out_type_hotkeys = OUT_TYPE_HOTKEYS
+        # Display-ordered (hotkey, code) pairs for the controls panel
+        self.pitch_hotkeys_ordered = PITCH_HOTKEYS_ORDERED
+        self.play_hotkeys_ordered = PLAY_HOTKEYS_ORDERED
+        self.hit_type_hotkeys_ordered = HIT_TYPE_HOTKEYS_ORDERED
+        self.fielding_position_hotkeys_ordered = FIELDING_POSITION_HOTKEYS_ORDERED
+        self.out_type_hotkeys_ordered = OUT_TYPE_HOTKEYS_ORDERED
+
+        # Packed hotkey, navigation and modifier rows, keyed by source tables
+        # and width
+        self._hotkey_layout_cache: Dict[tuple, Tuple[object, object, str]] = {}
+        # Rendered controls panels keyed by _controls_state_key(), in LRU order
+        self._controls_cache: "OrderedDict[tuple, Panel]" = OrderedDict()
+        # Snapshot of what was last painted; _dirty forces the next repaint
+        # (set by actions that draw outside the layout, like jump-to-play)
+        self._last_screen_state: Optional[tuple] = None
+        self._dirty = True
+        # Incomplete-play flags per game, see _incomplete_mask
+        self._incomplete_masks: Dict[int, Tuple[Game, bytearray]] = {}
+        # Player name lookups per game, see _get_player_name
+        self._player_names: Dict[int, Tuple[Game, int, Dict[str, str]]] = {}
+        # Indices of games edited since the last save was queued, and the
+        # event text of every game edited this session by index. Only dirty
+        # games are re-formatted. Only the input loop touches these; the
+        # writer thread sees formatted text, never models.
+        self._dirty_games: Set[int] = set()
+        self._game_text: Dict[int, str] = {}
+        # Time at which the dirty games are formatted and queued, pushed back
+        # by every edit. Only the input loop touches it.
+        self._flush_deadline: Optional[float] = None
+        # A single writer thread, started on demand, writes _pending_writes
+        # (output path -> text) until it is empty; both guarded by _pending_lock
+        self._pending_lock = threading.Lock()
+        self._pending_writes: Dict[Path, str] = {}
+        self._writer: Optional[threading.Thread] = None
+        # Held while writing, so queued text reaches disk in order
+        self._flush_lock = threading.Lock()
+        # Nesting depth of _bulk_edit blocks; saves wait until it drops to 0
+        self._bulk_depth = 0
+        # Text last written for each output path; unchanged games are skipped
+        self._saved_text: Dict[Path, str] = {}
+        # Last message for the user (save outcomes, hints), shown in the
+        # header instead of printed over the live screen
+        self._status: Optional[StatusLine] = None
+        # Screen layout, reused across frames; each region is rebuilt only
+        # when the state it shows changes
+        self._layout = Layout()
+        self._layout.split_column(
+            Layout(name="padding", size=1),
+            Layout(name="header", size=3),
+            Layout(name="main", size=8),
+            Layout(name="controls", size=16),
+        )
+        self._header_cache: Optional[Tuple[Game, Optional[StatusLine], Panel]] = None
+        self._main_cache: Optional[Tuple[Game, tuple, Panel]] = None
+        # Full-screen live display, active only while run() is looping
+        self._live: Optional[Live] = None
+
+        # Navigation keys handled identically in every mode ('q' exits the loop)
+        self._global_dispatch = {
+            "left": self._previous_play,
+            "right": self._next_play,
+            "down": self._next_incomplete_play,
+            "tab": self._toggle_mode,
+            "x": self._undo_last_action,
+            "j": self._jump_to_play,
+            "-": self._clear_current,
+        }
+        # Detail mode key handlers by play result; others fall back to hits
+        self._detail_input_handlers: Dict[Optional[str], Callable[[str], None]] = {
+            **dict.fromkeys(OUT_RESULTS, self._handle_out_detail_input),
+            **dict.fromkeys(PICKOFF_RESULTS, self._handle_pickoff_detail_input),
+            **dict.fromkeys(
+                _SIMPLE_ADVANCE_RESULTS, self._handle_simple_advance_detail_input
+            ),
+            "SB": self._handle_stolen_base_detail_input,
+            "OA": self._handle_oa_detail_input,
+        }
+        # Run when a modifier group with its own builder is chosen
+        self._modifier_group_hooks = {
+            "h": self._start_hit_location_group,
+            "r": self._start_advance_runner_group,
+        }
+        # Run after a TAB transition, keyed by (old mode, new mode)
+        self._mode_hooks = {
+            ("play", "detail"): self._maybe_start_modifier_detail_mode,
+            ("detail", "pitch"): self._reset_detail_mode,
+        }
+
+    @property
+    def modifier_descriptions(self) -> Mapping[str, str]:
+        """Modifier code -> description, built on first access."""
+        descriptions: Mapping[str, str] = constants.MODIFIER_DESCRIPTIONS
+        return descriptions
+
+    @property
+    def modifier_group_options(self) -> Mapping[str, Tuple[Tuple[str, str], ...]]:
+        """Per-group (code, description) option pairs, built on first access."""
+        options: Mapping[str, Tuple[Tuple[str, str], ...]] = (
+            constants.MODIFIER_GROUP_OPTIONS
+        )
+        return options
+
+    @property
+    def modifier_keymaps(self) -> Mapping[str, Mapping[str, str]]:
+        """Option letter -> modifier code for each group, built on first access."""
+        keymaps: Mapping[str, Mapping[str, str]] = constants.MODIFIER_KEYMAPS
+        return keymaps
 
     def run(self) -> None:
         """Run the interactive editor."""
@@ -257,95 +882,77 @@ class RetrosheetEditor:
 
         self.console.clear()
 
+        # Hold raw terminal input for the whole session instead of per key, and
+        # draw frames on a full-screen live display
+        live = Live(console=self.console, screen=True, auto_refresh=False)
+        with _terminal_session(), live:
+            self._live = live
+            try:
+                self._event_loop()
+            finally:
+                self._live = None
+                self.flush_sync()
+        # The live screen is gone, so repeat the last status message
+        if self._status is not None:
+            message, style = self._status
+            self.console.print(message, style=style)
+
+    def _event_loop(self) -> None:
+        """Paint the interface and dispatch key presses until the user quits."""
         while True:
             try:
-                self._display_interface()
+                self._flush_if_due()
+                # Taken before the repaint, so a write that finishes after it
+                # still wakes the loop to show its status
+                timeout = self._key_wait_timeout()
+                # Resolve the current game once per key press, and repaint
+                # only if something visible changed since the last frame
+                current_game = self.event_file.games[self.current_game_index]
+                screen_state = self._screen_state(current_game)
+                if self._dirty or screen_state != self._last_screen_state:
+                    self._display_interface(current_game)
+                    self._last_screen_state = screen_state
+                    self._dirty = False
+                # Wake up for a due save or a finished write even without a key
+                if not wait_for_key(timeout):
+                    continue
                 key = get_key()
 
-                if key == "q":
-                    break
-                elif key == "left":
-                    self._previous_play()
-                elif key == "right":
-                    self._next_play()
-                elif key == "down":
-                    self._next_incomplete_play()
-                elif key == "tab":  # Switch between modes
-                    if self.mode == "pitch":
-                        self.mode = "play"
-                    elif self.mode == "play":
-                        # If current play already has a result, offer additional details
-                        current_game = self.event_file.games[self.current_game_index]
-                        if (
-                            current_game.plays
-                            and current_game.plays[
-                                self.current_play_index
-                            ].play_description
-                        ):
-                            self.mode = "detail"
-                            self._start_modifier_detail_mode()
+                # Edits made for one key press are saved together
+                with self._bulk_edit():
+                    if key == "q":
+                        break
+                    elif handler := self._global_dispatch.get(key):
+                        handler()
+                    elif self.pickoff_attempt_active:
+                        self._handle_pickoff_attempt_input(key)
+                    elif self.mode == "pitch" and (
+                        code := ascii_lookup(self.pitch_hotkey_table, key)
+                    ):
+                        if code == "X":
+                            # Ball in play shortcut: append 'X' to pitches and switch to play mode
+                            self._mark_ball_in_play_and_switch()
+                        else:
+                            self._add_pitch(code)
+                    elif self.mode == "play" and (
+                        result := ascii_lookup(self.play_hotkey_table, key)
+                    ):
+                        # Only certain results should enter detail mode
+                        if result in DETAIL_TRIGGER_RESULTS:
+                            # Generic out requires out-type/position details
+                            # Hits and errors require hit-type/position details
+                            # Sacrifice plays require fielding detail and then runner advances
+                            self._enter_detail_mode(result)
                         else:
-                            self.mode = "detail"
+                            # All other results should set immediately without entering detail mode
+                            self._set_play_result(result)
                     elif self.mode == "detail":
-                        self.mode = "pitch"  # Cycle back to pitch mode
-                        self._reset_detail_mode()
-                elif key == "x":  # Undo last action
-                    self._undo_last_action()
-                elif key == "j":  # Jump to play
-                    self._jump_to_play()
-                elif key == "-":  # Clear (context-sensitive)
-                    if self.mode == "pitch":
-                        self._clear_pitches()
-                    elif self.mode == "play":
-                        self._clear_play_result()
-                elif self.pickoff_attempt_active:
-                    self._handle_pickoff_attempt_input(key)
-                elif self.mode == "pitch" and key in self.pitch_hotkeys:
-                    code = self.pitch_hotkeys[key]
-                    if code == "X":
-                        # Ball in play shortcut: append 'X' to pitches and switch to play mode
-                        self._mark_ball_in_play_and_switch()
-                    else:
-                        self._add_pitch(code)
-                elif self.mode == "play" and key in self.play_hotkeys:
-                    # Only certain results should enter detail mode
-                    result = self.play_hotkeys[key]
-                    if result == "OUT" or result in [
-                        "S",
-                        "D",
-                        "T",
-                        "HR",
-                        "E",
-                        "PO",
-                        "POCS",
-                        "CS",
-                        # Base-running events that need additional detail
-                        "OA",
-                        "BK",
-                        "DI",
-                        "PB",
-                        "WP",
-                        "SB",
-                        # Sacrifice plays that need runner advance detail
-                        "SF",
-                        "SH",
-                    ]:
-                        # Generic out requires out-type/position details
-                        # Hits and errors require hit-type/position details
-                        # Sacrifice plays require fielding detail and then runner advances
-                        self._enter_detail_mode(result)
-                    else:
-                        # All other results should set immediately without entering detail mode
-                        self._set_play_result(result)
-                elif self.mode == "detail":
-                    if self.modifier_selection_active:
-                        self._handle_modifier_mode_input(key)
-                    else:
-                        if key == "\r" or key == "\n":  # Enter key
+                        if self.modifier_selection_active:
+                            self._handle_modifier_mode_input(key)
+                        elif key == "\r" or key == "\n":  # Enter key
                             # Allow saving when out-type selected; for K, no fielder required
                             if (
-                                self.detail_mode_result
-                                in ["OUT", "GDP", "LDP", "TP", "FO", "UO"]
+                                self.detail_mode_result in OUT_RESULTS
                                 and self.detail_mode_out_type
                                 and (
                                     self.detail_mode_fielders
@@ -355,64 +962,126 @@ class RetrosheetEditor:
                                 self._save_detail_mode_result()
                             # Allow saving hits/errors with no fielder when hit type is selected
                             elif (
-                                self.detail_mode_result in ["S", "D", "T", "HR", "E"]
+                                self.detail_mode_result in HIT_RESULTS
                                 and self.detail_mode_hit_type is not None
                             ):
                                 self._save_detail_mode_result()
                             # Allow saving pickoffs and caught stealing when details are selected
-                            elif self.detail_mode_result in ["PO", "POCS", "CS"]:
-                                self._save_detail_mode_result()
-                            # Allow saving runner-advancement events (BK/DI/PB/WP/SB/OA)
-                            elif self.detail_mode_result in [
-                                "BK",
-                                "DI",
-                                "PB",
-                                "WP",
-                                "SB",
-                                "OA",
-                            ]:
+                            # and runner-advancement events (BK/DI/PB/WP/SB/OA)
+                            elif (
+                                self.detail_mode_result in PICKOFF_RESULTS
+                                or self.detail_mode_result in RUNNER_ADVANCE_RESULTS
+                            ):
                                 self._save_detail_mode_result()
                         else:
                             self._handle_detail_mode_input(key)
-                elif key == "\r" or key == "\n":  # Enter key
-                    self._save_current_state()
+                    elif key == "\r" or key == "\n":  # Enter key
+                        self._save_current_state()
+                        self.flush_sync()
 
             except KeyboardInterrupt:
                 break
 
-    def _display_interface(self) -> None:
-        """Display the main interface."""
-        self.console.clear()
+    def _toggle_mode(self) -> None:
+        """Cycle pitch -> play -> detail -> pitch (TAB key)."""
+        new_mode = self._MODE_TRANSITIONS.get(self.mode)
+        if new_mode is None:
+            return
+        hook = self._mode_hooks.get((self.mode, new_mode))
+        self.mode = new_mode
+        if hook:
+            hook()
 
+    def _maybe_start_modifier_detail_mode(self) -> None:
+        """Offer additional details if the current play already has a result."""
         current_game = self.event_file.games[self.current_game_index]
+        if (
+            current_game.plays
+            and current_game.plays[self.current_play_index].play_description
+        ):
+            self._start_modifier_detail_mode()
 
-        # Create layout
-        layout = Layout()
-        layout.split_column(
-            Layout(name="padding", size=1),
-            Layout(name="header", size=3),
-            Layout(name="main", size=8),
-            Layout(name="controls", size=16),
+    def _clear_current(self) -> None:
+        """Clear pitches in pitch mode or the result in play mode ('-' key)."""
+        if self.mode == "pitch":
+            self._clear_pitches()
+        elif self.mode == "play":
+            self._clear_play_result()
+
+    def _screen_state(self, current_game: Game) -> tuple:
+        """Return a hashable snapshot of everything the main interface shows."""
+        play_fields = None
+        if current_game.plays:
+            play = current_game.plays[self.current_play_index]
+            play_fields = (play.count, play.pitches, play.play_description)
+        return (
+            self.current_game_index,
+            self.current_play_index,
+            play_fields,
+            self._controls_state_key(current_game),
+            self._status,
         )
 
-        # Header
-        header = Panel(
-            f"Game: {current_game.game_id} | "
-            f"{current_game.info.away_team} @ {current_game.info.home_team} | "
-            f"Date: {current_game.info.date}",
-            title="Retrosheet Buddy",
-            style="bold blue",
-        )
-        layout["header"].update(header)
+    def _set_status(self, message: str, style: str) -> None:
+        """Show a message on the header status line.
 
-        # Main content
-        main_content = self._create_main_content(current_game)
-        layout["main"].update(main_content)
+        Printing while the full-screen live display runs would scroll the
+        frame, so messages go through the header and the next repaint.
+        """
+        self._status = (message, style)
+
+    def _display_interface(self, current_game: Optional[Game] = None) -> None:
+        """Display the main interface."""
+        if current_game is None:
+            current_game = self.event_file.games[self.current_game_index]
+
+        layout = self._layout
+
+        # Header: changes only with the game and the status line
+        status = self._status
+        if (
+            self._header_cache is None
+            or self._header_cache[0] is not current_game
+            or self._header_cache[1] != status
+        ):
+            subtitle = None
+            if status is not None:
+                message, style = status
+                subtitle = Text(message, style=style)
+            header = Panel(
+                f"Game: {current_game.game_id} | "
+                f"{current_game.info.away_team} @ {current_game.info.home_team} | "
+                f"Date: {current_game.info.date}",
+                title="Retrosheet Buddy",
+                subtitle=subtitle,
+                style="bold blue",
+            )
+            self._header_cache = (current_game, status, header)
+            layout["header"].update(header)
+
+        # Main content: changes with the current play and its recorded fields
+        main_key: Tuple[Union[int, str], ...] = (self.current_play_index,)
+        if current_game.plays:
+            play = current_game.plays[self.current_play_index]
+            main_key += (play.count, play.pitches, play.play_description)
+        if (
+            self._main_cache is None
+            or self._main_cache[0] is not current_game
+            or self._main_cache[1] != main_key
+        ):
+            main_content = self._create_main_content(current_game)
+            self._main_cache = (current_game, main_key, main_content)
+            layout["main"].update(main_content)
 
         # Controls
-        controls = self._create_controls_panel()
+        controls = self._create_controls_panel(current_game)
         layout["controls"].update(controls)
 
+        if self._live is not None:
+            # Redraw in place on the live screen rather than clearing first
+            self._live.update(layout, refresh=True)
+            return
+        self.console.clear()
         self.console.print(layout)
 
     def _create_main_content(self, game: Game) -> Panel:
@@ -447,9 +1116,61 @@ class RetrosheetEditor:
 
         return Panel(table, title="Current Play")
 
-    def _create_controls_panel(self) -> Panel:
-        """Create the controls panel."""
-        controls_text = Text()
+    def _create_controls_panel(self, current_game: Optional[Game] = None) -> Panel:
+        """Create the controls panel, reusing the last panel built for this state."""
+        state_key = self._controls_state_key(current_game)
+        cache = self._controls_cache
+        panel = cache.get(state_key)
+        if panel is None:
+            panel = cache[state_key] = self._build_controls_panel()
+            if len(cache) > self._CONTROLS_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(state_key)
+        return panel
+
+    def _controls_state_key(self, current_game: Optional[Game] = None) -> tuple:
+        """Return a hashable snapshot of every field the controls panel reads."""
+        strikeout_recorded = None
+        if self.detail_mode_result in _SIMPLE_ADVANCE_RESULTS:
+            strikeout_recorded = self._strikeout_recorded(current_game)
+        return (
+            self.console.width,
+            self.mode,
+            self.pickoff_attempt_active,
+            self.pickoff_attempt_player,
+            self.pickoff_attempt_base,
+            self.modifier_selection_active,
+            self.selected_modifier_group,
+            tuple(self.selected_modifiers),
+            self.modifier_param_request and self.modifier_param_request["type"],
+            self.hit_location_positions,
+            self.hit_location_suffix,
+            self.hit_location_depth,
+            self.hit_location_foul,
+            self.advance_runner_active,
+            self.advance_runner_from_base,
+            tuple(self.advance_runner_tokens),
+            self.detail_mode_result,
+            self.detail_mode_out_type,
+            self.detail_mode_hit_type,
+            tuple(self.detail_mode_fielders),
+            self.detail_pickoff_base,
+            self.detail_pickoff_error_fielder,
+            tuple(self.detail_pickoff_fielders),
+            tuple(self.runner_tokens),
+            self.sb_mask,
+            self.advance_from_base,
+            strikeout_recorded,
+            self.oa_stage,
+            self.oa_from_base,
+            self.oa_out,
+            tuple(self.oa_fielders),
+        )
+
+    def _build_controls_panel(self) -> Panel:
+        """Build the controls panel from the current editor state."""
+        controls_text = _TextParts()
 
         # Current mode indicator - dynamic text generation
         self._add_mode_section(controls_text)
@@ -482,13 +1203,15 @@ class RetrosheetEditor:
             # Pitch controls - generated from pitch_hotkeys dictionary
             controls_text.append("Pitch Events:\n", style="bold green")
             self._add_hotkey_controls(
-                controls_text, self.pitch_hotkeys, self._get_pitch_descriptions()
+                controls_text,
+                self.pitch_hotkeys_ordered,
+                self._get_pitch_descriptions(),
             )
         elif self.mode == "play":
             # Play results - generated from play_hotkeys dictionary
             controls_text.append("Play Results:\n", style="bold red")
             self._add_hotkey_controls(
-                controls_text, self.play_hotkeys, self._get_play_descriptions()
+                controls_text, self.play_hotkeys_ordered, self._get_play_descriptions()
             )
         elif self.mode == "detail":
             # Detail mode controls
@@ -506,7 +1229,7 @@ class RetrosheetEditor:
                             style="bold cyan",
                         )
                 else:
-                    group_name, codes = self.modifier_groups[
+                    group_name = self.modifier_group_titles[
                         self.selected_modifier_group
                     ]
                     controls_text.append(f"{group_name}:\n", style="bold green")
@@ -533,27 +1256,21 @@ class RetrosheetEditor:
                             controls_text.append(
                                 f"From base: {fb}\n", style="bold green"
                             )
-                            if fb == "1":
-                                controls_text.append(
-                                    "Destination: [2] Second  [1] Stay (1-1)\n",
-                                    style="bold blue",
-                                )
-                            elif fb == "2":
-                                controls_text.append(
-                                    "Destination: [3] Third  [2] Stay (2-2)\n",
-                                    style="bold blue",
-                                )
-                            else:
-                                controls_text.append(
-                                    "Destination: [H or 4] Home  [3] Stay (3-3)\n",
-                                    style="bold blue",
-                                )
+                            controls_text.append(
+                                _STAY_OR_ADVANCE_PROMPTS.get(
+                                    fb, _STAY_OR_ADVANCE_PROMPTS["3"]
+                                ),
+                                style="bold blue",
+                            )
                             controls_text.append(
                                 "[ENTER] to apply, [0] back\n", style="bold blue"
                             )
                     else:
                         # Render options in wrapped rows with max width, similar to other modes
-                        self._add_modifier_options_wrapped(controls_text, codes)
+                        self._add_modifier_options_wrapped(
+                            controls_text,
+                            self.modifier_group_options[self.selected_modifier_group],
+                        )
                         if self.selected_modifiers:
                             controls_text.append(
                                 f"Selected: {', '.join(self.selected_modifiers)}\n",
@@ -580,13 +1297,13 @@ class RetrosheetEditor:
                 )
 
                 # Handle different types of plays
-                if self.detail_mode_result in ["OUT", "GDP", "LDP", "TP", "FO", "UO"]:
+                if self.detail_mode_result in OUT_RESULTS:
                     # Out types need out type and fielding positions (K allows optional fielders)
                     if self.detail_mode_out_type is None:
                         controls_text.append("Out Type:\n", style="bold green")
                         self._add_hotkey_controls(
                             controls_text,
-                            self.out_type_hotkeys,
+                            self.out_type_hotkeys_ordered,
                             self._get_out_type_descriptions(),
                         )
                         controls_text.append(
@@ -604,7 +1321,7 @@ class RetrosheetEditor:
                             )
                             self._add_hotkey_controls(
                                 controls_text,
-                                self.fielding_position_hotkeys,
+                                self.fielding_position_hotkeys_ordered,
                                 self._get_fielding_position_descriptions(),
                             )
                             controls_text.append(
@@ -632,16 +1349,16 @@ class RetrosheetEditor:
                         controls_text.append("Fielding Positions:\n", style="bold blue")
                         self._add_hotkey_controls(
                             controls_text,
-                            self.fielding_position_hotkeys,
+                            self.fielding_position_hotkeys_ordered,
                             self._get_fielding_position_descriptions(),
                         )
                         controls_text.append(
                             "Press [ENTER] to save or add more positions\n",
                             style="bold cyan",
                         )
-                elif self.detail_mode_result in ["PO", "POCS", "CS"]:
+                elif self.detail_mode_result in PICKOFF_RESULTS:
                     # Pickoff UI
-                    if not getattr(self, "detail_pickoff_base", None):
+                    if not self.detail_pickoff_base:
                         if self.detail_mode_result == "PO":
                             controls_text.append(
                                 "Pickoff base: [1] First  [2] Second  [3] Third\n",
@@ -682,7 +1399,7 @@ class RetrosheetEditor:
                         controls_text.append("Fielding Positions:\n", style="bold blue")
                         self._add_hotkey_controls(
                             controls_text,
-                            self.fielding_position_hotkeys,
+                            self.fielding_position_hotkeys_ordered,
                             self._get_fielding_position_descriptions(),
                         )
                         if self.detail_pickoff_fielders:
@@ -690,13 +1407,11 @@ class RetrosheetEditor:
                                 f"Fielders: {'-'.join(map(str, self.detail_pickoff_fielders))}\n",
                                 style="bold cyan",
                             )
-                        controls_text.append(
-                            "Press [ENTER] to save\n", style="bold cyan"
-                        )
-                elif self.detail_mode_result in ["BK", "DI", "PB", "WP", "SB", "OA"]:
+                        controls_text.append(_PRESS_ENTER_TO_SAVE, style="bold cyan")
+                elif self.detail_mode_result in RUNNER_ADVANCE_RESULTS:
                     # Runner advancement / stolen base / out advancing UI
                     # Show current tokens (for SB these are SB2/SB3/SBH, others are base moves like 1-2)
-                    if getattr(self, "runner_tokens", None):
+                    if self.runner_tokens:
                         controls_text.append(
                             f"Selected: {';'.join(self.runner_tokens)}\n",
                             style="bold cyan",
@@ -708,27 +1423,16 @@ class RetrosheetEditor:
                             style="bold blue",
                         )
                         # Show current SB selections
-                        if getattr(self, "sb_targets", None):
-                            ordered = []
-                            for b in ["2", "3", "H"]:
-                                if b in self.sb_targets:
-                                    ordered.append(f"SB{b}")
-                            if ordered:
-                                controls_text.append(
-                                    f"Selected: {';'.join(ordered)}\n",
-                                    style="bold cyan",
-                                )
-                        controls_text.append(
-                            "Press [ENTER] to save\n", style="bold cyan"
-                        )
-                    elif self.detail_mode_result in ["BK", "DI", "PB", "WP"]:
+                        if self.sb_mask:
+                            controls_text.append(
+                                f"Selected: {';'.join(_stolen_base_tokens(self.sb_mask))}\n",
+                                style="bold cyan",
+                            )
+                        controls_text.append(_PRESS_ENTER_TO_SAVE, style="bold cyan")
+                    elif self.detail_mode_result in _SIMPLE_ADVANCE_RESULTS:
                         # Simple advances only
-                        current_game = self.event_file.games[self.current_game_index]
-                        current_play = current_game.plays[self.current_play_index]
-                        is_strikeout_recorded = bool(
-                            (current_play.play_description or "").startswith("K")
-                        )
-                        if not getattr(self, "advance_from_base", None):
+                        is_strikeout_recorded = self._strikeout_recorded()
+                        if not self.advance_from_base:
                             # Show from-base options; add Batter (B) if a strikeout is recorded
                             base_prompt = "Select runner base to advance: [1], [2], [3]"
                             if is_strikeout_recorded:
@@ -740,29 +1444,13 @@ class RetrosheetEditor:
                             controls_text.append(
                                 f"From base: {from_label}\n", style="bold green"
                             )
-                            if from_b == "1":
+                            if from_b in _DESTINATION_PROMPTS:
                                 controls_text.append(
-                                    "Destination: [2] Second\n", style="bold blue"
+                                    _DESTINATION_PROMPTS[from_b], style="bold blue"
                                 )
-                            elif from_b == "2":
-                                controls_text.append(
-                                    "Destination: [3] Third\n", style="bold blue"
-                                )
-                            elif from_b == "3":
-                                controls_text.append(
-                                    "Destination: [H or 4] Home\n",
-                                    style="bold blue",
-                                )
-                            elif from_b == "B":
-                                controls_text.append(
-                                    "Destination: [1] First  [2] Second  [3] Third  [H or 4] Home\n",
-                                    style="bold blue",
-                                )
-                        controls_text.append(
-                            "Press [ENTER] to save\n", style="bold cyan"
-                        )
+                        controls_text.append(_PRESS_ENTER_TO_SAVE, style="bold cyan")
                     else:  # OA (can be advance or out with fielders)
-                        stage = getattr(self, "oa_stage", "choose_runner")
+                        stage = self.oa_stage
                         if stage == "choose_runner":
                             controls_text.append(
                                 "Select runner base: [1], [2], [3]\n", style="bold blue"
@@ -777,39 +1465,19 @@ class RetrosheetEditor:
                             controls_text.append(
                                 f"From base: {from_b}\n", style="bold green"
                             )
-                            if not self.oa_out:
-                                if from_b == "1":
-                                    controls_text.append(
-                                        "Destination: [2] Second\n", style="bold blue"
-                                    )
-                                elif from_b == "2":
-                                    controls_text.append(
-                                        "Destination: [3] Third\n", style="bold blue"
-                                    )
-                                else:
-                                    controls_text.append(
-                                        "Destination: [H or 4] Home\n",
-                                        style="bold blue",
-                                    )
-                            else:
-                                if from_b == "1":
-                                    controls_text.append(
-                                        "Out at: [2] Second\n", style="bold blue"
-                                    )
-                                elif from_b == "2":
-                                    controls_text.append(
-                                        "Out at: [3] Third\n", style="bold blue"
-                                    )
-                                else:
-                                    controls_text.append(
-                                        "Out at: [H or 4] Home\n", style="bold blue"
-                                    )
+                            prompts = (
+                                _OUT_AT_PROMPTS if self.oa_out else _DESTINATION_PROMPTS
+                            )
+                            # Runners from third (or unset) head home
+                            controls_text.append(
+                                prompts.get(from_b, prompts["3"]), style="bold blue"
+                            )
                         elif stage == "choose_fielders":
                             controls_text.append(
                                 "Enter fielder sequence digits [1-9]; press [ENTER] to finalize token\n",
                                 style="bold blue",
                             )
-                            if getattr(self, "oa_fielders", None):
+                            if self.oa_fielders:
                                 controls_text.append(
                                     f"Fielders: {'-'.join(map(str, self.oa_fielders))}\n",
                                     style="bold cyan",
@@ -821,7 +1489,7 @@ class RetrosheetEditor:
                         controls_text.append("Hit Type:\n", style="bold green")
                         self._add_hotkey_controls(
                             controls_text,
-                            self.hit_type_hotkeys,
+                            self.hit_type_hotkeys_ordered,
                             self._get_hit_type_descriptions(),
                         )
                         controls_text.append(
@@ -835,7 +1503,7 @@ class RetrosheetEditor:
                         controls_text.append("Fielding Position:\n", style="bold blue")
                         self._add_hotkey_controls(
                             controls_text,
-                            self.fielding_position_hotkeys,
+                            self.fielding_position_hotkeys_ordered,
                             self._get_fielding_position_descriptions(),
                         )
                         controls_text.append(
@@ -860,24 +1528,15 @@ class RetrosheetEditor:
                     "Select a play result to enter detail mode.\n", style="bold red"
                 )
 
-        # Calculate the height of the generated text
-        text_height = self._calculate_text_height(controls_text)
+        # Height of the generated text, counted while it was appended
+        text_height = controls_text.line_count
 
         # Add padding for panel borders and title
         panel_height = text_height + 1
 
-        return Panel(controls_text, title="Controls", height=panel_height)
+        return Panel(controls_text.assemble(), title="Controls", height=panel_height)
 
-    def _calculate_text_height(self, text: Text) -> int:
-        """Calculate the height (number of lines) of a Text object."""
-        # Convert Text to string and count lines
-        text_str = str(text)
-        lines = text_str.split("\n")
-        # Count lines (excluding trailing empty line)
-        height = len(lines)
-        return height
-
-    def _add_mode_section(self, controls_text: Text) -> None:
+    def _add_mode_section(self, controls_text: ControlsText) -> None:
         """Add the current mode section with dynamic text generation."""
         # Calculate maximum width: minimum of console width and 120 characters
         max_width = min(self.console.width, 120)
@@ -909,7 +1568,7 @@ class RetrosheetEditor:
             # Split if needed (though unlikely for this short text)
             controls_text.append(f"  [TAB] Switch to\n  {next_mode.upper()} mode\n\n")
 
-    def _add_navigation_section(self, controls_text: Text) -> None:
+    def _add_navigation_section(self, controls_text: ControlsText) -> None:
         """Add the navigation section with dynamic text generation."""
         # Calculate maximum width: minimum of console width and 120 characters
         max_width = min(self.console.width, 120)
@@ -919,65 +1578,53 @@ class RetrosheetEditor:
 
         controls_text.append("Navigation:\n", style="bold cyan")
 
-        # Navigation items (use actual keys handled by get_key: left/right arrows)
-        nav_items = [
-            "[Left] Previous play",
-            "[Right] Next play",
-            "[Down] Next incomplete",
-            "[J] Jump to play",
-            "[Q] Quit",
-            "[X] Undo last action",
-        ]
-
-        # Context-sensitive clear hint
-        if self.mode == "pitch":
-            nav_items.append("[-] Clear pitches")
-        elif self.mode == "play":
-            nav_items.append("[-] Clear result")
-
-        current_row = []
-        current_row_width = 0
-
-        for item in nav_items:
-            # Calculate width of this item plus spacing
-            item_width = len(item)
-            spacing_width = 2 if current_row else 0  # 2 spaces between items
-            total_item_width = item_width + spacing_width
-
-            # Check if this item fits on the current row
-            if current_row_width + total_item_width <= available_width:
-                current_row.append(item)
-                current_row_width += total_item_width
-            else:
-                # Current row is full, append it and start a new row
-                if current_row:
-                    controls_text.append("  " + "  ".join(current_row) + "\n")
-                current_row = [item]
-                current_row_width = item_width
-
-        # Append the last row if it has content
-        if current_row:
-            controls_text.append("  " + "  ".join(current_row) + "\n")
+        # The rows depend only on the mode (clear hint) and the width
+        cache_key = ("nav", self.mode, available_width)
+        entry = self._hotkey_layout_cache.get(cache_key)
+        if entry is None:
+            # Navigation items (use actual keys handled by get_key: left/right arrows)
+            nav_items = [
+                "[Left] Previous play",
+                "[Right] Next play",
+                "[Down] Next incomplete",
+                "[J] Jump to play",
+                "[Q] Quit",
+                "[X] Undo last action",
+            ]
+
+            # Context-sensitive clear hint
+            if self.mode == "pitch":
+                nav_items.append("[-] Clear pitches")
+            elif self.mode == "play":
+                nav_items.append("[-] Clear result")
+
+            entry = self._hotkey_layout_cache[cache_key] = (
+                None,
+                None,
+                _pack_rows(nav_items, available_width),
+            )
+        if entry[2]:
+            controls_text.append(entry[2])
 
         controls_text.append("\n")  # Add extra spacing after navigation
 
-    def _get_pitch_descriptions(self) -> dict:
+    def _get_pitch_descriptions(self) -> Mapping:
         """Get descriptions for pitch events."""
         return PITCH_DESCRIPTIONS
 
-    def _get_play_descriptions(self) -> dict:
+    def _get_play_descriptions(self) -> Mapping:
         """Get descriptions for play results."""
         return PLAY_DESCRIPTIONS
 
-    def _get_hit_type_descriptions(self) -> dict:
+    def _get_hit_type_descriptions(self) -> Mapping:
         """Get descriptions for hit types."""
         return HIT_TYPE_DESCRIPTIONS
 
-    def _get_fielding_position_descriptions(self) -> dict:
-        """Get descriptions for fielding positions."""
+    def _get_fielding_position_descriptions(self) -> Tuple[Optional[str], ...]:
+        """Get descriptions for fielding positions, indexed by position."""
         return FIELDING_POSITION_DESCRIPTIONS
 
-    def _get_out_type_descriptions(self) -> dict:
+    def _get_out_type_descriptions(self) -> Mapping:
         """Get descriptions for out types in detail mode."""
         return OUT_TYPE_DESCRIPTIONS
 
@@ -985,124 +1632,53 @@ class RetrosheetEditor:
         self, result: str, fielding_position: int = 0
     ) -> str:
         """Generate proper Retrosheet play description format."""
-        if result == "S":  # Single
-            if fielding_position > 0:
-                return f"S{fielding_position}/G"
-            return "S8/G6"  # Default to center field
-        elif result == "D":  # Double
-            if fielding_position > 0:
-                return f"D{fielding_position}/L"
-            return "D7/L7"  # Default to left field
-        elif result == "T":  # Triple
-            if fielding_position > 0:
-                return f"T{fielding_position}/L"
-            return "T8/L8"  # Default to center field
-        elif result == "HR":  # Home run
-            return "HR/F7"  # Over left field fence
-        elif result == "K":  # Strikeout
-            return "K"
-        elif result == "W":  # Walk
-            return "W"
-        elif result == "HP":  # Hit by pitch
-            return "HP"
-        elif result == "E":  # Error
-            if fielding_position > 0:
-                return f"E{fielding_position}/G"
-            return "E6/G6"  # Default to shortstop
-        elif result == "FC":  # Fielder's choice
-            if fielding_position > 0:
-                return f"FC{fielding_position}/G"
-            return "FC6/G6"
-        elif result == "DP":  # Double play
-            return "DP/G6"
-        elif result == "TP":  # Triple play
-            return "TP/G6"
-        elif result == "SF":  # Sacrifice fly
-            if fielding_position > 0:
-                return f"SF{fielding_position}/F"
-            return "SF8/F8"
-        elif result == "SH":  # Sacrifice bunt
-            if fielding_position > 0:
-                return f"SH{fielding_position}/G"
-            return "SH1/G1"
-        elif result == "IW":  # Intentional walk
-            return "IW"
-        elif result == "CI":  # Catcher interference
-            return "CI"
-        elif result == "OA":  # Out advancing
-            return "OA"
-        elif result == "ND":  # No play
-            return "ND"
-        # New out types
-        elif result == "OUT":  # Generic out
-            if fielding_position > 0:
-                return f"G{fielding_position}"
-            return "G6"
-        elif result == "GDP":  # Grounded into double play
-            if fielding_position > 0:
-                return f"G{fielding_position}/GDP/G{fielding_position}"
-            return "G6/GDP/G6"
-        elif result == "LDP":  # Lined into double play
-            if fielding_position > 0:
-                return f"L{fielding_position}/LDP/L{fielding_position}"
-            return "L6/LDP/L6"
-        elif result == "FO":  # Force out
-            if fielding_position > 0:
-                return f"G{fielding_position}/FO/G{fielding_position}"
-            return "G6/FO/G6"
-        elif result == "UO":  # Unassisted out
-            if fielding_position > 0:
-                return f"G{fielding_position}/UO/G{fielding_position}"
-            return "G6/UO/G6"
-        else:
-            return result
+        return _format_play_description(result, fielding_position)
 
     def _add_hotkey_controls(
-        self, controls_text: Text, hotkeys: dict, descriptions: dict
+        self,
+        controls_text: ControlsText,
+        hotkeys: Sequence[Tuple[str, Union[str, int]]],
+        descriptions: Union[Mapping, Sequence],
     ) -> None:
-        """Add hotkey controls to the controls text."""
+        """Add hotkey controls to the controls text from display-ordered (key, code) pairs."""
         # Calculate maximum width: minimum of console width and 120 characters
         max_width = min(self.console.width, 120)
 
         # Account for indentation (2 spaces) and panel borders/padding (4 characters)
         available_width = max_width - 6
 
-        keys = list(hotkeys.keys())
-        current_row = []
-        current_row_width = 0
-
-        for key in keys:
-            if key in hotkeys:
-                retrosheet_code = hotkeys[key]
-                description = descriptions.get(retrosheet_code, retrosheet_code)
-                key_entry = f"[{key.upper()}] {description}"
-
-                # Calculate width of this entry plus spacing
-                entry_width = len(key_entry)
-                spacing_width = 2 if current_row else 0  # 2 spaces between entries
-                total_entry_width = entry_width + spacing_width
-
-                # Check if this entry fits on the current row
-                if current_row_width + total_entry_width <= available_width:
-                    current_row.append(key_entry)
-                    current_row_width += total_entry_width
+        # Hotkey tables are module-level constants, so their identity plus the
+        # width determines the rows; the stored tables guard against id reuse
+        cache_key = (id(hotkeys), id(descriptions), available_width)
+        entry = self._hotkey_layout_cache.get(cache_key)
+        if entry is None or entry[0] is not hotkeys or entry[1] is not descriptions:
+            entries = []
+            for key, retrosheet_code in hotkeys:
+                if isinstance(descriptions, Mapping):
+                    description = descriptions.get(retrosheet_code, retrosheet_code)
                 else:
-                    # Current row is full, append it and start a new row
-                    if current_row:
-                        controls_text.append("  " + "  ".join(current_row) + "\n")
-                    current_row = [key_entry]
-                    current_row_width = entry_width
-
-        # Append the last row if it has content
-        if current_row:
-            controls_text.append("  " + "  ".join(current_row) + "\n")
+                    # Fielding positions index straight into a tuple
+                    description = descriptions[int(retrosheet_code)]
+                entries.append(f"[{key.upper()}] {description}")
+            entry = self._hotkey_layout_cache[cache_key] = (
+                hotkeys,
+                descriptions,
+                _pack_rows(entries, available_width),
+            )
+        if entry[2]:
+            controls_text.append(entry[2])
 
     def _get_player_name(self, game: Game, player_id: str) -> str:
         """Get player name from player ID."""
-        for player in game.players:
-            if player.player_id == player_id:
-                return player.name
-        return player_id
+        # Per-game ID -> name index; rebuilt if the game's roster grows
+        entry = self._player_names.get(id(game))
+        if entry is None or entry[0] is not game or entry[1] != len(game.players):
+            names: Dict[str, str] = {}
+            for player in game.players:
+                # First record wins, matching a front-to-back scan of players
+                names.setdefault(player.player_id, player.name)
+            entry = self._player_names[id(game)] = (game, len(game.players), names)
+        return entry[2].get(player_id, player_id)
 
     def _previous_play(self) -> None:
         """Go to previous play."""
@@ -1119,6 +1695,19 @@ class RetrosheetEditor:
             self.current_play_index += 1
             self._auto_set_mode_after_navigation(prior_mode)
 
+    @contextmanager
+    def _outside_live(self) -> Iterator[None]:
+        """Pause the live display while a screen is drawn directly on the console."""
+        live = self._live
+        if live is None:
+            yield
+            return
+        live.stop()
+        try:
+            yield
+        finally:
+            live.start()
+
     def _jump_to_play(self) -> None:
         """Show a table of all plays and allow user to jump to a specific play."""
         if not self.event_file.games:
@@ -1128,12 +1717,66 @@ class RetrosheetEditor:
         if not current_game.plays:
             return
 
-        # Clear the screen and show the jump-to-play interface
-        self.console.clear()
+        plays = current_game.plays
+        # Only one screen of rows is built at a time, starting with the page
+        # that centres the current play
+        page_size = max(self.console.height - self._JUMP_TABLE_CHROME, 5)
+        page_start = max(
+            0, min(self.current_play_index - page_size // 2, len(plays) - page_size)
+        )
+        paged = len(plays) > page_size
+
+        # The jump screen is drawn directly on the console, outside the layout
+        self._dirty = True
+        with self._outside_live():
+            while True:
+                # Clear the screen and show the jump-to-play interface
+                self.console.clear()
+                page_end = min(len(plays), page_start + page_size)
+                self.console.print(
+                    self._build_jump_table(current_game, page_start, page_end)
+                )
+                page_hint = ", [N]/[P] next/previous page," if paged else ""
+                self.console.print(
+                    f"\nEnter play number (1-{len(plays)}){page_hint} or press any "
+                    "other key to cancel: ",
+                    end="",
+                )
+
+                # Get user input for play number
+                try:
+                    # Read a line of input (allow multi-digit numbers)
+                    user_input = read_line().strip()
+                    if paged and user_input.lower() == "n":
+                        page_start = min(page_end, len(plays) - page_size)
+                        continue
+                    if paged and user_input.lower() == "p":
+                        page_start = max(0, page_start - page_size)
+                        continue
+                    if user_input.isdigit():
+                        play_number = int(user_input)
+                        if 1 <= play_number <= len(plays):
+                            # Valid play number - jump to it
+                            prior_mode = self.mode
+                            self.current_play_index = play_number - 1
+                            self._auto_set_mode_after_navigation(prior_mode)
+                except (ValueError, KeyboardInterrupt):
+                    # Invalid input or user cancelled - do nothing
+                    pass
+                break
+
+            # Clear the screen and return to normal interface
+            self.console.clear()
 
-        # Create table of all plays
+    def _build_jump_table(self, game: Game, start: int, end: int) -> Table:
+        """Build the jump-to-play table for plays ``start`` to ``end`` (exclusive)."""
         table = Table(
-            title=f"Jump to Play - {current_game.info.home_team} vs {current_game.info.away_team} ({current_game.info.date})"
+            title=f"Jump to Play - {game.info.home_team} vs {game.info.away_team} ({game.info.date})",
+            caption=(
+                f"Plays {start + 1}-{end} of {len(game.plays)}"
+                if end - start < len(game.plays)
+                else None
+            ),
         )
         table.add_column("#", style="cyan", width=4)
         table.add_column("Inning", style="magenta", width=6)
@@ -1143,9 +1786,9 @@ class RetrosheetEditor:
         table.add_column("Pitches", style="red", width=15)
         table.add_column("Result", style="white", width=30)
 
-        for i, play in enumerate(current_game.plays):
+        for i, play in enumerate(game.plays[start:end], start):
             team_name = "Away" if play.team == 0 else "Home"
-            batter_name = self._get_player_name(current_game, play.batter_id)
+            batter_name = self._get_player_name(game, play.batter_id)
 
             # Highlight current play
             style = "bold reverse" if i == self.current_play_index else None
@@ -1160,33 +1803,7 @@ class RetrosheetEditor:
                 play.play_description or "",
                 style=style,
             )
-
-        # Show the table
-        self.console.print(table)
-        self.console.print(
-            "\nEnter play number (1-{}) or press any other key to cancel: ".format(
-                len(current_game.plays)
-            ),
-            end="",
-        )
-
-        # Get user input for play number
-        try:
-            # Read a line of input (allow multi-digit numbers)
-            user_input = input().strip()
-            if user_input.isdigit():
-                play_number = int(user_input)
-                if 1 <= play_number <= len(current_game.plays):
-                    # Valid play number - jump to it
-                    prior_mode = self.mode
-                    self.current_play_index = play_number - 1
-                    self._auto_set_mode_after_navigation(prior_mode)
-        except (ValueError, KeyboardInterrupt):
-            # Invalid input or user cancelled - do nothing
-            pass
-
-        # Clear the screen and return to normal interface
-        self.console.clear()
+        return table
 
     def _next_incomplete_play(self) -> None:
         """Jump to the next play with incomplete information."""
@@ -1197,39 +1814,52 @@ class RetrosheetEditor:
         if not current_game.plays:
             return
 
-        def is_incomplete(play: Play) -> bool:
-            """Check if a play has incomplete information."""
-            # Check if count is ??
-            if play.count == "??" or play.original_count == "??":
-                return True
-            # Check if pitch string is empty
-            if not play.pitches:
-                return True
-            # Check if play description is empty
-            if not play.play_description:
-                return True
-            return False
+        current_index = self.current_play_index
+        # The current play is the one most likely to have just changed
+        self._refresh_incomplete_flag(current_game, current_index)
 
-        # Search for the next incomplete play starting from current index + 1
-        start_index = self.current_play_index + 1
+        # First check from current position + 1 to end of game, then wrap
+        # around and check from beginning to current position
+        index = self._find_incomplete_play(
+            current_game, current_index + 1, len(current_game.plays)
+        )
+        if index == -1:
+            index = self._find_incomplete_play(current_game, 0, current_index + 1)
+        if index != -1:
+            prior_mode = self.mode
+            self.current_play_index = index
+            self._auto_set_mode_after_navigation(prior_mode)
+            return
 
-        # First check from current position to end of game
-        for i in range(start_index, len(current_game.plays)):
-            if is_incomplete(current_game.plays[i]):
-                prior_mode = self.mode
-                self.current_play_index = i
-                self._auto_set_mode_after_navigation(prior_mode)
-                return
+        # If no incomplete plays found, stay at current position (no-op)
 
-        # If not found, wrap around and check from beginning to current position
-        for i in range(0, self.current_play_index + 1):
-            if is_incomplete(current_game.plays[i]):
-                prior_mode = self.mode
-                self.current_play_index = i
-                self._auto_set_mode_after_navigation(prior_mode)
-                return
+    def _incomplete_mask(self, game: Game) -> bytearray:
+        """Return one byte per play of ``game``, 1 where the play is incomplete.
 
-        # If no incomplete plays found, stay at current position (no-op)
+        Built on first use and rebuilt if the number of plays changes; edits
+        update single entries through _refresh_incomplete_flag.
+        """
+        entry = self._incomplete_masks.get(id(game))
+        if entry is None or entry[0] is not game or len(entry[1]) != len(game.plays):
+            mask = bytearray(map(_is_incomplete_play, game.plays))
+            entry = self._incomplete_masks[id(game)] = (game, mask)
+        return entry[1]
+
+    def _refresh_incomplete_flag(self, game: Game, play_index: int) -> None:
+        """Recompute the incomplete flag of one play after it was edited."""
+        self._incomplete_mask(game)[play_index] = _is_incomplete_play(
+            game.plays[play_index]
+        )
+
+    def _find_incomplete_play(self, game: Game, start: int, end: int) -> int:
+        """Return the first incomplete play index in ``start:end``, or -1."""
+        mask = self._incomplete_mask(game)
+        index = mask.find(1, start, end)
+        while index != -1 and not _is_incomplete_play(game.plays[index]):
+            # Completed without passing through a save; correct the stale flag
+            mask[index] = 0
+            index = mask.find(1, index + 1, end)
+        return index
 
     def _auto_set_mode_after_navigation(self, prior_mode: str) -> None:
         """Adjust mode after changing plays based on the new play's content.
@@ -1241,16 +1871,17 @@ class RetrosheetEditor:
         current_game = self.event_file.games[self.current_game_index]
         current_play = current_game.plays[self.current_play_index]
 
-        if not (current_play.pitches or ""):
+        # None and "" are both falsy, so no default string is needed
+        if not current_play.pitches:
             desired_mode = "pitch"
-        elif not (current_play.play_description or ""):
+        elif not current_play.play_description:
             desired_mode = "play"
         else:
             desired_mode = prior_mode
 
         if desired_mode != self.mode:
             # If leaving detail mode, clear any in-progress detail state
-            if self.mode == "detail" and desired_mode in ["pitch", "play"]:
+            if self.mode == "detail" and desired_mode in _NON_DETAIL_MODES:
                 self._reset_detail_mode()
             self.mode = desired_mode
 
@@ -1277,35 +1908,10 @@ class RetrosheetEditor:
         - Balls are capped at 3 for display
         - Strikes are capped at 2 for display
         """
-        # Initialize from starting count
-        try:
-            start_balls = int(start_count[0]) if start_count else 0
-            start_strikes = int(start_count[1]) if start_count else 0
-        except (ValueError, IndexError):
-            start_balls, start_strikes = 0, 0
-
-        balls = start_balls
-        strikes = start_strikes
-
-        for pitch in pitches:
-            if pitch == "B":
-                balls += 1
-            elif pitch in ["S", "C"]:  # Swinging strike, Called strike
-                strikes += 1
-            elif pitch == "F":  # Foul ball
-                # Foul balls only count as strikes up to 2 strikes
-                if strikes < 2:
-                    strikes += 1
-            elif pitch == "T":  # Foul tip
-                # Foul tips count as strikes and can result in strikeout
-                strikes += 1
-            # Other pitch types (H, V, A, M, P, I, Q, R, E, N, O, U) don't affect count
+        balls, strikes = self._calculate_raw_balls_strikes(pitches, start_count)
 
         # Cap balls at 3 and strikes at 2 for display (never show 3 strikes)
-        balls = min(balls, 3)
-        strikes = min(strikes, 2)
-
-        return f"{balls}{strikes}"
+        return _COUNT_STRINGS[min(balls, 3), min(strikes, 2)]
 
     def _calculate_raw_balls_strikes(
         self, pitches: str, start_count: str = "00"
@@ -1315,28 +1921,7 @@ class RetrosheetEditor:
         Used for logic decisions (e.g., automatic walk/strikeout) independent of
         display capping.
         """
-        try:
-            start_balls = int(start_count[0]) if start_count else 0
-            start_strikes = int(start_count[1]) if start_count else 0
-        except (ValueError, IndexError):
-            start_balls, start_strikes = 0, 0
-
-        balls = start_balls
-        strikes = start_strikes
-
-        for pitch in pitches:
-            if pitch == "B":
-                balls += 1
-            elif pitch in ["S", "C"]:
-                strikes += 1
-            elif pitch == "F":
-                if strikes < 2:
-                    strikes += 1
-            elif pitch == "T":
-                strikes += 1
-            # Other pitch types (H, V, A, M, P, I, Q, R, E, N, O, U) don't affect count
-
-        return balls, strikes
+        return _tally_pitches(pitches, *_parse_count(start_count))
 
     def _starting_count_for_play_index(self, game: Game, play_index: int) -> str:
         """Return starting count for a given play index.
@@ -1346,8 +1931,9 @@ class RetrosheetEditor:
         """
         if play_index <= 0:
             return "00"
-        prior = game.plays[play_index - 1]
-        current = game.plays[play_index]
+        plays = game.plays
+        prior = plays[play_index - 1]
+        current = plays[play_index]
         if (
             prior.inning == current.inning
             and prior.team == current.team
@@ -1364,19 +1950,7 @@ class RetrosheetEditor:
         - F adds a strike only up to 2 strikes
         - T (foul tip) adds a strike and can be strike three
         """
-        strikes = 0
-        for pitch in pitches:
-            if pitch in ["S", "C"]:
-                strikes += 1
-            elif pitch == "F":
-                if strikes < 2:
-                    strikes += 1
-            elif pitch == "T":
-                strikes += 1
-            # Other pitch types do not affect strikes
-            if strikes >= 3:
-                return True
-        return False
+        return _tally_pitches(pitches, 0, 0)[1] >= 3
 
     def _add_pitch(self, pitch: str) -> None:
         """Add a pitch to the current play."""
@@ -1396,7 +1970,7 @@ class RetrosheetEditor:
         # do NOT add the V/A token to the pitch string. Only append a period to
         # separate the prior pitch sequence, then enter the runner-advancement
         # detail mode for PB/WP.
-        if pitch in ["V", "A"]:
+        if pitch in _PB_WP_PITCHES:
             if current_play.pitches:
                 current_play.pitches += "."
             else:
@@ -1442,11 +2016,12 @@ class RetrosheetEditor:
             current_play.play_description = "W"
             # For display, show 3 balls and current strikes (capped at 2)
             display_strikes = min(raw_strikes, 2)
-            current_play.count = f"3{display_strikes}"
+            current_play.count = _COUNT_STRINGS[3, display_strikes]
             current_play.edited = True
-            self._save_current_state()
-            # Move to next batter
-            self._next_play()
+            # Record the walk and move to the next batter as one save
+            with self._bulk_edit():
+                self._save_current_state()
+                self._next_play()
         elif self._has_strikeout(current_play.pitches):
             # Automatic strikeout
             # If there is already a suffix such as "+PB.2-3" from a prior PB/WP,
@@ -1503,16 +2078,158 @@ class RetrosheetEditor:
         self._save_current_state()
         self.mode = "play"
 
+    def _current_play(self) -> Play:
+        """Return the play under the cursor."""
+        return self.event_file.games[self.current_game_index].plays[
+            self.current_play_index
+        ]
+
     def _save_current_state(self) -> None:
-        """Save the current state to disk."""
+        """Mark the current game for saving; the write happens shortly after."""
         current_game = self.event_file.games[self.current_game_index]
-        output_path = self.output_dir / f"{current_game.game_id}.EVN"
 
-        # Create a single-game event file
-        single_game_event = EventFile(games=[current_game])
-        write_event_file(single_game_event, output_path)
+        # Every edit ends here, so keep the incomplete-play flags current
+        if current_game.plays:
+            self._refresh_incomplete_flag(current_game, self.current_play_index)
 
-        self.console.print(f"Saved to {output_path}", style="green")
+        self._dirty_games.add(self.current_game_index)
+        if not self._bulk_depth:
+            self._schedule_flush()
+
+    @contextmanager
+    def _bulk_edit(self) -> Iterator[None]:
+        """Hold back saves inside the block and schedule a single one on exit."""
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth and self._dirty_games:
+                self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Push the save deadline back.
+
+        The dirty games are only formatted once the deadline passes, so a
+        burst of edits is formatted and written once, with the last edit.
+        """
+        self._flush_deadline = time.monotonic() + self._SAVE_DELAY
+
+    def _flush_if_due(self) -> None:
+        """Queue the dirty games for the writer once edits have gone quiet."""
+        deadline = self._flush_deadline
+        if deadline is not None and time.monotonic() >= deadline:
+            self._flush_deadline = None
+            self._queue_writes(self._format_dirty_games())
+
+    def _key_wait_timeout(self) -> Optional[float]:
+        """Return how long the input loop may wait for a key, or None for ever."""
+        if self._flush_deadline is not None:
+            return max(0.0, self._flush_deadline - time.monotonic())
+        with self._pending_lock:
+            writing = bool(self._pending_writes) or self._flush_lock.locked()
+        return self._WRITE_POLL if writing else None
+
+    def _queue_writes(self, writes: Dict[Path, str]) -> None:
+        """Hand formatted text to the writer thread, starting it if needed."""
+        if not writes:
+            return
+        with self._pending_lock:
+            self._pending_writes.update(writes)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="evn-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _format_dirty_games(self) -> Dict[Path, str]:
+        """Return the event file text for each output path with dirty games.
+
+        Runs on the input loop, so the text reflects whole edits only. Only
+        the dirty games are formatted; the session file joins cached text.
+        """
+        dirty, self._dirty_games = self._dirty_games, set()
+        if not dirty:
+            return {}
+        games = self.event_file.games
+        game_text = self._game_text
+        for i in dirty:
+            game_text[i] = format_games((games[i],))
+        if self.session_file is not None:
+            # All edited games go in one file, in their original order
+            return {
+                self.output_dir
+                / self.session_file: "".join(game_text[i] for i in sorted(game_text))
+            }
+        # Each game gets its own single-game event file
+        return {
+            self.output_dir / f"{games[i].game_id}.EVN": game_text[i] for i in dirty
+        }
+
+    def _writer_loop(self) -> None:
+        """Write queued text off the input loop until nothing is queued."""
+        while True:
+            with self._pending_lock:
+                if not self._pending_writes:
+                    self._writer = None
+                    return
+            try:
+                self._write_pending()
+            except Exception as e:
+                # The text stays queued and is retried with the next save
+                self._set_status(f"Save failed: {e}", style="red")
+                with self._pending_lock:
+                    self._writer = None
+                return
+
+    def _write_pending(self) -> None:
+        """Write every queued text whose file content changed."""
+        with self._flush_lock:
+            with self._pending_lock:
+                writes, self._pending_writes = self._pending_writes, {}
+            items = list(writes.items())
+            for index, (output_path, text) in enumerate(items):
+                try:
+                    self._write_if_changed(output_path, text)
+                except BaseException:
+                    # Requeue what was not written, unless newer text is queued
+                    with self._pending_lock:
+                        for path, unwritten in items[index:]:
+                            self._pending_writes.setdefault(path, unwritten)
+                    raise
+
+    def _write_if_changed(self, output_path: Path, text: str) -> None:
+        """Write text unless output_path already holds it."""
+        if self._saved_text.get(output_path) == text and output_path.exists():
+            return
+        self._write_atomically(output_path, text)
+        self._saved_text[output_path] = text
+        self._set_status(f"Saved to {output_path}", style="green")
+
+    def _write_atomically(self, output_path: Path, text: str) -> None:
+        """Write text next to output_path and swap it in.
+
+        An interrupted write never leaves a truncated event file behind.
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=output_path.parent, prefix=f".{output_path.stem}.", suffix=".tmp"
+        )
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_name, output_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def flush_sync(self) -> None:
+        """Write any pending edits now instead of waiting for the writer."""
+        self._flush_deadline = None
+        writes = self._format_dirty_games()
+        with self._pending_lock:
+            self._pending_writes.update(writes)
+        self._write_pending()
 
     def _save_state_for_undo(self) -> None:
         """Save the current state for undo functionality."""
@@ -1528,14 +2245,10 @@ class RetrosheetEditor:
         )
         self.undo_history.append(state)
 
-        # Keep only last 10 undo states
-        if len(self.undo_history) > 10:
-            self.undo_history.pop(0)
-
     def _undo_last_action(self) -> None:
         """Undo the last action (pitch or play result)."""
         if not self.undo_history:
-            self.console.print("Nothing to undo", style="yellow")
+            self._set_status("Nothing to undo", style="yellow")
             return
 
         # Get the last saved state
@@ -1554,7 +2267,8 @@ class RetrosheetEditor:
         start_count = self._starting_count_for_play_index(current_game, play_index)
         current_play.count = self._calculate_count(current_play.pitches, start_count)
 
-        self.console.print("Undo completed", style="green")
+        self._refresh_incomplete_flag(current_game, play_index)
+        self._set_status("Undo completed", style="green")
         self._save_current_state()
 
     def _clear_pitches(self) -> None:
@@ -1575,7 +2289,7 @@ class RetrosheetEditor:
         current_play.count = self._calculate_count(current_play.pitches, start_count)
         current_play.edited = True
 
-        self.console.print("Cleared pitches", style="green")
+        self._set_status("Cleared pitches", style="green")
         self._save_current_state()
 
     def _clear_play_result(self) -> None:
@@ -1592,15 +2306,18 @@ class RetrosheetEditor:
         current_play.play_description = ""
         current_play.edited = True
 
-        # If we were in detail mode workflow, ensure state is clean
-        self._reset_detail_mode()
+        # If we were in detail mode workflow, ensure state is clean; every
+        # other mode is only entered with the detail state already reset
+        if self.mode == "detail":
+            self._reset_detail_mode()
 
-        self.console.print("Cleared play result", style="green")
+        self._set_status("Cleared play result", style="green")
         self._save_current_state()
 
     def _enter_detail_mode(self, result: str) -> None:
         """Enter detail mode for specifying hit type and fielding position."""
-        self.detail_mode_result = result
+        # Interned so the result-set membership checks compare by identity
+        self.detail_mode_result = sys.intern(result)
         self.detail_mode_hit_type = None
         self.detail_mode_fielding_position = None
         self.mode = "detail"
@@ -1609,7 +2326,6 @@ class RetrosheetEditor:
         self.selected_modifier_group = None
         self.selected_modifiers = []
         self.modifier_param_request = None
-        self.current_modifier_options_keymap = {}
         self.modifiers_live_applied = False
         # Initialize pickoff-specific state
         self.detail_pickoff_base = None  # '1','2','3' or 'H' for home
@@ -1627,180 +2343,162 @@ class RetrosheetEditor:
         self.oa_out = False
         self.oa_dest = None
         self.oa_fielders = []
-        # SB builder (toggle set of bases)
-        self.sb_targets = set()
-        # Ensure flags exist for PB/WP pitch-triggered flow
-        if not hasattr(self, "detail_mode_from_pitch_pb_wp"):
-            self.detail_mode_from_pitch_pb_wp = False
-            self.detail_mode_pb_wp_code = None
+        # SB builder (toggled bits of _SB_TARGET_BITS)
+        self.sb_mask = 0
 
     def _handle_detail_mode_input(self, key: str) -> None:
         """Handle input in detail mode."""
-        # Handle different types of plays
-        if self.detail_mode_result in ["OUT", "GDP", "LDP", "TP", "FO", "UO"]:
-            # Out types need out type and fielding positions (K allows optional fielders)
-            if self.detail_mode_out_type is None and key in self.out_type_hotkeys:
-                self.detail_mode_out_type = self.out_type_hotkeys[key]
-            elif (
-                self.detail_mode_out_type is not None
+        # Results without their own builder (hits, errors, sacrifices) take a
+        # hit type and fielding position
+        handler = self._detail_input_handlers.get(
+            self.detail_mode_result, self._handle_hit_detail_input
+        )
+        handler(key)
+
+    def _handle_out_detail_input(self, key: str) -> None:
+        """Outs need an out type and fielding positions (optional for K)."""
+        if self.detail_mode_out_type is None and (
+            out_type := ascii_lookup(self.out_type_hotkey_table, key)
+        ):
+            self.detail_mode_out_type = out_type
+        elif (
+            self.detail_mode_out_type is not None
+            and key in self.fielding_position_hotkeys
+        ):
+            # Add fielding position to the list (always allowed; optional for K)
+            self.detail_mode_fielders.append(self.fielding_position_hotkeys[key])
+
+            # Don't automatically save - let user press ENTER when done selecting fielders
+            # This allows for multi-fielder plays like 6-4-3 double plays
+
+    def _handle_pickoff_detail_input(self, key: str) -> None:
+        """Pickoffs need a base and a fielder sequence, or an error (PO only)."""
+        if self.detail_pickoff_base is None:
+            # Select base: PO -> 1/2/3, POCS -> 2/3/4 (4 represents home 'H')
+            if key in _OCCUPIED_BASE_KEYS and self.detail_mode_result == "PO":
+                self.detail_pickoff_base = key
+            elif key in _STEAL_BASE_KEYS and self.detail_mode_result in _STEAL_RESULTS:
+                self.detail_pickoff_base = "H" if key == "4" else key
+        else:
+            # If awaiting error fielder for PO
+            if (
+                self.detail_mode_result == "PO"
+                and self.detail_pickoff_awaiting_error_fielder
                 and key in self.fielding_position_hotkeys
             ):
-                # Add fielding position to the list (always allowed; optional for K)
-                self.detail_mode_fielders.append(self.fielding_position_hotkeys[key])
-
-                # Don't automatically save - let user press ENTER when done selecting fielders
-                # This allows for multi-fielder plays like 6-4-3 double plays
-        elif self.detail_mode_result in ["PO", "POCS", "CS"]:
-            # Pickoffs require base selection and either a fielder sequence (for outs) or error (PO only)
-            if self.detail_pickoff_base is None:
-                # Select base: PO -> 1/2/3, POCS -> 2/3/4 (4 represents home 'H')
-                if key in ["1", "2", "3"] and self.detail_mode_result == "PO":
-                    self.detail_pickoff_base = key
-                elif key in ["2", "3", "4"] and self.detail_mode_result in [
-                    "POCS",
-                    "CS",
-                ]:
-                    self.detail_pickoff_base = "H" if key == "4" else key
-            else:
-                # If awaiting error fielder for PO
-                if (
-                    self.detail_mode_result == "PO"
-                    and self.detail_pickoff_awaiting_error_fielder
-                    and key in self.fielding_position_hotkeys
-                ):
-                    self.detail_pickoff_error_fielder = self.fielding_position_hotkeys[
-                        key
-                    ]
-                    self.detail_pickoff_awaiting_error_fielder = False
-                # Start selecting error fielder (PO only). Use 'e' to mark error on next fielder digit
-                elif (
-                    self.detail_mode_result == "PO"
-                    and key == "e"
-                    and self.detail_pickoff_error_fielder is None
-                ):
-                    self.detail_pickoff_awaiting_error_fielder = True
-                # Otherwise collect fielder sequence digits
-                elif key in self.fielding_position_hotkeys:
-                    self.detail_pickoff_fielders.append(
-                        self.fielding_position_hotkeys[key]
-                    )
-        elif self.detail_mode_result in ["BK", "DI", "PB", "WP", "SB", "OA"]:
-            # Runner advancement builder
-            if self.detail_mode_result == "SB":
-                # Toggle stolen base tokens SB2/SB3/SBH using keys 2,3,4/H
-                if key in ["2", "3", "4", "h"]:
-                    target = "H" if key in ["4", "h"] else key
-                    if target in self.sb_targets:
-                        self.sb_targets.remove(target)
-                    else:
-                        self.sb_targets.add(target)
-                # ENTER handled in main loop to save
-            elif self.detail_mode_result in ["BK", "DI", "PB", "WP"]:
-                # Simple advance: choose from base then destination
-                # If a strikeout was already recorded for this play, allow batter (B) -> 1
-                current_game = self.event_file.games[self.current_game_index]
-                current_play = current_game.plays[self.current_play_index]
-                is_strikeout_recorded = bool(
-                    (current_play.play_description or "").startswith("K")
-                )
-                if self.advance_from_base is None:
-                    if key in ["1", "2", "3"]:
-                        self.advance_from_base = key
-                    elif is_strikeout_recorded and key in ["b", "B"]:
-                        self.advance_from_base = "B"
-                elif self.advance_from_base is not None:
-                    from_b = self.advance_from_base
-                    if from_b == "1" and key == "2":
-                        self.runner_tokens.append("1-2")
-                        self.advance_from_base = None
-                    elif from_b == "2" and key == "3":
-                        self.runner_tokens.append("2-3")
-                        self.advance_from_base = None
-                    elif from_b == "3" and key in ["4", "h"]:
-                        self.runner_tokens.append("3-H")
-                        self.advance_from_base = None
-                    elif from_b == "B" and key in ["1", "2", "3", "4", "h"]:
-                        dest = {
-                            "1": "1",
-                            "2": "2",
-                            "3": "3",
-                            "4": "H",
-                            "h": "H",
-                        }[key]
-                        self.runner_tokens.append(f"B-{dest}")
-                        self.advance_from_base = None
-            else:  # OA builder
-                if self.oa_stage == "choose_runner" and key in ["1", "2", "3"]:
-                    self.oa_from_base = key
-                    self.oa_stage = "choose_action"
-                elif self.oa_stage == "choose_action" and key in ["-", "x"]:
-                    self.oa_out = key == "x"
-                    self.oa_stage = "choose_dest"
-                elif self.oa_stage == "choose_dest":
-                    if self.oa_from_base == "1" and key == "2":
-                        self.oa_dest = "2"
-                    elif self.oa_from_base == "2" and key == "3":
-                        self.oa_dest = "3"
-                    elif self.oa_from_base == "3" and key in ["4", "h"]:
-                        self.oa_dest = "H"
-                    if self.oa_dest:
-                        if self.oa_out:
-                            self.oa_stage = "choose_fielders"
-                            self.oa_fielders = []
-                        else:
-                            # finalize simple advance token
-                            self.runner_tokens.append(
-                                f"{self.oa_from_base}-{self.oa_dest}"
-                            )
-                            # reset OA builder
-                            self.oa_stage = "choose_runner"
-                            self.oa_from_base = None
-                            self.oa_out = False
-                            self.oa_dest = None
-                    # else: wait for valid dest
-                elif self.oa_stage == "choose_fielders":
-                    if key in self.fielding_position_hotkeys:
-                        self.oa_fielders.append(self.fielding_position_hotkeys[key])
-                    elif key in ["\r", "\n"]:
-                        # require at least one fielder
-                        if not self.oa_fielders:
-                            return
-                        seq = "".join(map(str, self.oa_fielders))
-                        self.runner_tokens.append(
-                            f"{self.oa_from_base}X{self.oa_dest}({seq})"
-                        )
-                        # reset OA builder
-                        self.oa_stage = "choose_runner"
-                        self.oa_from_base = None
-                        self.oa_out = False
-                        self.oa_dest = None
-                        self.oa_fielders = []
-        else:
-            # Regular hits need hit type and fielding position
-            if key in self.hit_type_hotkeys:
-                self.detail_mode_hit_type = self.hit_type_hotkeys[key]
+                self.detail_pickoff_error_fielder = self.fielding_position_hotkeys[key]
+                self.detail_pickoff_awaiting_error_fielder = False
+            # Start selecting error fielder (PO only). Use 'e' to mark error on next fielder digit
             elif (
-                self.detail_mode_hit_type is not None
-                and key in self.fielding_position_hotkeys
+                self.detail_mode_result == "PO"
+                and key == "e"
+                and self.detail_pickoff_error_fielder is None
             ):
-                # For hits, we only need one fielding position
-                self.detail_mode_fielders.append(self.fielding_position_hotkeys[key])
+                self.detail_pickoff_awaiting_error_fielder = True
+            # Otherwise collect fielder sequence digits
+            elif key in self.fielding_position_hotkeys:
+                self.detail_pickoff_fielders.append(self.fielding_position_hotkeys[key])
+
+    def _handle_stolen_base_detail_input(self, key: str) -> None:
+        """Toggle stolen base tokens SB2/SB3/SBH using keys 2,3,4/H."""
+        if key in _SB_KEY_BITS:
+            self.sb_mask ^= _SB_KEY_BITS[key]
+        # ENTER handled in main loop to save
+
+    def _handle_simple_advance_detail_input(self, key: str) -> None:
+        """Simple advance (BK/DI/PB/WP): choose from base then destination."""
+        if self.advance_from_base is None:
+            if key in _OCCUPIED_BASE_KEYS:
+                self.advance_from_base = key
+            # If a strikeout was already recorded for this play, allow batter (B) -> 1
+            elif key in _BATTER_KEYS and self._strikeout_recorded():
+                self.advance_from_base = "B"
+        elif token := _ADVANCE_TOKENS.get((self.advance_from_base, key)):
+            self.runner_tokens.append(token)
+            self.advance_from_base = None
+
+    def _strikeout_recorded(self, current_game: Optional[Game] = None) -> bool:
+        """Return True if the current play's result is already a strikeout."""
+        if current_game is None:
+            current_game = self.event_file.games[self.current_game_index]
+        current_play = current_game.plays[self.current_play_index]
+        return current_play.play_description.startswith("K")
+
+    def _handle_oa_detail_input(self, key: str) -> None:
+        """OA builder: runner, advance or out, destination, then fielders for outs."""
+        if self.oa_stage == "choose_runner" and key in _OCCUPIED_BASE_KEYS:
+            self.oa_from_base = key
+            self.oa_stage = "choose_action"
+        elif self.oa_stage == "choose_action" and key in _OA_ACTION_KEYS:
+            self.oa_out = key == "x"
+            self.oa_stage = "choose_dest"
+        elif self.oa_stage == "choose_dest":
+            if dest := _NEXT_BASE_DESTINATIONS.get((self.oa_from_base, key)):
+                self.oa_dest = dest
+            if self.oa_dest:
+                if self.oa_out:
+                    self.oa_stage = "choose_fielders"
+                    self.oa_fielders = []
+                else:
+                    # finalize simple advance token
+                    self.runner_tokens.append(f"{self.oa_from_base}-{self.oa_dest}")
+                    # reset OA builder
+                    self.oa_stage = "choose_runner"
+                    self.oa_from_base = None
+                    self.oa_out = False
+                    self.oa_dest = None
+            # else: wait for valid dest
+        elif self.oa_stage == "choose_fielders":
+            if key in self.fielding_position_hotkeys:
+                self.oa_fielders.append(self.fielding_position_hotkeys[key])
+            elif key in _ENTER_KEYS:
+                # require at least one fielder
+                if not self.oa_fielders:
+                    return
+                seq = _fielder_sequence(self.oa_fielders)
+                self.runner_tokens.append(f"{self.oa_from_base}X{self.oa_dest}({seq})")
+                # reset OA builder
+                self.oa_stage = "choose_runner"
+                self.oa_from_base = None
+                self.oa_out = False
+                self.oa_dest = None
+                self.oa_fielders = []
+
+    def _handle_hit_detail_input(self, key: str) -> None:
+        """Regular hits need hit type and fielding position."""
+        hit_type = ascii_lookup(self.hit_type_hotkey_table, key)
+        if hit_type:
+            self.detail_mode_hit_type = hit_type
+        elif (
+            self.detail_mode_hit_type is not None
+            and key in self.fielding_position_hotkeys
+        ):
+            # For hits, we only need one fielding position
+            self.detail_mode_fielders.append(self.fielding_position_hotkeys[key])
 
-                # Automatically save and progress to next batter when both selections are complete
-                if (
-                    self.detail_mode_result
-                    and self.detail_mode_hit_type
-                    and self.detail_mode_fielders
-                ):
-                    self._save_detail_mode_result()
+            # Automatically save and progress to next batter when both selections are complete
+            if (
+                self.detail_mode_result
+                and self.detail_mode_hit_type
+                and self.detail_mode_fielders
+            ):
+                self._save_detail_mode_result()
+
+    def _apply_new_play_description(self, play: Play, new_base: str) -> None:
+        """Replace the play's result, keeping any runner-advancement suffix.
+
+        A suffix such as "+PB.2-3" appended by a prior PB/WP survives the edit.
+        """
+        _, plus, suffix = (play.play_description or "").partition("+")
+        play.play_description = new_base + plus + suffix if plus else new_base
 
     def _save_detail_mode_result(self) -> None:
         """Save the detailed play result and exit detail mode."""
         # Handle pickoffs and caught stealing (PO, POCS, CS)
-        if self.detail_mode_result in ["PO", "POCS", "CS"]:
+        if self.detail_mode_result in PICKOFF_RESULTS:
             # Validate selections
             if not self.detail_pickoff_base:
-                self.console.print(
+                self._set_status(
                     "Please select the base (1/2/3 for PO; 2/3/H for POCS/CS)",
                     style="yellow",
                 )
@@ -1811,7 +2509,7 @@ class RetrosheetEditor:
                     self.detail_pickoff_error_fielder is None
                     and not self.detail_pickoff_fielders
                 ):
-                    self.console.print(
+                    self._set_status(
                         "Select fielder sequence (e.g., 13) or mark error with 'E' then fielder.",
                         style="yellow",
                     )
@@ -1819,24 +2517,24 @@ class RetrosheetEditor:
                 if self.detail_pickoff_error_fielder is not None:
                     desc = f"PO{self.detail_pickoff_base}(E{self.detail_pickoff_error_fielder})"
                 else:
-                    seq = "".join(str(f) for f in self.detail_pickoff_fielders)
+                    seq = _fielder_sequence(self.detail_pickoff_fielders)
                     desc = f"PO{self.detail_pickoff_base}({seq})"
             elif self.detail_mode_result == "POCS":
                 if not self.detail_pickoff_fielders:
-                    self.console.print(
+                    self._set_status(
                         "Select fielder sequence for POCS (e.g., 1361)", style="yellow"
                     )
                     return
-                seq = "".join(str(f) for f in self.detail_pickoff_fielders)
+                seq = _fielder_sequence(self.detail_pickoff_fielders)
                 base_token = self.detail_pickoff_base
                 desc = f"POCS{base_token}({seq})"
             else:  # CS
                 if not self.detail_pickoff_fielders:
-                    self.console.print(
+                    self._set_status(
                         "Select fielder sequence for CS (e.g., 26)", style="yellow"
                     )
                     return
-                seq = "".join(str(f) for f in self.detail_pickoff_fielders)
+                seq = _fielder_sequence(self.detail_pickoff_fielders)
                 base_token = self.detail_pickoff_base
                 desc = f"CS{base_token}({seq})"
 
@@ -1854,36 +2552,31 @@ class RetrosheetEditor:
             return
 
         # Handle runner advancement events (BK, DI, PB, WP, SB, OA)
-        if self.detail_mode_result in ["BK", "DI", "PB", "WP", "SB", "OA"]:
+        if self.detail_mode_result in RUNNER_ADVANCE_RESULTS:
             # Build description string
             current_game = self.event_file.games[self.current_game_index]
             current_play = current_game.plays[self.current_play_index]
             self._save_state_for_undo()
             if self.detail_mode_result == "SB":
                 # From toggled set
-                if not self.sb_targets:
-                    self.console.print(
-                        "Select at least one stolen base", style="yellow"
-                    )
+                if not self.sb_mask:
+                    self._set_status("Select at least one stolen base", style="yellow")
                     return
                 # produce stable order 2,3,H
-                parts = []
-                for b in ["2", "3", "H"]:
-                    if b in self.sb_targets:
-                        parts.append(f"SB{b}")
-                desc = ";".join(parts)
+                desc = ";".join(_stolen_base_tokens(self.sb_mask))
                 current_play.play_description = desc
             else:
                 # For BK/DI/PB/WP/OA use CODE.<tokens>
                 if not self.runner_tokens:
-                    self.console.print(
+                    self._set_status(
                         "Add at least one runner advance (e.g., 1-2)", style="yellow"
                     )
                     return
                 # If PB/WP was initiated from pitch entry, append as a suffix
                 # to the existing play result: "+PB.2-3" or "+WP.1-2;3-H".
-                if self.detail_mode_result in ["PB", "WP"] and getattr(
-                    self, "detail_mode_from_pitch_pb_wp", False
+                if (
+                    self.detail_mode_result in _PB_WP_RESULTS
+                    and self.detail_mode_from_pitch_pb_wp
                 ):
                     suffix = (
                         "+"
@@ -1903,13 +2596,12 @@ class RetrosheetEditor:
             self._reset_detail_mode()
             self.mode = "pitch"
             # Reset PB/WP pitch-trigger flag after saving advances
-            if hasattr(self, "detail_mode_from_pitch_pb_wp"):
-                self.detail_mode_from_pitch_pb_wp = False
-                self.detail_mode_pb_wp_code = None
+            self.detail_mode_from_pitch_pb_wp = False
+            self.detail_mode_pb_wp_code = None
             return
 
         # Check if we have the required selections based on play type
-        if self.detail_mode_result in ["OUT", "GDP", "LDP", "TP", "FO", "UO"]:
+        if self.detail_mode_result in OUT_RESULTS:
             # Out types need out type and fielding positions
             if (
                 self.detail_mode_result
@@ -1930,11 +2622,7 @@ class RetrosheetEditor:
                 # Save state before making changes
                 self._save_state_for_undo()
 
-                # Preserve any previously appended runner-advancement suffix (e.g., +PB.2-3)
-                existing = current_play.play_description or ""
-                suffix_idx = existing.find("+")
-                suffix = existing[suffix_idx:] if suffix_idx != -1 else ""
-                current_play.play_description = play_description + suffix
+                self._apply_new_play_description(current_play, play_description)
                 # Append 'X' to pitches for balls put in play on outs, except strikeouts
                 if self.detail_mode_out_type != "K":
                     self._ensure_ball_in_play_marker()
@@ -1953,10 +2641,10 @@ class RetrosheetEditor:
                 self.hit_location_depth = ""
                 self.hit_location_foul = False
             else:
-                self.console.print(
+                self._set_status(
                     "Please complete all detail selections", style="yellow"
                 )
-        elif self.detail_mode_result in ["SF", "SH"]:
+        elif self.detail_mode_result in _SACRIFICE_RESULTS:
             # Sacrifice plays need hit type and fielding positions
             if (
                 self.detail_mode_result
@@ -1977,11 +2665,7 @@ class RetrosheetEditor:
                 # Save state before making changes
                 self._save_state_for_undo()
 
-                # Preserve any previously appended runner-advancement suffix (e.g., +PB.2-3)
-                existing = current_play.play_description or ""
-                suffix_idx = existing.find("+")
-                suffix = existing[suffix_idx:] if suffix_idx != -1 else ""
-                current_play.play_description = play_description + suffix
+                self._apply_new_play_description(current_play, play_description)
                 # Append 'X' to pitches for balls put in play on sacrifice plays
                 self._ensure_ball_in_play_marker()
                 current_play.edited = True
@@ -1995,7 +2679,7 @@ class RetrosheetEditor:
                 self.advance_runner_active = True
                 self.advance_runner_from_base = None
             else:
-                self.console.print(
+                self._set_status(
                     "Please complete all detail selections", style="yellow"
                 )
         else:
@@ -2017,11 +2701,7 @@ class RetrosheetEditor:
                 # Save state before making changes
                 self._save_state_for_undo()
 
-                # Preserve any previously appended runner-advancement suffix (e.g., +PB.2-3)
-                existing = current_play.play_description or ""
-                suffix_idx = existing.find("+")
-                suffix = existing[suffix_idx:] if suffix_idx != -1 else ""
-                current_play.play_description = play_description + suffix
+                self._apply_new_play_description(current_play, play_description)
                 # Append 'X' to pitches for balls put in play on hits
                 self._ensure_ball_in_play_marker()
                 current_play.edited = True
@@ -2039,7 +2719,7 @@ class RetrosheetEditor:
                 self.hit_location_depth = ""
                 self.hit_location_foul = False
             else:
-                self.console.print(
+                self._set_status(
                     "Please complete all detail selections", style="yellow"
                 )
 
@@ -2055,54 +2735,18 @@ class RetrosheetEditor:
             fielding_position = fielders[0] if fielders else 0
             fielders_list = fielders
 
-        if result == "S":  # Single
-            return (
-                f"S/{hit_type}"
-                if fielding_position <= 0
-                else f"S{fielding_position}/{hit_type}"
-            )
-        elif result == "D":  # Double
-            return (
-                f"D/{hit_type}"
-                if fielding_position <= 0
-                else f"D{fielding_position}/{hit_type}"
-            )
-        elif result == "T":  # Triple
-            return (
-                f"T/{hit_type}"
-                if fielding_position <= 0
-                else f"T{fielding_position}/{hit_type}"
-            )
-        elif result == "HR":  # Home run
-            return f"HR/{hit_type}" if fielding_position <= 0 else f"HR/{hit_type}"
-        elif result == "E":  # Error
-            return (
-                f"E/{hit_type}"
-                if fielding_position <= 0
-                else f"E{fielding_position}/{hit_type}"
-            )
-        elif result == "FC":  # Fielder's choice
-            return (
-                f"FC/{hit_type}"
-                if fielding_position <= 0
-                else f"FC{fielding_position}/{hit_type}"
-            )
-        elif result == "SF":  # Sacrifice fly
-            return (
-                f"SF/{hit_type}"
-                if fielding_position <= 0
-                else f"SF{fielding_position}/{hit_type}"
-            )
-        elif result == "SH":  # Sacrifice bunt
-            return (
-                f"SH/{hit_type}"
-                if fielding_position <= 0
-                else f"SH{fielding_position}/{hit_type}"
-            )
-        elif result in ["OUT", "GDP", "LDP", "TP", "FO", "UO"]:
+        # Hits, errors, fielder's choices and sacrifices share one template;
+        # home runs never name a fielder
+        if result in _FIELDED_RESULTS:
+            if fielding_position <= 0:
+                return f"{result}/{hit_type}"
+            return f"{result}{fielding_position}/{hit_type}"
+        elif result == "HR":
+            return f"HR/{hit_type}"
+        elif result in OUT_RESULTS:
             # New formatting for outs: fielders first, then out type(s)
             out_type = hit_type  # may be base (G/L/F/P/B/SF/SH/K/FC/DP) or special (FO/UO/GDP/LDP/TP)
-            fielder_string = "".join(str(f) for f in fielders_list)
+            fielder_string = _fielder_sequence(fielders_list)
             # Strikeout special case: K with optional immediate fielder sequence (e.g., K23)
             if out_type == "K":
                 return "K" + (fielder_string if fielder_string else "")
@@ -2114,7 +2758,7 @@ class RetrosheetEditor:
                 tokens.append(out_type)
 
             # Append the specific result modifier if applicable and not duplicated
-            if result in ["FO", "UO", "GDP", "LDP", "TP"] and result != out_type:
+            if result in _OUT_TYPE_RESULTS and result != out_type:
                 tokens.append(result)
 
             return "/".join(tokens)
@@ -2133,7 +2777,6 @@ class RetrosheetEditor:
         self.selected_modifier_group = None
         self.selected_modifiers = []
         self.modifier_param_request = None
-        self.current_modifier_options_keymap = {}
         self.modifiers_live_applied = False
         # Reset pickoff state
         self.detail_pickoff_base = None
@@ -2148,7 +2791,7 @@ class RetrosheetEditor:
         self.oa_out = False
         self.oa_dest = None
         self.oa_fielders = []
-        self.sb_targets = set()
+        self.sb_mask = 0
         # Reset advance-runner (modifiers UI) state
         self.advance_runner_active = False
         self.advance_runner_from_base = None
@@ -2160,7 +2803,6 @@ class RetrosheetEditor:
         self.selected_modifier_group = None
         self.selected_modifiers = []
         self.modifier_param_request = None
-        self.current_modifier_options_keymap = {}
         self.modifiers_live_applied = True  # enable live append behavior
 
     def _handle_modifier_mode_input(self, key: str) -> None:
@@ -2171,9 +2813,8 @@ class RetrosheetEditor:
                 return
 
         # Finish and apply modifiers (only when not inside a wizard)
-        if key in ["\r", "\n"] and not (
-            self.selected_modifier_group == "r"
-            and getattr(self, "advance_runner_active", False)
+        if key in _ENTER_KEYS and not (
+            self.selected_modifier_group == "r" and self.advance_runner_active
         ):
             self._apply_modifiers_to_current_play()
             # Return to pitch mode after applying modifiers
@@ -2185,112 +2826,93 @@ class RetrosheetEditor:
         if key == "0":
             self.selected_modifier_group = None
             self.modifier_param_request = None
-            self.current_modifier_options_keymap = {}
             return
 
         # If awaiting a parameter for a modifier
         if self.modifier_param_request:
-            code = self.modifier_param_request["code"]
-            if (
-                self.modifier_param_request["type"] == "fielder"
-                and key in self.fielding_position_hotkeys
-            ):
-                suffix = str(self.fielding_position_hotkeys[key])
-                resolved = code.replace("$", suffix)
-                self._append_modifier_to_current_play(resolved)
-                self.modifier_param_request = None
-            elif self.modifier_param_request["type"] == "base" and key in [
-                "1",
-                "2",
-                "3",
-                "4",
-            ]:
-                resolved = code.replace("%", key)
-                self._append_modifier_to_current_play(resolved)
+            value = _MODIFIER_PARAM_VALUES[self.modifier_param_request["type"]].get(key)
+            if value is not None:
+                template = self.modifier_param_templates[
+                    self.modifier_param_request["code"]
+                ].template
+                self._append_modifier_to_current_play(template.format(value))
                 self.modifier_param_request = None
             return
 
         # Choose group
         if self.selected_modifier_group is None:
-            if key in self.modifier_groups:
+            if key in self.modifier_group_titles:
                 self.selected_modifier_group = key
-                # Initialize Hit Location builder state if chosen
-                if key == "h":
-                    self.hit_location_active = True
-                    self.hit_location_positions = ""
-                    self.hit_location_suffix = ""
-                    self.hit_location_depth = ""
-                elif key == "r":
-                    # Start Advance Runner builder inside modifiers UI
-                    self.advance_runner_active = True
-                    self.advance_runner_from_base = None
-                return
+                # Groups with a builder start it here
+                if hook := self._modifier_group_hooks.get(key):
+                    hook()
             return
 
         # Choose option within group
-        if key in self.current_modifier_options_keymap:
-            code = self.current_modifier_options_keymap[key]
+        code = self.modifier_keymaps[self.selected_modifier_group].get(key)
+        if code is not None:
             # Codes that require parameter
-            if code == "E$":
-                self.modifier_param_request = {"code": "E$", "type": "fielder"}
-            elif code == "R$":
-                self.modifier_param_request = {"code": "R$", "type": "fielder"}
-            elif code == "TH%":
-                self.modifier_param_request = {"code": "TH%", "type": "base"}
+            param = self.modifier_param_templates.get(code)
+            if param is not None:
+                self.modifier_param_request = {"code": code, "type": param.kind}
             else:
                 self._append_modifier_to_current_play(code)
         # Any other key ignored
 
-        # Handle Advance Runner wizard keys
         if self.selected_modifier_group == "r" and self.advance_runner_active:
-            # Back to groups
-            if key == "0":
-                self.selected_modifier_group = None
-                self.advance_runner_active = False
-                self.advance_runner_from_base = None
-                return
-            # Save/apply tokens to play and remain in modifiers UI
-            if key in ["\r", "\n"]:
-                if self.advance_runner_tokens:
-                    current_game = self.event_file.games[self.current_game_index]
-                    current_play = current_game.plays[self.current_play_index]
-                    if current_play.play_description:
-                        if "." in current_play.play_description:
-                            current_play.play_description += ";" + ";".join(
-                                self.advance_runner_tokens
-                            )
-                        else:
-                            current_play.play_description += "." + ";".join(
-                                self.advance_runner_tokens
-                            )
-                        current_play.edited = True
-                        self._save_current_state()
-                self.advance_runner_active = False
+            self._handle_advance_runner_input(key)
+
+    def _start_hit_location_group(self) -> None:
+        """Initialize Hit Location builder state when its group is chosen."""
+        self.hit_location_active = True
+        self.hit_location_positions = ""
+        self.hit_location_suffix = ""
+        self.hit_location_depth = ""
+
+    def _start_advance_runner_group(self) -> None:
+        """Start Advance Runner builder inside modifiers UI."""
+        self.advance_runner_active = True
+        self.advance_runner_from_base = None
+
+    def _handle_advance_runner_input(self, key: str) -> None:
+        """Handle Advance Runner wizard keys."""
+        # Back to groups
+        if key == "0":
+            self.selected_modifier_group = None
+            self.advance_runner_active = False
+            self.advance_runner_from_base = None
+            return
+        # Save/apply tokens to play and remain in modifiers UI
+        if key in _ENTER_KEYS:
+            if self.advance_runner_tokens:
+                current_play = self._current_play()
+                description = current_play.play_description
+                if description:
+                    separator = ";" if "." in description else "."
+                    current_play.play_description = (
+                        description + separator + ";".join(self.advance_runner_tokens)
+                    )
+                    current_play.edited = True
+                    self._save_current_state()
+            self.advance_runner_active = False
+            self.advance_runner_from_base = None
+            self.advance_runner_tokens = []
+            self.selected_modifier_group = None
+            return
+        # Choose from-base
+        if self.advance_runner_from_base is None and key in _OCCUPIED_BASE_KEYS:
+            self.advance_runner_from_base = key
+            return
+        # Choose dest based on from-base; allow explicitly no-advance token like 3-3
+        if self.advance_runner_from_base is not None:
+            fb = self.advance_runner_from_base
+            dest = _RUNNER_DESTINATIONS[fb].get(key)
+            if dest:
+                token = f"{fb}-{dest}"
+                self.advance_runner_tokens.append(token)
                 self.advance_runner_from_base = None
-                self.advance_runner_tokens = []
-                self.selected_modifier_group = None
-                return
-            # Choose from-base
-            if self.advance_runner_from_base is None and key in ["1", "2", "3"]:
-                self.advance_runner_from_base = key
-                return
-            # Choose dest based on from-base; allow explicitly no-advance token like 3-3
-            if self.advance_runner_from_base is not None:
-                fb = self.advance_runner_from_base
-                dest = None
-                if fb == "1" and key in ["1", "2"]:
-                    dest = "2" if key == "2" else "1"
-                elif fb == "2" and key in ["2", "3"]:
-                    dest = "3" if key == "3" else "2"
-                elif fb == "3" and key in ["3", "4", "h"]:
-                    dest = "H" if key in ["4", "h"] else "3"
-                if dest:
-                    token = f"{fb}-{dest}"
-                    self.advance_runner_tokens.append(token)
-                    self.advance_runner_from_base = None
-                return
 
-    def _render_hit_location_builder(self, controls_text: Text) -> None:
+    def _render_hit_location_builder(self, controls_text: ControlsText) -> None:
         """Render the Hit Location builder UI inside the modifiers panel."""
         # Positions
         pos_display = self.hit_location_positions or "(none)"
@@ -2298,9 +2920,9 @@ class RetrosheetEditor:
         controls_text.append(f"{pos_display}\n")
 
         # M / L toggles based on positions
-        allow_m = any(ch in ["4", "6"] for ch in self.hit_location_positions)
+        allow_m = not _MIDFIELD_POSITIONS.isdisjoint(self.hit_location_positions)
         # L only applies for exactly 7 or 9, not multi-position like 78 or 89
-        allow_l = self.hit_location_positions in ["7", "9"]
+        allow_l = self.hit_location_positions in _FOUL_LINE_POSITIONS
 
         if allow_m:
             m_state = "ON" if self.hit_location_suffix == "M" else "OFF"
@@ -2314,7 +2936,7 @@ class RetrosheetEditor:
             controls_text.append(f"{l_state}\n", style="bold cyan")
 
         # Foul territory toggle (for exact positions 2,3,5,7,9 or dual 23/25)
-        allow_f = self.hit_location_positions in ["2", "3", "5", "7", "9", "23", "25"]
+        allow_f = self.hit_location_positions in _FOUL_TERRITORY_POSITIONS
         if allow_f:
             f_state = "ON" if self.hit_location_foul else "OFF"
             controls_text.append(
@@ -2349,14 +2971,14 @@ class RetrosheetEditor:
             return True
 
         # Enter digits for positions (up to 2)
-        if key in [str(d) for d in range(1, 10)]:
+        if key in _POSITION_DIGIT_KEYS:
             if len(self.hit_location_positions) < 2:
                 self.hit_location_positions += key
             return True
 
         # Toggle M (only when positions include 4 or 6)
         if key == "m":
-            if any(ch in ["4", "6"] for ch in self.hit_location_positions):
+            if not _MIDFIELD_POSITIONS.isdisjoint(self.hit_location_positions):
                 self.hit_location_suffix = (
                     "M" if self.hit_location_suffix != "M" else ""
                 )
@@ -2364,7 +2986,7 @@ class RetrosheetEditor:
 
         # Toggle L (only when positions include 7 or 9)
         if key == "l":
-            if self.hit_location_positions in ["7", "9"]:
+            if self.hit_location_positions in _FOUL_LINE_POSITIONS:
                 self.hit_location_suffix = (
                     "L" if self.hit_location_suffix != "L" else ""
                 )
@@ -2372,7 +2994,7 @@ class RetrosheetEditor:
 
         # Toggle F (only when positions are exactly 2,3,5,7,9, or dual 23/25)
         if key == "f":
-            if self.hit_location_positions in ["2", "3", "5", "7", "9", "23", "25"]:
+            if self.hit_location_positions in _FOUL_TERRITORY_POSITIONS:
                 self.hit_location_foul = not self.hit_location_foul
             return True
 
@@ -2391,7 +3013,7 @@ class RetrosheetEditor:
             return True
 
         # Apply on ENTER if valid
-        if key in ["\r", "\n"]:
+        if key in _ENTER_KEYS:
             # Require at least one position digit
             if not self.hit_location_positions:
                 return True  # ignore until valid
@@ -2417,8 +3039,7 @@ class RetrosheetEditor:
 
     def _append_hit_location_to_current_play(self, code: str) -> None:
         """Append hit location code without a slash separator to the current play."""
-        current_game = self.event_file.games[self.current_game_index]
-        current_play = current_game.plays[self.current_play_index]
+        current_play = self._current_play()
         if not current_play.play_description:
             return
         # If this is the first hit-location append after the hit type token (e.g., after '/G'),
@@ -2426,7 +3047,7 @@ class RetrosheetEditor:
         fielder = self._extract_primary_fielder_from_play_description(
             current_play.play_description
         )
-        tail_after_slash = current_play.play_description.split("/")[-1]
+        tail_after_slash = current_play.play_description.rpartition("/")[2]
         is_first_append = tail_after_slash in {"G", "L", "F", "P", "B"}
         # Prefix the primary fielder only for infielders (1-6); for outfielders (7-9), don't prefix
         should_prefix = (
@@ -2449,7 +3070,7 @@ class RetrosheetEditor:
         - HR/F -> None (no fielder)
         """
         # Match leading letters, then capture digits before the first '/'
-        match = re.match(r"^[A-Z]+(\d+)/", desc)
+        match = _PRIMARY_FIELDER_RE.match(desc)
         if match:
             digits = match.group(1)
             # Only return the first digit (positions are 1..9)
@@ -2463,8 +3084,7 @@ class RetrosheetEditor:
         """Append selected modifiers to the current play description and save."""
         if self.modifiers_live_applied or not self.selected_modifiers:
             return
-        current_game = self.event_file.games[self.current_game_index]
-        current_play = current_game.plays[self.current_play_index]
+        current_play = self._current_play()
         current_play.play_description = (
             current_play.play_description or ""
         ) + self._format_modifiers_suffix()
@@ -2474,8 +3094,7 @@ class RetrosheetEditor:
     def _append_modifier_to_current_play(self, code: str) -> None:
         """Append a single modifier code immediately to the current play and record it for UI."""
         self.selected_modifiers.append(code)
-        current_game = self.event_file.games[self.current_game_index]
-        current_play = current_game.plays[self.current_play_index]
+        current_play = self._current_play()
         # Ensure there is a primary result
         if not current_play.play_description:
             return
@@ -2493,75 +3112,52 @@ class RetrosheetEditor:
         # Ensure codes are space-free and already replacement-handled
         return "/" + "/".join(self.selected_modifiers)
 
-    def _add_modifier_options_wrapped(self, controls_text: Text, codes: list) -> None:
-        """Render modifier options on wrapped rows within a max width, building keymap a..z."""
-        # Reset keymap for current group view
-        self.current_modifier_options_keymap = {}
-
+    def _add_modifier_options_wrapped(
+        self, controls_text: ControlsText, options: Sequence[Tuple[str, str]]
+    ) -> None:
+        """Render modifier options on wrapped rows within a max width, lettered a..z."""
         max_width = min(self.console.width, 120)
         available_width = (
             max_width - 6
         )  # account for indentation and panel borders/padding
 
-        current_row = []
-        current_row_width = 0
-
-        letter_ord = ord("a")
-        for code in codes:
-            key_char = chr(letter_ord)
-            self.current_modifier_options_keymap[key_char] = code
-            desc = self.modifier_descriptions.get(code, code)
-            entry = f"[{key_char.upper()}] {code} - {desc}"
-
-            entry_width = len(entry)
-            spacing_width = 2 if current_row else 0
-            total_entry_width = entry_width + spacing_width
-
-            if current_row_width + total_entry_width <= available_width:
-                current_row.append(entry)
-                current_row_width += total_entry_width
-            else:
-                if current_row:
-                    controls_text.append("  " + "  ".join(current_row) + "\n")
-                current_row = [entry]
-                current_row_width = entry_width
-
-            letter_ord += 1
-
-        if current_row:
-            controls_text.append("  " + "  ".join(current_row) + "\n")
+        # Option tuples are module-level constants, cached like the hotkey rows
+        cache_key = (id(options), available_width)
+        entry = self._hotkey_layout_cache.get(cache_key)
+        if entry is None or entry[0] is not options:
+            # Options are keyed a..z in order; the keys are shown in upper case
+            entries = [
+                f"[{key_char}] {code} - {desc}"
+                for key_char, (code, desc) in zip(string.ascii_uppercase, options)
+            ]
+            entry = self._hotkey_layout_cache[cache_key] = (
+                options,
+                None,
+                _pack_rows(entries, available_width),
+            )
+        if entry[2]:
+            controls_text.append(entry[2])
 
-    def _add_modifier_group_controls_wrapped(self, controls_text: Text) -> None:
+    def _add_modifier_group_controls_wrapped(self, controls_text: ControlsText) -> None:
         """Render the modifier group list wrapped across lines within a max width."""
         max_width = min(self.console.width, 120)
         available_width = (
             max_width - 6
         )  # account for indentation and panel borders/padding
 
-        # Build entries like "[B] Ball Types"
-        entries = []
-        for key, (name, _) in self.modifier_groups.items():
-            entries.append(f"[{str(key).upper()}] {name}")
-
-        current_row = []
-        current_row_width = 0
-
-        for entry in entries:
-            entry_width = len(entry)
-            spacing_width = 2 if current_row else 0
-            total_entry_width = entry_width + spacing_width
-
-            if current_row_width + total_entry_width <= available_width:
-                current_row.append(entry)
-                current_row_width += total_entry_width
-            else:
-                if current_row:
-                    controls_text.append("  " + "  ".join(current_row) + "\n")
-                current_row = [entry]
-                current_row_width = entry_width
-
-        if current_row:
-            controls_text.append("  " + "  ".join(current_row) + "\n")
+        groups = self.modifier_group_titles_ordered
+        cache_key = (id(groups), available_width)
+        entry = self._hotkey_layout_cache.get(cache_key)
+        if entry is None or entry[0] is not groups:
+            # Build entries like "[B] Ball Types"
+            entries = [f"[{str(key).upper()}] {name}" for key, name in groups]
+            entry = self._hotkey_layout_cache[cache_key] = (
+                groups,
+                None,
+                _pack_rows(entries, available_width),
+            )
+        if entry[2]:
+            controls_text.append(entry[2])
 
     def _enter_pickoff_attempt_wizard(self) -> None:
         """Enter the pickoff attempt wizard."""
@@ -2579,7 +3175,7 @@ class RetrosheetEditor:
                 self.pickoff_attempt_player = "catcher"
         elif self.pickoff_attempt_base is None:
             # Second step: choose base (1, 2, or 3)
-            if key in ["1", "2", "3"]:
+            if key in _OCCUPIED_BASE_KEYS:
                 self.pickoff_attempt_base = key
                 # Complete the wizard and add to pitches
                 self._complete_pickoff_attempt()
@@ -2621,14 +3217,16 @@ class RetrosheetEditor:
         self.pickoff_attempt_base = None
 
 
-def run_editor(event_file_path: Path, output_dir: Path) -> None:
+def run_editor(
+    event_file_path: Path, output_dir: Path, session_file: Optional[str] = None
+) -> None:
     """Run the interactive editor."""
     try:
         # Validate shortcuts before starting the editor
         validate_shortcuts()
 
         event_file = parse_event_file(event_file_path)
-        editor = RetrosheetEditor(event_file, output_dir)
+        editor = RetrosheetEditor(event_file, output_dir, session_file)
         editor.run()
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -20,10 +20,20 @@ from .editor import run_editor
     default=Path("outputs"),
     help="Output directory for edited files",
 )
+@click.option(
+    "--session-file",
+    "-s",
+    help="Save all edited games into this one file in the output directory",
+)
 @click.option(
     "--game-id", "-g", help="Game ID to create new event file (not implemented yet)"
 )
-def main(event_file: Optional[Path], output_dir: Path, game_id: Optional[str]) -> None:
+def main(
+    event_file: Optional[Path],
+    output_dir: Path,
+    session_file: Optional[str],
+    game_id: Optional[str],
+) -> None:
     """
     Interactive Retrosheet event file editor.
 
@@ -51,7 +61,7 @@ def main(event_file: Optional[Path], output_dir: Path, game_id: Optional[str]) -
         click.echo(f"Output directory: {output_dir}")
         click.echo("Starting interactive editor...")
 
-        run_editor(event_file, output_dir)
+        run_editor(event_file, output_dir, session_file)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Parser for Retrosheet event files."""
 
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -142,7 +143,9 @@ class RetrosheetParser:
         if not self.current_game:
             return
 
-        parts = line.split(",")
+        # Counts, pitch sequences, results and batter IDs repeat throughout a
+        # season's files, so keep one shared copy of each
+        parts = [sys.intern(part) for part in line.split(",")]
         if len(parts) < 6:
             return
 
@@ -173,7 +176,7 @@ class RetrosheetParser:
 
         # Store original count and calculate working count for display/logic
         if original_count == "??":
-            count = self._calculate_count(pitches, start_count)
+            count = sys.intern(self._calculate_count(pitches, start_count))
         else:
             count = original_count
 
@@ -1,6 +1,8 @@
 """Writer for Retrosheet event files."""
 
+import io
 from pathlib import Path
+from typing import Iterable
 
 from .models import EventFile, Game
 
@@ -12,9 +14,16 @@ class RetrosheetWriter:
         """Write an event file to disk."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        text = self.format_games(event_file.games)
         with open(output_path, "w", encoding="utf-8") as f:
-            for game in event_file.games:
-                self._write_game(f, game)
+            f.write(text)
+
+    def format_games(self, games: Iterable[Game]) -> str:
+        """Return the event file text for games, without an EventFile wrapper."""
+        buffer = io.StringIO()
+        for game in games:
+            self._write_game(buffer, game)
+        return buffer.getvalue()
 
     def _write_game(self, f, game: Game) -> None:
         """Write a single game to the file."""
@@ -119,3 +128,8 @@ def write_event_file(event_file: EventFile, output_path: Path) -> None:
     """Convenience function to write an event file."""
     writer = RetrosheetWriter()
     writer.write_event_file(event_file, output_path)
+
+
+def format_games(games: Iterable[Game]) -> str:
+    """Convenience function to serialize games to event file text."""
+    return RetrosheetWriter().format_games(games)
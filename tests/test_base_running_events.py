@@ -100,6 +100,19 @@ def test_stolen_base_single_and_double(tmp_path: Path):
     assert play_sb_home.play_description == "SB2;SBH"
 
 
+def test_stolen_base_toggle_order(tmp_path: Path):
+    editor = _make_editor(tmp_path)
+    editor._enter_detail_mode("SB")
+    # Entered out of order; "h" and "4" toggle the same home target
+    editor._handle_detail_mode_input("h")
+    editor._handle_detail_mode_input("3")
+    editor._handle_detail_mode_input("2")
+    editor._handle_detail_mode_input("4")  # toggles home back off
+    editor._save_detail_mode_result()
+    play = editor.event_file.games[0].plays[0]
+    assert play.play_description == "SB2;SB3"
+
+
 def test_out_advancing_simple_and_out_with_fielders(tmp_path: Path):
     # Simple advance OA.2-3
     editor_oa_adv = _make_editor(tmp_path)
@@ -124,3 +137,48 @@ def test_out_advancing_simple_and_out_with_fielders(tmp_path: Path):
     editor_oa_out._save_detail_mode_result()
     play_oa_out = editor_oa_out.event_file.games[0].plays[0]
     assert play_oa_out.play_description == "OA.2X3(25)"
+
+
+def test_runner_builder_state_declared_up_front(tmp_path: Path):
+    editor = _make_editor(tmp_path)
+    # Builder fields exist before any detail workflow has started
+    assert editor.oa_stage == "choose_runner"
+    assert editor.runner_tokens == []
+    assert editor.detail_pickoff_fielders == []
+    assert editor.detail_mode_from_pitch_pb_wp is False
+
+    editor.mode = "detail"
+    editor.detail_mode_result = "OA"
+    panel = editor._create_controls_panel()
+    assert "Select runner base" in panel.renderable.plain
+
+
+def test_new_result_keeps_pitch_advance_suffix(tmp_path: Path):
+    editor = _make_editor(tmp_path)
+    play = editor.event_file.games[0].plays[0]
+
+    play.play_description = "+PB.2-3"
+    editor._apply_new_play_description(play, "S8/L")
+    assert play.play_description == "S8/L+PB.2-3"
+
+    # Replacing the result again keeps the same suffix
+    editor._apply_new_play_description(play, "63/G")
+    assert play.play_description == "63/G+PB.2-3"
+
+    play.play_description = "S8/L"
+    editor._apply_new_play_description(play, "D7/L")
+    assert play.play_description == "D7/L"
+
+
+def test_batter_advance_requires_recorded_strikeout(tmp_path: Path):
+    editor = _make_editor(tmp_path)
+    play = editor.event_file.games[0].plays[0]
+
+    editor._enter_detail_mode("WP")
+    editor._handle_detail_mode_input("b")
+    assert editor.advance_from_base is None
+
+    play.play_description = "K"
+    editor._handle_detail_mode_input("b")
+    editor._handle_detail_mode_input("1")
+    assert editor.runner_tokens == ["B-1"]
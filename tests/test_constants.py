@@ -0,0 +1,41 @@
+"""Tests for the derived lookup tables in constants."""
+
+from retrosheet_buddy.constants import (
+    PITCH_DESCRIPTIONS,
+    PITCH_ENTRIES,
+    PLAY_DESCRIPTIONS,
+    PLAY_HOTKEY_TABLE,
+    PLAY_HOTKEYS,
+    ascii_lookup,
+)
+
+
+def test_repeated_strings_share_one_object():
+    """Strings repeated across tables are interned to a single object."""
+    assert PITCH_DESCRIPTIONS["V"] is PLAY_DESCRIPTIONS["WP"]
+    wild_pitch = next(entry for entry in PITCH_ENTRIES if entry.code == "V")
+    assert wild_pitch.long is PLAY_DESCRIPTIONS["WP"]
+
+
+def test_derived_play_tables_agree():
+    """ASCII tables agree with the forward hotkey table."""
+    for key, code in PLAY_HOTKEYS.items():
+        assert ascii_lookup(PLAY_HOTKEY_TABLE, key) == code
+
+
+def test_all_names_resolve():
+    """Every name in __all__ is importable, including lazily built tables."""
+    from retrosheet_buddy import constants
+
+    for name in constants.__all__:
+        assert hasattr(constants, name), name
+
+
+def test_modifier_keymaps_follow_option_order():
+    """Option letters a, b, c, ... map to codes in display order."""
+    from retrosheet_buddy.constants import MODIFIER_GROUP_OPTIONS, MODIFIER_KEYMAPS
+
+    for group, options in MODIFIER_GROUP_OPTIONS.items():
+        keymap = MODIFIER_KEYMAPS[group]
+        assert list(keymap.values()) == [code for code, _ in options]
+        assert "".join(keymap) == "abcdefghijklmnopqrstuvwxyz"[: len(options)]
@@ -135,3 +135,81 @@ def test_foul_tip_strikeout():
     assert (
         actual == expected
     ), f"Foul tip on 0 strikes should result in 1 strike: '{pitches}' -> '{expected}', got '{actual}'"
+
+
+@pytest.mark.parametrize(
+    "pitches,start_count,expected",
+    [
+        ("FFS", "00", (0, 3)),  # fouls before the strike both count
+        ("SSF", "00", (0, 2)),  # foul with two strikes does not
+        ("SFSF", "00", (0, 3)),
+        ("FBFBFT", "00", (2, 3)),
+        ("FS", "02", (0, 3)),  # inherited two strikes: only the S counts
+        ("BFX", "30", (4, 1)),
+    ],
+)
+def test_editor_raw_count_respects_foul_order(tmp_path, pitches, start_count, expected):
+    """Test the editor's uncapped count only adds fouls below two strikes."""
+    from retrosheet_buddy.editor import RetrosheetEditor
+    from retrosheet_buddy.models import EventFile
+
+    editor = RetrosheetEditor(EventFile(games=[]), tmp_path)
+    assert editor._calculate_raw_balls_strikes(pitches, start_count) == expected
+    assert editor._has_strikeout(pitches) == (
+        editor._calculate_raw_balls_strikes(pitches)[1] >= 3
+    )
+
+
+def test_editor_tallies_each_pitch_sequence_once(tmp_path):
+    """Test adding a pitch reuses one tally for the count and strikeout checks."""
+    from retrosheet_buddy.editor import RetrosheetEditor, _tally_pitches
+    from retrosheet_buddy.models import EventFile, Game, GameInfo, Play
+
+    play = Play(
+        inning=1,
+        team=0,
+        batter_id="bat0001",
+        count="00",
+        pitches="BFB",
+        play_description="",
+    )
+    editor = RetrosheetEditor(
+        EventFile(games=[Game(game_id="TEST", info=GameInfo(), plays=[play])]),
+        tmp_path,
+    )
+
+    _tally_pitches.cache_clear()
+    editor._add_pitch("C")
+    info = _tally_pitches.cache_info()
+    assert play.count == "22"
+    # "BFBC" from 0-0 is tallied once, then reused for the raw count and
+    # the strikeout check
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+@pytest.mark.parametrize(
+    "count,expected",
+    [("00", (0, 0)), ("32", (3, 2)), ("12", (1, 2)), ("??", (0, 0)), ("3x", (0, 0))],
+)
+def test_parse_starting_count(count, expected):
+    """Test starting counts parse to digits and fall back to 0-0 otherwise."""
+    from retrosheet_buddy.editor import _parse_count
+
+    assert _parse_count(count) == expected
+    assert _parse_count("") == (0, 0)
+    assert _parse_count("1") == (0, 0)
+
+
+def test_editor_counts_are_shared_strings(tmp_path):
+    """Test display counts come from one shared string per count."""
+    from retrosheet_buddy.editor import RetrosheetEditor
+    from retrosheet_buddy.models import EventFile, Game, GameInfo
+
+    editor = RetrosheetEditor(
+        EventFile(games=[Game(game_id="TEST", info=GameInfo())]), tmp_path
+    )
+    first = editor._calculate_count("BBFSF")
+    assert first == "22"
+    assert editor._calculate_count("BFBFF") is first
+    assert editor._calculate_count("BBBBB", "32") == "32"
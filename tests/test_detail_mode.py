@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from retrosheet_buddy.constants import PLAY_HOTKEYS
 from retrosheet_buddy.editor import RetrosheetEditor
 from retrosheet_buddy.models import EventFile, Game, GameInfo, Play
 
@@ -363,3 +364,209 @@ def test_detail_mode_automatic_progression(tmp_path):
     # Verify the play description was saved correctly
     current_play = editor.event_file.games[0].plays[0]
     assert current_play.play_description == "S6/G"
+
+
+def test_parameterized_modifiers_resolve_placeholders(tmp_path):
+    """Test that TH%, R$, and E$ modifiers are resolved with the chosen base or fielder."""
+    game = Game(
+        game_id="TEST",
+        info=GameInfo(),
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="test0001",
+                count="00",
+                pitches="X",
+                play_description="S6/G",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[game]), tmp_path)
+    editor.mode = "detail"
+    editor._start_modifier_detail_mode()
+
+    # Throws/Relays group renders options a..c: TH, TH%, R$
+    editor._handle_modifier_mode_input("t")
+    editor._create_controls_panel()
+
+    editor._handle_modifier_mode_input("b")  # TH% -> needs a base
+    assert editor.modifier_param_request == {"code": "TH%", "type": "base"}
+    editor._handle_modifier_mode_input("2")
+    assert editor.modifier_param_request is None
+
+    editor._handle_modifier_mode_input("c")  # R$ -> needs a fielder
+    assert editor.modifier_param_request == {"code": "R$", "type": "fielder"}
+    editor._handle_modifier_mode_input("4")
+
+    assert game.plays[0].play_description == "S6/G/TH2/R4"
+
+
+def test_controls_panel_cached_per_state(tmp_path):
+    """The controls panel is reused until the visible state changes."""
+    game = Game(
+        game_id="TEST",
+        info=GameInfo(),
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="test0001",
+                count="00",
+                pitches="X",
+                play_description="S6/G",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[game]), tmp_path)
+    editor.mode = "detail"
+    editor._start_modifier_detail_mode()
+    editor._handle_modifier_mode_input("t")
+    panel = editor._create_controls_panel()
+    assert editor._create_controls_panel() is panel
+
+    # Leaving the group changes the panel; returning reuses the cached one
+    editor._handle_modifier_mode_input("0")
+    assert editor._create_controls_panel() is not panel
+    editor._handle_modifier_mode_input("t")
+    assert editor._create_controls_panel() is panel
+
+
+def test_controls_panel_cache_evicts_least_recently_used(tmp_path):
+    """A full controls cache drops the panel used longest ago."""
+    editor = RetrosheetEditor(
+        EventFile(games=[Game(game_id="TEST", info=GameInfo())]), tmp_path
+    )
+    editor._CONTROLS_CACHE_SIZE = 2
+
+    pitch_panel = editor._create_controls_panel()
+    editor.mode = "play"
+    editor._create_controls_panel()
+
+    # Touch the pitch panel, then add a third state: the play panel goes
+    editor.mode = "pitch"
+    assert editor._create_controls_panel() is pitch_panel
+    editor.mode = "detail"
+    editor._create_controls_panel()
+    assert len(editor._controls_cache) == 2
+
+    editor.mode = "pitch"
+    assert editor._create_controls_panel() is pitch_panel
+
+
+def test_modifier_option_keys_work_before_render(tmp_path):
+    """Option letters resolve from the precomputed keymap without a repaint."""
+    game = Game(
+        game_id="TEST",
+        info=GameInfo(),
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="test0001",
+                count="00",
+                pitches="X",
+                play_description="S6/G",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[game]), tmp_path)
+    editor.mode = "detail"
+    editor._start_modifier_detail_mode()
+
+    # Throws/Relays group: [A] TH
+    editor._handle_modifier_mode_input("t")
+    editor._handle_modifier_mode_input("a")
+    assert editor.selected_modifiers == ["TH"]
+
+
+@pytest.mark.parametrize(
+    "desc,expected",
+    [("S6/G", 6), ("D7/L", 7), ("E6/G", 6), ("FC6/G", 6), ("HR/F", None), ("", None)],
+)
+def test_extract_primary_fielder(tmp_path, desc, expected):
+    """Test the primary fielder is read from the digits after the result token."""
+    editor = RetrosheetEditor(
+        EventFile(games=[Game(game_id="TEST", info=GameInfo())]), tmp_path
+    )
+    assert editor._extract_primary_fielder_from_play_description(desc) == expected
+
+
+def test_detail_mode_result_is_interned(tmp_path):
+    """Test the detail mode result shares identity with the constant play code."""
+    editor = RetrosheetEditor(
+        EventFile(games=[Game(game_id="TEST", info=GameInfo())]), tmp_path
+    )
+    editor._enter_detail_mode("".join(["PO", "CS"]))
+    assert editor.detail_mode_result is PLAY_HOTKEYS["c"]
+
+
+@pytest.mark.parametrize(
+    "result, handler",
+    [
+        ("OUT", "_handle_out_detail_input"),
+        ("GDP", "_handle_out_detail_input"),
+        ("POCS", "_handle_pickoff_detail_input"),
+        ("WP", "_handle_simple_advance_detail_input"),
+        ("SB", "_handle_stolen_base_detail_input"),
+        ("OA", "_handle_oa_detail_input"),
+        ("S", "_handle_hit_detail_input"),
+        ("SF", "_handle_hit_detail_input"),
+    ],
+)
+def test_detail_input_dispatch(tmp_path, monkeypatch, result, handler):
+    """Test detail mode keys are routed to the builder for the play result."""
+    calls = []
+    monkeypatch.setattr(RetrosheetEditor, handler, lambda self, key: calls.append(key))
+    editor = RetrosheetEditor(
+        EventFile(games=[Game(game_id="TEST", info=GameInfo())]), tmp_path
+    )
+    editor.detail_mode_result = result
+    editor._handle_detail_mode_input("2")
+    assert calls == ["2"]
+
+
+@pytest.mark.parametrize(
+    "fielders, expected",
+    [([], ""), ([2], "2"), ([6, 4, 3], "643"), ([1, 3, 6, 1], "1361")],
+)
+def test_fielder_sequence(fielders, expected):
+    """Test fielder lists are written as their position digits."""
+    from retrosheet_buddy.editor import _fielder_sequence
+
+    assert _fielder_sequence(fielders) == expected
+
+
+def test_modifier_groups_with_builders_start_them(tmp_path):
+    """Test choosing the Hit Location or Advance Runner group starts its builder."""
+    game = Game(
+        game_id="TEST",
+        info=GameInfo(),
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="test0001",
+                count="00",
+                pitches="X",
+                play_description="S6/G",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[game]), tmp_path)
+    editor.mode = "detail"
+    editor._start_modifier_detail_mode()
+
+    editor._handle_modifier_mode_input("h")
+    assert editor.selected_modifier_group == "h"
+    assert editor.hit_location_active
+    editor._handle_modifier_mode_input("0")
+
+    editor._handle_modifier_mode_input("r")
+    assert editor.selected_modifier_group == "r"
+    assert editor.advance_runner_active
+    editor._handle_modifier_mode_input("1")
+    editor._handle_modifier_mode_input("2")
+    editor._handle_modifier_mode_input("\r")
+    assert game.plays[0].play_description == "S6/G.1-2"
+    assert editor.selected_modifier_group is None
@@ -6,7 +6,7 @@ from unittest.mock import patch
 import pytest
 
 from retrosheet_buddy.editor import RetrosheetEditor
-from retrosheet_buddy.models import EventFile, Game, GameInfo, Play
+from retrosheet_buddy.models import EventFile, Game, GameInfo, Play, Player
 
 
 @pytest.fixture
@@ -169,3 +169,79 @@ def test_jump_to_play_no_plays(tmp_path):
 
     # Should remain at play 0 (even though there are no plays)
     assert editor.current_play_index == 0
+
+
+def test_player_name_lookup_uses_roster(tmp_path):
+    """Player names resolve from the roster, falling back to the player ID."""
+    game = Game(
+        game_id="TEST001",
+        info=GameInfo(date="2024-01-01", home_team="HOME", away_team="AWAY"),
+        players=[
+            Player(
+                player_id="abcd001",
+                name="First Name",
+                team=0,
+                batting_order=1,
+                fielding_position=6,
+            )
+        ],
+        plays=[],
+    )
+    editor = RetrosheetEditor(EventFile(games=[game]), tmp_path)
+
+    assert editor._get_player_name(game, "abcd001") == "First Name"
+    assert editor._get_player_name(game, "zzzz999") == "zzzz999"
+
+    # Players added later (e.g. substitutions) are picked up
+    game.players.append(
+        Player(
+            player_id="zzzz999",
+            name="Sub Name",
+            team=0,
+            batting_order=1,
+            fielding_position=6,
+        )
+    )
+    assert editor._get_player_name(game, "zzzz999") == "Sub Name"
+
+
+def test_jump_to_play_pages_long_games(tmp_path):
+    """Test only a page of plays is tabulated, with N/P to move between pages."""
+    from rich.console import Console
+
+    plays = [
+        Play(
+            inning=i // 6 + 1,
+            team=0,
+            batter_id=f"bat{i:04d}",
+            count="00",
+            pitches="",
+            play_description="",
+        )
+        for i in range(60)
+    ]
+    game = Game(game_id="TEST", info=GameInfo(), plays=plays)
+    editor = RetrosheetEditor(EventFile(games=[game]), tmp_path)
+    editor.console = Console(width=120, height=29)  # 20 rows per page
+    editor.current_play_index = 30
+
+    tables = []
+
+    def record(renderable="", *args, **kwargs):
+        if hasattr(renderable, "rows"):
+            tables.append(renderable)
+
+    with patch("builtins.input", side_effect=["n", "p", "p", "12"]):
+        with patch.object(editor.console, "clear"):
+            with patch.object(editor.console, "print", side_effect=record):
+                editor._jump_to_play()
+
+    # Each screen holds one page; the first is centred on the current play
+    assert [len(table.rows) for table in tables] == [20, 20, 20, 20]
+    assert [table.caption for table in tables] == [
+        "Plays 21-40 of 60",
+        "Plays 41-60 of 60",
+        "Plays 21-40 of 60",
+        "Plays 1-20 of 60",
+    ]
+    assert editor.current_play_index == 11
@@ -1,6 +1,8 @@
 """Tests for keystroke functionality."""
 
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -281,6 +283,38 @@ def test_clear_in_pitch_and_play_modes(tmp_path):
     assert test_game.plays[0].play_description == ""
 
 
+def test_clear_play_result_resets_detail_state_only_in_detail_mode(
+    tmp_path, monkeypatch
+):
+    """Test clearing a result outside detail mode leaves detail state alone."""
+    test_game = Game(
+        game_id="TESTCLR",
+        info=GameInfo(),
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="TEST1",
+                count="00",
+                pitches="X",
+                play_description="S8/G",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[test_game]), tmp_path)
+    resets = []
+    monkeypatch.setattr(editor, "_reset_detail_mode", lambda: resets.append(1))
+
+    editor.mode = "play"
+    editor._clear_play_result()
+    assert test_game.plays[0].play_description == ""
+    assert resets == []
+
+    editor.mode = "detail"
+    editor._clear_play_result()
+    assert resets == [1]
+
+
 def test_undo_functionality(tmp_path):
     """Test undo functionality."""
     # Create test data
@@ -323,3 +357,311 @@ def test_undo_functionality(tmp_path):
 
     editor._undo_last_action()
     assert test_game.plays[0].play_description == "", "Should undo to empty result"
+
+
+def test_run_loop_dispatches_keys(tmp_path):
+    """The run loop routes navigation, pitch and play keys to their handlers."""
+    test_game = Game(
+        game_id="TEST001",
+        info=GameInfo(date="2024-01-01", home_team="HOME", away_team="AWAY"),
+        players=[],
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="TEST1",
+                count="00",
+                pitches="",
+                play_description="",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[test_game]), tmp_path)
+
+    keys = iter(["b", "c", "-", "b", "tab", "l", "q"])
+    with patch("retrosheet_buddy.editor.get_key", side_effect=lambda: next(keys)):
+        with patch.object(editor, "_display_interface"):
+            with patch.object(editor.console, "clear"):
+                editor.run()
+
+    assert test_game.plays[0].pitches == "B"
+    assert test_game.plays[0].play_description == "W"
+    assert editor.mode == "play"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX terminals only")
+@pytest.mark.parametrize(
+    "typed, expected",
+    [
+        ("\x1b[A", "up"),
+        ("\x1b[D", "left"),
+        ("\x1bOC", "right"),
+        ("\x1b", "\x1b"),
+        ("\t", "tab"),
+        ("B", "b"),
+        ("é", "é"),
+    ],
+)
+def test_get_key_reads_from_terminal(monkeypatch, typed, expected):
+    """get_key decodes arrow escape sequences, TAB and letters from a tty."""
+    import os
+    import pty
+
+    from retrosheet_buddy import editor as editor_module
+
+    master, slave = pty.openpty()
+    real_setraw = editor_module.tty.setraw
+
+    def setraw_then_type(fd):
+        # Entering raw mode flushes pending input, so type only afterwards
+        real_setraw(fd)
+        os.write(master, typed.encode())
+
+    monkeypatch.setattr(editor_module.tty, "setraw", setraw_then_type)
+    try:
+        with os.fdopen(slave, "r", closefd=False) as fake_stdin:
+            monkeypatch.setattr(sys, "stdin", fake_stdin)
+            assert editor_module.get_key() == expected
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX terminals only")
+def test_raw_terminal_held_for_session(monkeypatch):
+    """Raw mode is entered once per session and suspended for line input."""
+    import os
+    import pty
+    import termios
+
+    from retrosheet_buddy import editor as editor_module
+
+    master, slave = pty.openpty()
+    try:
+        with os.fdopen(slave, "r", closefd=False) as fake_stdin:
+            monkeypatch.setattr(sys, "stdin", fake_stdin)
+            original = termios.tcgetattr(slave)
+
+            with editor_module._RawTerminal() as session:
+                attrs = termios.tcgetattr(slave)
+                assert not attrs[3] & termios.ICANON
+                assert attrs[1] & termios.OPOST
+
+                # Keys are read without toggling the terminal mode per key
+                monkeypatch.setattr(editor_module.tty, "setraw", None)
+                os.write(master, b"\x1b[Cq")
+                assert editor_module.get_key() == "right"
+                assert editor_module.get_key() == "q"
+                monkeypatch.undo()
+                monkeypatch.setattr(sys, "stdin", fake_stdin)
+
+                with session.suspended():
+                    assert termios.tcgetattr(slave)[3] & termios.ICANON
+                assert not termios.tcgetattr(slave)[3] & termios.ICANON
+
+            assert editor_module._RawTerminal.active is None
+            assert termios.tcgetattr(slave) == original
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX terminals only")
+def test_get_key_splits_buffered_input(monkeypatch):
+    """Several keys arriving in one read are returned one at a time."""
+    import os
+    import pty
+
+    from retrosheet_buddy import editor as editor_module
+
+    master, slave = pty.openpty()
+    try:
+        with os.fdopen(slave, "r", closefd=False) as fake_stdin:
+            monkeypatch.setattr(sys, "stdin", fake_stdin)
+            with editor_module._RawTerminal() as session:
+                # Unknown sequences (Home) are swallowed whole, not read as letters
+                os.write(master, b"b\x1b[H\x1b[1;5Cc\x1b[B")
+                keys = [editor_module.get_key()]
+                # Bytes past the first key wait in the session's own buffer
+                assert session.pending
+                assert b"\x1b[H\x1b[1;5Cc\x1b[B".startswith(session.pending)
+                keys += [editor_module.get_key() for _ in range(4)]
+                assert not session.pending
+    finally:
+        os.close(master)
+        os.close(slave)
+
+    assert keys == ["b", "\x1b", "\x1b", "c", "down"]
+
+
+@pytest.mark.parametrize(
+    "buf, expected",
+    [
+        (b"\x1b[Bq", (3, "down")),
+        (b"\x1bOA", (3, "up")),
+        (b"\x1b", None),
+        (b"\x1b[", None),
+        (b"\x1b[1;5", None),
+        (b"\x1b[1;5Cq", (6, "\x1b")),
+        (b"\x1b[Z", (3, "\x1b")),
+        (b"\x1bOP", (3, "\x1b")),
+        (b"\x1bxq", (2, "\x1b")),
+    ],
+)
+def test_match_escape_sequence(buf, expected):
+    """Escape sequences are matched a byte at a time against the prefix trie."""
+    from retrosheet_buddy.editor import _match_escape_sequence
+
+    assert _match_escape_sequence(bytearray(buf)) == expected
+
+
+def test_run_loop_skips_repaint_for_ignored_keys(tmp_path):
+    """Keys that change nothing on screen do not trigger a repaint."""
+    test_game = Game(
+        game_id="TEST001",
+        info=GameInfo(date="2024-01-01", home_team="HOME", away_team="AWAY"),
+        players=[],
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="TEST1",
+                count="00",
+                pitches="",
+                play_description="",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[test_game]), tmp_path)
+
+    keys = iter(["~", "~", "b", "~", "q"])
+    with patch("retrosheet_buddy.editor.get_key", side_effect=lambda: next(keys)):
+        with patch.object(editor, "_display_interface") as display:
+            with patch.object(editor.console, "clear"):
+                editor.run()
+
+    # Initial paint plus one repaint after the ball was recorded
+    assert display.call_count == 2
+
+
+def test_run_loop_draws_on_live_screen(tmp_path):
+    """Frames are drawn on a full-screen live display instead of clear+print."""
+    import io
+
+    from rich.console import Console
+
+    test_game = Game(
+        game_id="TEST001",
+        info=GameInfo(date="2024-01-01", home_team="HOME", away_team="AWAY"),
+        players=[],
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="TEST1",
+                count="00",
+                pitches="",
+                play_description="",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[test_game]), tmp_path)
+    output = io.StringIO()
+    editor.console = Console(file=output, force_terminal=True, width=100, height=40)
+
+    keys = iter(["b", "q"])
+    with patch("retrosheet_buddy.editor.get_key", side_effect=lambda: next(keys)):
+        with patch.object(editor.console, "clear") as clear:
+            editor.run()
+
+    # Only the initial clear before the live display starts
+    assert clear.call_count == 1
+    assert "\x1b[?1049h" in output.getvalue()  # entered the alternate screen
+    assert "Current Mode: PITCH" in output.getvalue()
+    assert editor._live is None
+    assert test_game.plays[0].pitches == "B"
+
+
+def test_run_loop_messages_use_status_line(tmp_path):
+    """Messages during the live display go to the header, not the console."""
+    import io
+
+    from rich.console import Console
+
+    test_game = Game(
+        game_id="TEST001",
+        info=GameInfo(date="2024-01-01", home_team="HOME", away_team="AWAY"),
+        players=[],
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="TEST1",
+                count="00",
+                pitches="",
+                play_description="",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[test_game]), tmp_path)
+    editor.console = Console(
+        file=io.StringIO(), force_terminal=True, width=100, height=40
+    )
+    printed_live = []
+    print_original = editor.console.print
+
+    def record(*args, **kwargs):
+        # The live display itself prints control codes; only text matters here
+        if editor._live is not None and args and isinstance(args[0], str):
+            printed_live.append(args[0])
+        return print_original(*args, **kwargs)
+
+    keys = iter(["x", "q"])
+    with patch("retrosheet_buddy.editor.get_key", side_effect=lambda: next(keys)):
+        with patch.object(editor.console, "print", side_effect=record):
+            editor.run()
+
+    assert printed_live == []
+    assert editor._status == ("Nothing to undo", "yellow")
+    assert editor._header_cache[2].subtitle.plain == "Nothing to undo"
+
+
+def test_display_reuses_unchanged_regions(tmp_path):
+    """Header and play panels are rebuilt only when their inputs change."""
+    import io
+
+    from rich.console import Console
+
+    test_game = Game(
+        game_id="TEST001",
+        info=GameInfo(date="2024-01-01", home_team="HOME", away_team="AWAY"),
+        players=[],
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="TEST1",
+                count="00",
+                pitches="",
+                play_description="",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[test_game]), tmp_path)
+    editor.console = Console(file=io.StringIO(), width=100)
+
+    editor._display_interface()
+    header = editor._header_cache[2]
+    main = editor._main_cache[2]
+
+    # Switching modes only changes the controls region
+    editor._toggle_mode()
+    editor._display_interface()
+    assert editor._header_cache[2] is header
+    assert editor._main_cache[2] is main
+
+    # Recording a pitch changes the play panel but not the header
+    editor._add_pitch("B")
+    editor._display_interface()
+    assert editor._header_cache[2] is header
+    assert editor._main_cache[2] is not main
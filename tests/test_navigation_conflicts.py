@@ -295,3 +295,25 @@ def test_auto_mode_switch_on_navigation(tmp_path):
     editor._previous_play()
     assert editor.current_play_index == 0
     assert editor.mode == "pitch"
+
+
+def test_validate_shortcuts_reports_each_conflict_once(monkeypatch):
+    """A key shared by navigation and several modes is reported once."""
+    from retrosheet_buddy import editor as editor_module
+
+    monkeypatch.setattr(editor_module, "PITCH_KEYS", editor_module.PITCH_KEYS | {"q"})
+    monkeypatch.setattr(editor_module, "PLAY_KEYS", editor_module.PLAY_KEYS | {"q"})
+    monkeypatch.setattr(
+        editor_module, "PITCH_SHORTCUTS", {**editor_module.PITCH_SHORTCUTS, "q": "X"}
+    )
+    monkeypatch.setattr(
+        editor_module, "PLAY_SHORTCUTS", {**editor_module.PLAY_SHORTCUTS, "q": "Y"}
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        validate_shortcuts()
+
+    message = str(excinfo.value)
+    assert message.count("Key 'q' conflicts") == 1
+    assert "- navigation: Quit" in message
+    assert "- pitch mode: X" in message
@@ -296,3 +296,27 @@ def test_next_incomplete_play_finds_current_if_incomplete(
         play.pitches = original_pitches[i]
         play.play_description = original_descriptions[i]
         play.count = original_counts[i]
+
+
+def test_next_incomplete_play_tracks_edits(test_event_file_mixed, tmp_path):
+    """Test the incomplete-play flags follow edits and undo."""
+    editor = RetrosheetEditor(test_event_file_mixed, tmp_path)
+    game = editor.event_file.games[0]
+    assert list(editor._incomplete_mask(game)) == [0, 1, 0, 1, 1, 0]
+
+    # Completing play 3 (index 3) through the editor clears its flag
+    editor.current_play_index = 3
+    editor.mode = "play"
+    editor._set_play_result("W")
+    assert editor._incomplete_mask(game)[3] == 0
+
+    # Undo restores the missing result and the flag with it
+    editor._undo_last_action()
+    assert editor._incomplete_mask(game)[3] == 1
+
+    # A play completed outside the editor is skipped, not jumped to
+    game.plays[4].count = "21"
+    editor.current_play_index = 3
+    editor._next_incomplete_play()
+    assert editor.current_play_index == 1
+    assert editor._incomplete_mask(game)[4] == 0
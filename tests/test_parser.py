@@ -88,3 +88,28 @@ play,1,0,strawd001,00,,HR"""
 
     finally:
         temp_path.unlink()
+
+
+def test_parse_shares_repeated_play_strings():
+    """Test repeated counts, pitches and results are stored as one string each."""
+    event_data = """id,ATL198304080
+version,1
+play,1,0,schmi001,21,BFBX,S8
+play,2,0,schmi001,21,BFBX,S8
+play,3,0,schmi001,??,BFBX,S8"""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".EVN", delete=False) as f:
+        f.write(event_data)
+        temp_path = Path(f.name)
+
+    try:
+        first, second, third = parse_event_file(temp_path).games[0].plays
+        assert second.count is first.count
+        assert second.pitches is first.pitches
+        assert second.play_description is first.play_description
+        assert second.batter_id is first.batter_id
+        # Counts worked out from the pitches are shared as well
+        assert third.count == "21"
+        assert third.count is first.count
+    finally:
+        temp_path.unlink()
@@ -1,7 +1,7 @@
 from pathlib import Path
 
 from retrosheet_buddy.parser import parse_event_file
-from retrosheet_buddy.writer import write_event_file
+from retrosheet_buddy.writer import format_games, write_event_file
 
 
 def test_retains_sub_and_data_on_save(tmp_path: Path) -> None:
@@ -27,3 +27,11 @@ def test_retains_sub_and_data_on_save(tmp_path: Path) -> None:
     assert "data,er,krukm001,0" in text
     assert "data,er,curtj001,3" in text
     assert "data,er,showe001,0" in text
+
+
+def test_format_games_matches_written_file(tmp_path: Path) -> None:
+    event_file = parse_event_file(Path("sample_data/SDN198205020.EVN"))
+    out_path = tmp_path / "SDN198205020.EVN"
+    write_event_file(event_file, out_path)
+
+    assert format_games(event_file.games) == out_path.read_text(encoding="utf-8")
@@ -1,5 +1,6 @@
 """Tests for Retrosheet compliance in scoring system."""
 
+import sys
 from pathlib import Path
 
 import pytest
@@ -157,6 +158,16 @@ class TestRetrosheetCompliance:
                 actual == expected
             ), f"Position {position} should be {expected}, got {actual}"
 
+    def test_play_descriptions_are_shared_strings(self):
+        """Test repeated descriptions return the same interned string object."""
+        event_file = EventFile(games=[Game(game_id="TEST", info=GameInfo())])
+        editor = RetrosheetEditor(event_file, Path("."))
+
+        first = editor._generate_retrosheet_play_description("GDP", 4)
+        assert first == "G4/GDP/G4"
+        assert editor._generate_retrosheet_play_description("GDP", 4) is first
+        assert editor._generate_retrosheet_play_description("S") is sys.intern("S8/G6")
+
 
 def test_retrosheet_file_format_compliance():
     """Test that generated files follow Retrosheet format."""
@@ -0,0 +1,279 @@
+"""Test that edits are saved in coalesced, atomic writes."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+import retrosheet_buddy.editor as editor_module
+from retrosheet_buddy.editor import RetrosheetEditor
+from retrosheet_buddy.models import EventFile, Game, GameInfo, Play
+from retrosheet_buddy.parser import parse_event_file
+
+
+@pytest.fixture
+def editor(tmp_path):
+    """Create an editor whose saves wait for an explicit flush."""
+    game = Game(
+        game_id="TEST202304010",
+        info=GameInfo(date="2023-04-01", home_team="HOME", away_team="AWAY"),
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="TEST0001",
+                count="00",
+                pitches="",
+                play_description="",
+            )
+        ],
+    )
+    ed = RetrosheetEditor(EventFile(games=[game]), tmp_path)
+    ed._SAVE_DELAY = 60
+    return ed
+
+
+def _quiet_period_over(editor):
+    """Let the save deadline pass and run the input loop's flush check."""
+    editor._flush_deadline = time.monotonic()
+    editor._flush_if_due()
+
+
+def test_burst_of_edits_is_written_once(editor, tmp_path, monkeypatch):
+    """Several edits in a row produce a single write on flush."""
+    writes = []
+    real_write = editor._write_atomically
+    monkeypatch.setattr(
+        editor,
+        "_write_atomically",
+        lambda path, text: (writes.append(path), real_write(path, text)),
+    )
+
+    for pitch in "BCS":
+        editor._add_pitch(pitch)
+    assert writes == []
+    # Nothing is formatted until the quiet period ends
+    editor._flush_if_due()
+    assert editor._dirty_games == {0}
+    assert not editor._pending_writes and editor._writer is None
+    assert not (tmp_path / "TEST202304010.EVN").exists()
+
+    editor.flush_sync()
+    assert len(writes) == 1
+    assert not editor._dirty_games
+
+    saved = parse_event_file(tmp_path / "TEST202304010.EVN")
+    assert saved.games[0].plays[0].pitches == "BCS"
+    # The temporary file was swapped into place, nothing is left behind
+    assert [p.name for p in tmp_path.iterdir()] == ["TEST202304010.EVN"]
+
+
+def test_flush_with_nothing_pending_writes_nothing(editor, tmp_path):
+    """Flushing without edits leaves the output directory alone."""
+    editor.flush_sync()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_write_removes_temporary_file(editor, tmp_path, monkeypatch):
+    """A write that fails midway keeps the previous file intact."""
+    target = tmp_path / "TEST202304010.EVN"
+    target.write_text("previous\n")
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+
+    editor._add_pitch("B")
+    with monkeypatch.context() as patch:
+        patch.setattr(editor_module.os, "replace", broken_replace)
+        with pytest.raises(OSError):
+            editor.flush_sync()
+
+    assert target.read_text() == "previous\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["TEST202304010.EVN"]
+    # The text stays queued, so the next save retries it
+    assert list(editor._pending_writes) == [target]
+    editor.flush_sync()
+    assert parse_event_file(target).games[0].plays[0].pitches == "B"
+
+
+def test_unchanged_game_is_not_rewritten(editor, tmp_path, monkeypatch):
+    """Saving again without a visible change skips the write."""
+    editor._add_pitch("B")
+    editor.flush_sync()
+
+    writes = []
+    monkeypatch.setattr(
+        editor, "_write_atomically", lambda path, text: writes.append(path)
+    )
+    editor._save_current_state()
+    editor.flush_sync()
+    assert writes == []
+
+    editor._add_pitch("C")
+    editor.flush_sync()
+    assert writes == [tmp_path / "TEST202304010.EVN"]
+
+
+def test_writer_thread_saves_after_quiet_period(editor, tmp_path):
+    """Pending edits are formatted once edits go quiet and written off the loop."""
+    editor._add_pitch("B")
+    editor._add_pitch("S")
+    _quiet_period_over(editor)
+    assert not editor._dirty_games
+    writer = editor._writer
+    assert writer is not None and writer.name == "evn-writer"
+
+    writer.join(timeout=5)
+    assert not writer.is_alive()
+    assert editor._writer is None
+    saved = parse_event_file(tmp_path / "TEST202304010.EVN")
+    assert saved.games[0].plays[0].pitches == "BS"
+
+
+def test_run_loop_wakes_for_due_save(editor):
+    """The input loop waits for keys only until the next save is due."""
+    timeouts = []
+
+    def record_wait(timeout):
+        timeouts.append(timeout)
+        return True
+
+    keys = iter(["b", "q"])
+    with patch("retrosheet_buddy.editor.wait_for_key", side_effect=record_wait):
+        with patch("retrosheet_buddy.editor.get_key", side_effect=lambda: next(keys)):
+            with patch.object(editor, "_display_interface"):
+                editor._event_loop()
+
+    # Idle, then at most the save delay after the pitch was added
+    assert timeouts[0] is None
+    assert 0 < timeouts[1] <= editor._SAVE_DELAY
+
+
+def test_session_file_collects_edited_games(tmp_path):
+    """In session-file mode every edited game is written to one file."""
+    games = [
+        Game(
+            game_id=game_id,
+            info=GameInfo(date="2023-04-01", home_team="HOME", away_team="AWAY"),
+            plays=[
+                Play(
+                    inning=1,
+                    team=0,
+                    batter_id="TEST0001",
+                    count="00",
+                    pitches="",
+                    play_description="",
+                )
+            ],
+        )
+        for game_id in ("GAME1", "GAME2", "GAME3")
+    ]
+    ed = RetrosheetEditor(EventFile(games=games), tmp_path, "session.EVN")
+    ed._SAVE_DELAY = 60
+
+    ed.current_game_index = 2
+    ed._add_pitch("B")
+    ed.flush_sync()
+    ed.current_game_index = 0
+    ed._add_pitch("S")
+    ed.flush_sync()
+
+    assert [p.name for p in tmp_path.iterdir()] == ["session.EVN"]
+    saved = parse_event_file(tmp_path / "session.EVN")
+    assert [g.game_id for g in saved.games] == ["GAME1", "GAME3"]
+    assert [g.plays[0].pitches for g in saved.games] == ["S", "B"]
+
+    # Later saves re-format only the games edited since the last one
+    formatted = []
+    real_format = editor_module.format_games
+
+    def record_format(games):
+        formatted.extend(game.game_id for game in games)
+        return real_format(games)
+
+    ed._add_pitch("B")
+    with patch.object(editor_module, "format_games", side_effect=record_format):
+        ed.flush_sync()
+    assert formatted == ["GAME1"]
+    saved = parse_event_file(tmp_path / "session.EVN")
+    assert [g.plays[0].pitches for g in saved.games] == ["SB", "B"]
+
+
+def test_bulk_edit_schedules_one_save(editor, monkeypatch):
+    """Saves inside a bulk edit are held back and scheduled once on exit."""
+    scheduled = []
+    monkeypatch.setattr(editor, "_schedule_flush", lambda: scheduled.append(1))
+
+    with editor._bulk_edit():
+        with editor._bulk_edit():
+            editor._add_pitch("B")
+        editor._add_pitch("B")
+        assert scheduled == []
+    assert scheduled == [1]
+    assert editor._dirty_games == {0}
+
+    # Without pending edits, leaving a bulk edit schedules nothing
+    editor._dirty_games.clear()
+    with editor._bulk_edit():
+        pass
+    assert scheduled == [1]
+
+
+def test_edit_marked_during_write_is_kept(editor, tmp_path, monkeypatch):
+    """A game marked dirty while a write runs is written on the next flush."""
+    real_write = editor._write_atomically
+    edits = ["C"]
+
+    def write_then_edit(path, text):
+        real_write(path, text)
+        if edits:
+            editor._current_play().pitches += edits.pop()
+            editor._save_current_state()
+
+    editor._add_pitch("B")
+    monkeypatch.setattr(editor, "_write_atomically", write_then_edit)
+    editor.flush_sync()
+    assert editor._dirty_games == {0}
+
+    editor.flush_sync()
+    saved = parse_event_file(tmp_path / "TEST202304010.EVN")
+    assert saved.games[0].plays[0].pitches == "BC"
+    assert not editor._pending_writes
+
+
+def test_writer_gets_text_formatted_at_save_time(editor, tmp_path):
+    """Changes made after a save is queued do not leak into that write."""
+    editor._add_pitch("B")
+    # Hold the writer back until a half-applied change has been made
+    with editor._flush_lock:
+        _quiet_period_over(editor)
+        editor._current_play().pitches = "BX"
+    editor._writer.join(timeout=5)
+
+    saved = parse_event_file(tmp_path / "TEST202304010.EVN")
+    assert saved.games[0].plays[0].pitches == "B"
+    assert editor._status == (
+        f"Saved to {tmp_path / 'TEST202304010.EVN'}",
+        "green",
+    )
+
+
+def test_save_status_shown_in_header(editor, tmp_path):
+    """The outcome of the last save is shown in the header, not printed."""
+    import io
+
+    from rich.console import Console
+
+    output = io.StringIO()
+    editor.console = Console(file=output, width=100)
+    editor._display_interface()
+    assert editor._header_cache[2].subtitle is None
+
+    editor._add_pitch("B")
+    editor.flush_sync()
+    assert "Saved to" not in output.getvalue()
+
+    editor._display_interface()
+    subtitle = editor._header_cache[2].subtitle
+    assert subtitle.plain == f"Saved to {tmp_path / 'TEST202304010.EVN'}"
+    assert subtitle.style == "green"
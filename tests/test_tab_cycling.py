@@ -133,3 +133,102 @@ def _handle_tab_key(self):
 
 # Add the helper method to RetrosheetEditor for testing
 RetrosheetEditor._handle_tab_key = _handle_tab_key
+
+
+def test_mode_section_renders_into_text_parts(tmp_path):
+    """Controls helpers write to a _TextParts buffer the same way as to a Text."""
+    from rich.text import Text
+
+    from retrosheet_buddy.editor import _TextParts
+
+    editor = RetrosheetEditor(EventFile(games=[]), tmp_path)
+    expected = Text()
+    editor._add_mode_section(expected)
+    editor._add_navigation_section(expected)
+
+    parts = _TextParts()
+    editor._add_mode_section(parts)
+    editor._add_navigation_section(parts)
+    assembled = parts.assemble()
+
+    assert assembled.plain == expected.plain
+    assert len(assembled.spans) <= len(expected.spans)
+    assert parts.line_count == len(expected.plain.split("\n"))
+
+
+def test_toggle_mode_runs_transition_hooks(test_event_file, tmp_path):
+    """Test _toggle_mode offers modifiers for a recorded play and resets on exit."""
+    editor = RetrosheetEditor(test_event_file, tmp_path)
+
+    # Empty play: play -> detail leaves the modifier flow idle
+    editor.mode = "play"
+    editor._toggle_mode()
+    assert editor.mode == "detail"
+    assert not editor.modifier_selection_active
+
+    editor._toggle_mode()
+    assert editor.mode == "pitch"
+
+    # Recorded play: play -> detail starts the modifier flow
+    test_event_file.games[0].plays[0].play_description = "S6"
+    editor._toggle_mode()
+    editor._toggle_mode()
+    assert editor.mode == "detail"
+    assert editor.modifier_selection_active
+
+    # detail -> pitch resets detail mode state
+    editor._toggle_mode()
+    assert editor.mode == "pitch"
+    assert editor.detail_mode_result is None
+    assert not editor.modifier_selection_active
+
+
+def test_hotkey_rows_cached_per_width(test_event_file, tmp_path):
+    """Packed hotkey rows are reused for the same table and console width."""
+    from rich.console import Console
+    from rich.text import Text
+
+    from retrosheet_buddy.constants import PITCH_DESCRIPTIONS, PITCH_HOTKEYS_ORDERED
+
+    editor = RetrosheetEditor(test_event_file, tmp_path)
+    editor.console = Console(width=60)
+
+    first = Text()
+    editor._add_hotkey_controls(first, PITCH_HOTKEYS_ORDERED, PITCH_DESCRIPTIONS)
+    second = Text()
+    editor._add_hotkey_controls(second, PITCH_HOTKEYS_ORDERED, PITCH_DESCRIPTIONS)
+    assert str(first) == str(second)
+    assert len(editor._hotkey_layout_cache) == 1
+    assert all(len(line) <= 54 for line in str(first).splitlines())
+
+    # A wider console packs more entries per row
+    editor.console = Console(width=120)
+    wide = Text()
+    editor._add_hotkey_controls(wide, PITCH_HOTKEYS_ORDERED, PITCH_DESCRIPTIONS)
+    assert len(editor._hotkey_layout_cache) == 2
+    assert str(wide).count("\n") < str(first).count("\n")
+
+
+def test_modifier_rows_cached_per_group_and_width(test_event_file, tmp_path):
+    """Packed modifier group and option rows are reused for the same width."""
+    from rich.console import Console
+    from rich.text import Text
+
+    from retrosheet_buddy.constants import MODIFIER_GROUP_OPTIONS
+
+    editor = RetrosheetEditor(test_event_file, tmp_path)
+    editor.console = Console(width=60)
+
+    first = Text()
+    editor._add_modifier_group_controls_wrapped(first)
+    second = Text()
+    editor._add_modifier_group_controls_wrapped(second)
+    assert str(first) == str(second)
+    assert len(editor._hotkey_layout_cache) == 1
+
+    throws = Text()
+    editor._add_modifier_options_wrapped(throws, MODIFIER_GROUP_OPTIONS["t"])
+    editor._add_modifier_options_wrapped(Text(), MODIFIER_GROUP_OPTIONS["t"])
+    assert len(editor._hotkey_layout_cache) == 2
+    assert str(throws).startswith("  [A] ")
+    assert all(len(line) <= 54 for line in str(throws).splitlines())
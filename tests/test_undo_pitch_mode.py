@@ -182,3 +182,30 @@ def test_pitch_mode_integration_with_undo(tmp_path):
         editor._undo_last_action()
         assert test_game.plays[0].pitches == expected_sequences[i]
         assert test_game.plays[0].count == expected_counts[i]
+
+
+def test_undo_history_keeps_last_ten_states(tmp_path):
+    """Only the most recent ten undo states are retained."""
+    test_game = Game(
+        game_id="TEST001",
+        info=GameInfo(date="2024-01-01", home_team="HOME", away_team="AWAY"),
+        players=[],
+        plays=[
+            Play(
+                inning=1,
+                team=0,
+                batter_id="TEST1",
+                count="00",
+                pitches="",
+                play_description="",
+            )
+        ],
+    )
+    editor = RetrosheetEditor(EventFile(games=[test_game]), tmp_path)
+
+    for _ in range(12):
+        editor._add_pitch("F")
+
+    assert len(editor.undo_history) == 10
+    # The oldest surviving state is the one saved before the third pitch
+    assert editor.undo_history[0][2] == "FF"